@@ -0,0 +1,174 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from demisto_sdk.commands.common.clients.errors import PollTimeout
+from demisto_sdk.commands.common.clients.xsoar.state_poller import XsoarStatePoller
+from demisto_sdk.commands.common.constants import (
+    IncidentState,
+    InvestigationPlaybookState,
+)
+
+
+class ServerMock:
+    def __init__(self, closed_after_searches: dict):
+        self.closed_after_searches = closed_after_searches
+        self.searched_incident_ids = []
+        self.playbook_state_requests = 0
+
+    def search_incidents(self, incident_ids, size=50):
+        self.searched_incident_ids.append(list(incident_ids))
+        incidents = []
+        for incident_id in incident_ids:
+            if incident_id not in self.closed_after_searches:
+                continue
+            searches = sum(
+                incident_id in searched_incident_ids
+                for searched_incident_ids in self.searched_incident_ids
+            )
+            incidents.append(
+                {
+                    "id": incident_id,
+                    "name": f"incident-{incident_id}",
+                    "status": IncidentState.CLOSED
+                    if searches >= self.closed_after_searches[incident_id]
+                    else IncidentState.IN_PROGRESS,
+                }
+            )
+        return {"data": incidents}
+
+    def get_playbook_state(self, incident_id):
+        self.playbook_state_requests += 1
+        return {
+            "playbookId": "playbook",
+            "state": InvestigationPlaybookState.COMPLETED
+            if self.playbook_state_requests >= 2
+            else InvestigationPlaybookState.IN_PROGRESS,
+        }
+
+
+def test_state_poller_polls_all_incidents_together():
+    """
+    Given:
+     - incidents which are closed after being searched a different number of times
+
+    When:
+     - polling the states of all the incidents concurrently from several threads
+
+    Then:
+     - make sure every search queries the states of all the incidents which did not reach their state yet
+     - make sure the raw responses of the incidents are returned once they are closed
+     - make sure a missing incident fails only its own watch
+    """
+    server = ServerMock({"1": 1, "2": 3, "3": 2})
+    poller = XsoarStatePoller(server, min_interval=0.01, max_interval=0.05)
+    with ThreadPoolExecutor(3) as executor:
+        incidents = list(
+            executor.map(
+                lambda incident_id: poller.watch_incident(
+                    incident_id, timeout=10
+                ).result(),
+                ["1", "2", "3"],
+            )
+        )
+    assert [incident["id"] for incident in incidents] == ["1", "2", "3"]
+    assert all(incident["status"] == IncidentState.CLOSED for incident in incidents)
+    # every incident is searched until it is closed, and the searches are shared by the incidents
+    for incident_id, closed_after_searches in server.closed_after_searches.items():
+        assert (
+            sum(
+                incident_id in searched_incident_ids
+                for searched_incident_ids in server.searched_incident_ids
+            )
+            == closed_after_searches
+        )
+    assert len(server.searched_incident_ids) < sum(
+        server.closed_after_searches.values()
+    )
+
+    with pytest.raises(ValueError, match="Could not find incident ID 4"):
+        poller.watch_incident("4", timeout=10).result()
+
+
+def test_state_poller_timeout():
+    """
+    Given:
+     - an incident which is never closed, and a playbook which is completed after two requests
+
+    When:
+     - polling the states of the incident and of the playbook
+
+    Then:
+     - make sure the incident watch fails with a PollTimeout once its timeout passes
+     - make sure the playbook watch returns the raw response of the completed playbook
+    """
+    server = ServerMock({"1": float("inf")})
+    poller = XsoarStatePoller(server, min_interval=0.01, max_interval=0.05)
+    incident_future = poller.watch_incident("1", timeout=1)
+    playbook_future = poller.watch_playbook("1", timeout=10)
+
+    assert playbook_future.result()["state"] == InvestigationPlaybookState.COMPLETED
+    with pytest.raises(
+        PollTimeout, match="status of incident incident-1 is IN_PROGRESS"
+    ):
+        incident_future.result()
+    assert len(server.searched_incident_ids) > 1
+
+    with pytest.raises(ValueError, match="timeout argument must be larger than 0"):
+        poller.watch_incident("1", timeout=0)
+
+
+def test_state_poller_fails_watches_on_error(mocker):
+    """
+    Given:
+     - a poller whose polling tick fails unexpectedly
+
+    When:
+     - watching an incident and a playbook
+
+    Then:
+     - make sure all the pending watches fail with the error instead of waiting forever
+     - make sure the poller starts polling again on the next watch
+    """
+    server = ServerMock({"1": 1})
+    poller = XsoarStatePoller(server, min_interval=0.01, max_interval=0.05)
+    poll_incidents = mocker.patch.object(
+        poller, "_poll_incidents", side_effect=RuntimeError("unexpected error")
+    )
+    incident_future = poller.watch_incident("1", timeout=10)
+    playbook_future = poller.watch_playbook("1", timeout=10)
+
+    with pytest.raises(RuntimeError, match="unexpected error"):
+        poller.wait(incident_future, timeout=10)
+    with pytest.raises(RuntimeError, match="unexpected error"):
+        poller.wait(playbook_future, timeout=10)
+
+    poll_incidents.side_effect = None
+    poll_incidents.return_value = False
+    assert poller.wait(poller.watch_playbook("1", timeout=10), timeout=10)["state"] == (
+        InvestigationPlaybookState.COMPLETED
+    )
+
+
+def test_state_poller_wait_timeout(mocker):
+    """
+    Given:
+     - a watch which is never resolved by the poller
+
+    When:
+     - waiting for the result of the watch
+
+    Then:
+     - make sure the wait is bounded by the timeout of the watch, and the watch is dropped
+    """
+    mocker.patch(
+        "demisto_sdk.commands.common.clients.xsoar.state_poller.WATCH_RESULT_TIMEOUT_MARGIN",
+        0,
+    )
+    poller = XsoarStatePoller(ServerMock({}))
+    future = Future()
+
+    with pytest.raises(FutureTimeoutError):
+        poller.wait(future, timeout=0.1)
+    assert future.cancelled()
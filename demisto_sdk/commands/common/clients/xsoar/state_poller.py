@@ -0,0 +1,340 @@
+import contextlib
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from demisto_sdk.commands.common.clients.errors import PollTimeout
+from demisto_sdk.commands.common.constants import (
+    IncidentState,
+    InvestigationPlaybookState,
+)
+from demisto_sdk.commands.common.logger import logger
+
+if TYPE_CHECKING:
+    from demisto_sdk.commands.common.clients.xsoar.xsoar_api_client import (
+        XsoarClient,
+    )
+
+# how long to wait for the result of a watch after its timeout, as the watch is resolved by the next tick
+WATCH_RESULT_TIMEOUT_MARGIN = 60
+
+
+@dataclass
+class StateWatch:
+    incident_id: str
+    expected_states: tuple
+    timeout: int
+    deadline: float
+    future: Future = field(default_factory=Future)
+    state: Optional[str] = None
+    name: Optional[str] = None
+
+
+class XsoarStatePoller:
+    def __init__(
+        self,
+        client: "XsoarClient",
+        min_interval: float = 2,
+        max_interval: float = 30,
+        backoff_factor: float = 2,
+    ):
+        """
+        Polls the states of many incidents and playbooks of a server from a single thread.
+        Every tick queries the states of all the watched incidents in one incidents search, and the interval between
+        the ticks grows while none of the watched states change.
+
+        Args:
+            client: the client of the server
+            min_interval: the interval between ticks after a watched state changes, in seconds
+            max_interval: the maximal interval between ticks, in seconds
+            backoff_factor: the factor the interval grows by on every tick without state changes
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self._incident_watches: List[StateWatch] = []
+        self._playbook_watches: List[StateWatch] = []
+        self._lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch_incident(
+        self,
+        incident_id: str,
+        expected_states: Iterable[IncidentState] = (IncidentState.CLOSED,),
+        timeout: int = 120,
+    ) -> "Future[Dict[str, Any]]":
+        """
+        Watches an incident until it reaches one of the expected states.
+
+        Args:
+            incident_id: the incident ID to poll its state
+            expected_states: which states are considered to be valid for the incident to reach
+            timeout: how long to query until incidents reaches the expected state
+
+        Returns:
+            future of the raw response of the incident that reached into the relevant state.
+        """
+        return self._watch(
+            self._incident_watches, incident_id, tuple(expected_states), timeout
+        )
+
+    def watch_playbook(
+        self,
+        incident_id: str,
+        expected_states: Iterable[InvestigationPlaybookState] = (
+            InvestigationPlaybookState.COMPLETED,
+        ),
+        timeout: int = 120,
+    ) -> "Future[Dict[str, Any]]":
+        """
+        Watches a playbook until it reaches one of the expected states.
+
+        Args:
+            incident_id: incident ID that the playbook is running on
+            expected_states: which states are considered to be valid for the playbook to reach
+            timeout: how long to query until the playbook reaches the expected state
+
+        Returns:
+            future of the raw response of the state of the playbook
+        """
+        return self._watch(
+            self._playbook_watches, incident_id, tuple(expected_states), timeout
+        )
+
+    def wait(self, future: "Future[Dict[str, Any]]", timeout: int) -> Dict[str, Any]:
+        """
+        Waits for the result of a watch, so callers never wait forever if the poller stops resolving the watch.
+
+        Args:
+            future: the future of the watch
+            timeout: the timeout of the watch
+
+        Returns:
+            the result of the watch
+        """
+        try:
+            return future.result(timeout=timeout + WATCH_RESULT_TIMEOUT_MARGIN)
+        except FutureTimeoutError:
+            # stop polling the watch
+            future.cancel()
+            raise
+
+    def _watch(
+        self,
+        watches: List[StateWatch],
+        incident_id: str,
+        expected_states: tuple,
+        timeout: int,
+    ) -> Future:
+        if timeout <= 0:
+            raise ValueError("timeout argument must be larger than 0")
+
+        watch = StateWatch(
+            incident_id=str(incident_id),
+            expected_states=expected_states,
+            timeout=timeout,
+            deadline=time.monotonic() + timeout,
+        )
+        with self._lock:
+            watches.append(watch)
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run, name="xsoar-state-poller", daemon=True
+                )
+                self._thread.start()
+        # poll the new watch right away
+        self._wake_up.set()
+        return watch.future
+
+    def _run(self):
+        interval = self.min_interval
+        while True:
+            self._wake_up.clear()
+            with self._lock:
+                for watches in (self._incident_watches, self._playbook_watches):
+                    # drop the watches whose futures were cancelled
+                    watches[:] = [watch for watch in watches if not watch.future.done()]
+                if not self._incident_watches and not self._playbook_watches:
+                    self._thread = None
+                    return
+                incident_watches = list(self._incident_watches)
+                playbook_watches = list(self._playbook_watches)
+
+            try:
+                interval = self._tick(incident_watches, playbook_watches, interval)
+            except Exception as e:
+                # the thread must not die while callers are still waiting on the futures of the watches
+                logger.debug(f"The state poller failed, error: {e}")
+                self._fail_all(e)
+                return
+
+    def _tick(
+        self,
+        incident_watches: List[StateWatch],
+        playbook_watches: List[StateWatch],
+        interval: float,
+    ) -> float:
+        """
+        Polls the watched states once and waits until the next tick.
+
+        Returns:
+            the interval between the ticks after this tick
+        """
+        states_changed = self._poll_incidents(incident_watches)
+        states_changed |= self._poll_playbooks(playbook_watches)
+        interval = (
+            self.min_interval
+            if states_changed
+            else min(interval * self.backoff_factor, self.max_interval)
+        )
+
+        with self._lock:
+            deadlines = [
+                watch.deadline
+                for watch in self._incident_watches + self._playbook_watches
+                if not watch.future.done()
+            ]
+        if deadlines:
+            # never sleep past the next timeout
+            self._wake_up.wait(max(0, min(interval, min(deadlines) - time.monotonic())))
+        return interval
+
+    def _fail_all(self, error: Exception):
+        """
+        Fails all the pending watches and stops the polling thread, a new thread is started by the next watch.
+        """
+        with self._lock:
+            watches = self._incident_watches + self._playbook_watches
+            self._incident_watches.clear()
+            self._playbook_watches.clear()
+            self._thread = None
+        for watch in watches:
+            with contextlib.suppress(InvalidStateError):
+                watch.future.set_exception(error)
+
+    def _poll_incidents(self, watches: List[StateWatch]) -> bool:
+        if not watches:
+            return False
+
+        incident_ids = sorted({watch.incident_id for watch in watches})
+        try:
+            incidents = {
+                str(incident.get("id")): incident
+                for incident in self.client.search_incidents(
+                    incident_ids, size=len(incident_ids)
+                ).get("data")
+                or []
+            }
+        except Exception as e:
+            for watch in watches:
+                self._resolve(
+                    self._incident_watches,
+                    watch,
+                    error=ValueError(
+                        f"Could not find incident ID {watch.incident_id}, error:\n{e}"
+                    ),
+                )
+            return True
+
+        states_changed = False
+        for watch in watches:
+            if not (incident := incidents.get(watch.incident_id)):
+                self._resolve(
+                    self._incident_watches,
+                    watch,
+                    error=ValueError(f"Could not find incident ID {watch.incident_id}"),
+                )
+                states_changed = True
+                continue
+            logger.debug(f"Incident raw response {incident}")
+            try:
+                incident_status = IncidentState(str(incident.get("status"))).name
+            except ValueError as e:
+                self._resolve(self._incident_watches, watch, error=e)
+                states_changed = True
+                continue
+            watch.name = incident.get("name")
+            logger.debug(f"status of the incident {watch.name} is {incident_status}")
+            states_changed |= incident_status != watch.state
+            watch.state = incident_status
+
+            if incident_status in {state.name for state in watch.expected_states}:
+                self._resolve(self._incident_watches, watch, result=incident)
+            elif time.monotonic() >= watch.deadline:
+                self._resolve(
+                    self._incident_watches,
+                    watch,
+                    error=PollTimeout(
+                        f"status of incident {watch.name} is {incident_status}",
+                        expected_states=watch.expected_states,
+                        timeout=watch.timeout,
+                    ),
+                )
+        return states_changed
+
+    def _poll_playbooks(self, watches: List[StateWatch]) -> bool:
+        # the states of playbooks can be queried only per incident
+        states_changed = False
+        for watch in watches:
+            try:
+                playbook_state_raw_response = self.client.get_playbook_state(
+                    watch.incident_id
+                )
+                logger.debug(
+                    f"playbook state raw-response: {playbook_state_raw_response}"
+                )
+                playbook_state = playbook_state_raw_response.get("state")
+                watch.name = playbook_state_raw_response.get("playbookId")
+                logger.debug(
+                    f"status of the playbook {watch.name} running in incident {watch.incident_id} is {playbook_state}"
+                )
+                states_changed |= playbook_state != watch.state
+                watch.state = playbook_state
+
+                if playbook_state in watch.expected_states:
+                    self._resolve(
+                        self._playbook_watches,
+                        watch,
+                        result=playbook_state_raw_response,
+                    )
+                elif time.monotonic() >= watch.deadline:
+                    self._resolve(
+                        self._playbook_watches,
+                        watch,
+                        error=PollTimeout(
+                            f"status of the playbook {watch.name} running in incident {watch.incident_id} "
+                            f"is {playbook_state}",
+                            expected_states=watch.expected_states,
+                            timeout=watch.timeout,
+                            reason=(
+                                f"{self.client.get_incident_playbook_failure(watch.incident_id)}"
+                                if playbook_state == InvestigationPlaybookState.FAILED
+                                else None
+                            ),
+                        ),
+                    )
+            except Exception as e:
+                self._resolve(self._playbook_watches, watch, error=e)
+                states_changed = True
+        return states_changed
+
+    def _resolve(
+        self,
+        watches: List[StateWatch],
+        watch: StateWatch,
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ):
+        with self._lock:
+            watches.remove(watch)
+        # the future may have been cancelled meanwhile
+        with contextlib.suppress(InvalidStateError):
+            if error:
+                watch.future.set_exception(error)
+            else:
+                watch.future.set_result(result)
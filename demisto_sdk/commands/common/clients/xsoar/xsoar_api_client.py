@@ -1,7 +1,6 @@
 import contextlib
 import re
 import socket
-import time
 import urllib.parse
 from functools import cached_property
 from pathlib import Path
@@ -23,10 +22,10 @@ from urllib3 import HTTPResponse
 from demisto_sdk.commands.common.clients.configs import XsoarClientConfig
 from demisto_sdk.commands.common.clients.errors import (
     InvalidServerType,
-    PollTimeout,
     UnAuthorized,
     UnHealthyServer,
 )
+from demisto_sdk.commands.common.clients.xsoar.state_poller import XsoarStatePoller
 from demisto_sdk.commands.common.constants import (
     MINIMUM_XSOAR_SAAS_VERSION,
     IncidentState,
@@ -74,6 +73,8 @@ class XsoarClient:
             password=self.server_config.password.get_secret_value(),
             verify_ssl=self.server_config.verify_ssl,
         )
+        # polls the states of the incidents and playbooks of all the threads using this client together
+        self.state_poller = XsoarStatePoller(self)
         if raise_if_server_not_healthy and not self.is_healthy:
             raise UnHealthyServer(str(self))
         if should_validate_server_type and not self.is_server_type:
@@ -709,37 +710,10 @@ class XsoarClient:
         Returns:
             raw response of the incident that reached into the relevant state.
         """
-        if timeout <= 0:
-            raise ValueError("timeout argument must be larger than 0")
-
-        elapsed_time = 0
-        start_time = time.time()
-        interval = timeout / 10
-        incident_name = None
-        incident_status = None
-
-        expected_state_names = {state.name for state in expected_states}
-
-        while elapsed_time < timeout:
-            try:
-                incident = self.search_incidents(incident_id).get("data", [])[0]
-            except Exception as e:
-                raise ValueError(
-                    f"Could not find incident ID {incident_id}, error:\n{e}"
-                )
-            logger.debug(f"Incident raw response {incident}")
-            incident_status = IncidentState(str(incident.get("status"))).name
-            incident_name = incident.get("name")
-            logger.debug(f"status of the incident {incident_name} is {incident_status}")
-            if incident_status in expected_state_names:
-                return incident
-            else:
-                time.sleep(interval)
-                elapsed_time = int(time.time() - start_time)
-
-        raise PollTimeout(
-            f"status of incident {incident_name} is {incident_status}",
-            expected_states=expected_states,
+        return self.state_poller.wait(
+            self.state_poller.watch_incident(
+                incident_id, expected_states=expected_states, timeout=timeout
+            ),
             timeout=timeout,
         )
 
@@ -1272,37 +1246,9 @@ class XsoarClient:
         Returns:
             the raw response of the state of the playbook
         """
-        if timeout <= 0:
-            raise ValueError("timeout argument must be larger than 0")
-
-        elapsed_time = 0
-        start_time = time.time()
-        interval = timeout / 10
-        playbook_id = None
-        playbook_state = None
-
-        while elapsed_time < timeout:
-            playbook_state_raw_response = self.get_playbook_state(incident_id)
-            logger.debug(f"playbook state raw-response: {playbook_state_raw_response}")
-            playbook_state = playbook_state_raw_response.get("state")
-            playbook_id = playbook_state_raw_response.get("playbookId")
-            logger.debug(
-                f"status of the playbook {playbook_id} running in incident {incident_id} is {playbook_state}"
-            )
-            if playbook_state in expected_states:
-                return playbook_state_raw_response
-            else:
-                time.sleep(interval)
-                elapsed_time = int(time.time() - start_time)
-
-        raise PollTimeout(
-            f"status of the playbook {playbook_id} running in incident {incident_id} "
-            f"is {playbook_state}",
-            expected_states=expected_states,
-            timeout=timeout,
-            reason=(
-                f"{self.get_incident_playbook_failure(incident_id)}"
-                if playbook_state == InvestigationPlaybookState.FAILED
-                else None
+        return self.state_poller.wait(
+            self.state_poller.watch_playbook(
+                incident_id, expected_states=expected_states, timeout=timeout
             ),
+            timeout=timeout,
         )
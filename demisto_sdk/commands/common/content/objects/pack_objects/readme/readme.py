@@ -29,22 +29,24 @@ class Readme(TextObject):
             contributors_names="".join(fixed_contributor_names)
         )
 
-    def mention_contributors_in_readme(self):
-        """Mention contributors in pack readme"""
+    def mention_contributors_in_readme(
+        self, readme_path: Optional[Union[Path, str]] = None
+    ):
+        """Mention contributors in pack readme (or in the given copy of it)"""
         try:
             if self.contributors:
                 with open(self.contributors.path) as contributors_file:
                     contributor_list = json.load(contributors_file)
                 contribution_data = self.prepare_contributors_text(contributor_list)
-                with open(self._path, "a+") as readme_file:
+                with open(readme_path or self._path, "a+") as readme_file:
                     readme_file.write(contribution_data)
         except Exception as e:
             logger.error(e)
 
-    def handle_marketplace_tags(self):
+    def handle_marketplace_tags(self, readme_path: Optional[Union[Path, str]] = None):
         """Remove marketplace tags depending on marketplace version"""
         try:
-            with open(self._path, "r+") as f:
+            with open(readme_path or self._path, "r+") as f:
                 text = f.read()
                 parsed_text = get_mp_tag_parser().parse_text(text)
                 if len(text) != len(parsed_text):
@@ -55,6 +57,9 @@ class Readme(TextObject):
             logger.error(e)
 
     def dump(self, dest_dir: Optional[Union[Path, str]] = None) -> List[Path]:
-        self.mention_contributors_in_readme()
-        self.handle_marketplace_tags()
-        return super().dump(dest_dir)
+        # modify the dumped readme, so the source readme stays unchanged
+        dumped_files = super().dump(dest_dir)
+        for dumped_file in dumped_files:
+            self.mention_contributors_in_readme(dumped_file)
+            self.handle_marketplace_tags(dumped_file)
+        return dumped_files
@@ -62,3 +62,29 @@ def test_mention_contributors_in_readme(pack):
     with open(readme.path) as readme_file:
         readme_file_content = readme_file.read()
     assert readme_file_content == expected_readme
+
+
+def test_dump_readme_with_contributors(pack, tmp_path):
+    """
+    Given: pack README with the following text: Test README content, and a CONTRIBUTORS file
+
+    When: dumping the readme
+
+    Then: Ensure the dumped readme contains the credit to contributors section, and the source readme is unchanged.
+    """
+    initial_readme_text = "Test README content\n"
+    readme = pack._create_text_based("README.md", initial_readme_text)
+    contributors = pack._create_json_based(
+        "CONTRIBUTORS.json", "", ["Contributor1", "Contributor2"]
+    )
+    obj = Readme(readme.path)
+    obj.contributors = Contributors(contributors.path)
+
+    (dumped_readme,) = obj.dump(tmp_path)
+
+    assert dumped_readme.read_text() == initial_readme_text + (
+        CONTRIBUTORS_README_TEMPLATE.format(
+            contributors_names=" - Contributor1\n - Contributor2\n"
+        )
+    )
+    assert Path(readme.path).read_text() == initial_readme_text
@@ -192,8 +192,15 @@ class DockerBase:
             # build number makes the version unable to parse, so we need to strip it
             return Version(version.split("-")[0])
 
-    def installation_files(self, container_type: str) -> FILES_SRC_TARGET:
-        files = self._files_to_push_on_installation.copy()
+    def installation_files(
+        self, container_type: str, requirements: Optional[Path] = None
+    ) -> FILES_SRC_TARGET:
+        files = [
+            (requirements, target)
+            if requirements and target == "/test-requirements.txt"
+            else (src, target)
+            for src, target in self._files_to_push_on_installation
+        ]
         files.append((self.installation_scripts[container_type], "/install.sh"))
         return files
 
@@ -361,14 +368,17 @@ class DockerBase:
         logger.debug(
             f"create_image is called with base_image={base_image}, image={image}"
         )
-        self.requirements.write_text(
-            "\n".join(install_packages) if install_packages else ""
+        # Each image gets its own requirements file, as test images may be created concurrently
+        requirements = (
+            self.tmp_dir
+            / f"requirements-{hashlib.md5(image.encode('utf-8')).hexdigest()}.txt"
         )
+        requirements.write_text("\n".join(install_packages) if install_packages else "")
         logger.debug(f"Trying to pull image {base_image}")
         self.pull_image(base_image)
         container = self.create_container(
             image=base_image,
-            files_to_push=self.installation_files(container_type),
+            files_to_push=self.installation_files(container_type, requirements),
             command="/install.sh",
         )
         container.start()
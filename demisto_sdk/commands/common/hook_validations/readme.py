@@ -9,9 +9,6 @@ from threading import Lock
 from typing import Callable, List, Optional, Set
 
 import docker
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
 
 from demisto_sdk.commands.common.constants import (
     PACKS_DIR,
@@ -31,7 +28,11 @@ from demisto_sdk.commands.common.hook_validations.base_validator import (
     error_codes,
 )
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.markdown_lint import run_markdownlint
+from demisto_sdk.commands.common.markdown_lint import (
+    MARKDOWN_SERVER_URL,
+    get_markdown_server_session,
+    run_markdownlint,
+)
 from demisto_sdk.commands.common.MDXServer import (
     start_docker_MDX_server,
     start_local_MDX_server,
@@ -222,13 +223,9 @@ class ReadMeValidator(BaseValidator):
         for _ in range(RETRIES_VERIFY_MDX):
             try:
                 readme_content = self.fix_mdx()
-                retry = Retry(total=2)
-                adapter = HTTPAdapter(max_retries=retry)
-                session = requests.Session()
-                session.mount("http://", adapter)
-                response = session.request(
+                response = get_markdown_server_session().request(
                     "POST",
-                    "http://localhost:6161",
+                    MARKDOWN_SERVER_URL,
                     data=readme_content.encode("utf-8"),
                     timeout=20,
                 )
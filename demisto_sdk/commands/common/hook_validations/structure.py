@@ -6,9 +6,11 @@ Module contains validation of schemas, ids and paths.
 import os
 import re
 import string
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
+from pykwalify.compat import yml
 from pykwalify.core import Core
 
 from demisto_sdk.commands.common.configuration import Configuration
@@ -31,6 +33,21 @@ from demisto_sdk.commands.common.hook_validations.base_validator import (
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import get_remote_file, is_file_path_in_pack
 
+# the regexes of the file paths of each scheme, compiled once instead of on every lookup
+SCHEMA_TO_COMPILED_REGEX: Dict[str, List[Pattern]] = {
+    scheme_name: [re.compile(regex, re.IGNORECASE) for regex in regex_list]
+    for scheme_name, regex_list in SCHEMA_TO_REGEX.items()
+}
+
+
+@lru_cache
+def load_schema(schema_path: str) -> dict:
+    """Loads a schema file once per process.
+    The schema is loaded the same way pykwalify loads schema files, and is not modified by the validation.
+    """
+    with open(schema_path) as schema_file:
+        return yml.load(schema_file)
+
 
 class StructureValidator(BaseValidator):
     """Structure validator is designed to validate the correctness of the file structure we enter to content repo.
@@ -125,8 +142,8 @@ class StructureValidator(BaseValidator):
             (str): Type of file by scheme name
         """
 
-        for scheme_name, regex_list in SCHEMA_TO_REGEX.items():
-            if checked_type_by_reg(self.file_path, regex_list):
+        for scheme_name, regex_list in SCHEMA_TO_COMPILED_REGEX.items():
+            if any(regex.search(self.file_path) for regex in regex_list):
                 return scheme_name
 
         pretty_formatted_string_of_regexes = json.dumps(
@@ -187,7 +204,12 @@ class StructureValidator(BaseValidator):
                     __file__, "..", "..", self.SCHEMAS_PATH, f"{scheme_file_name}.yml"
                 )
             )
-            core = Core(source_file=self.file_path, schema_files=[path])
+            schema = load_schema(path)
+            if os.path.splitext(self.file_path)[1] in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
+                # validate the data already loaded from the file, instead of loading it again
+                core = Core(source_data=self.current_file, schema_data=schema)
+            else:
+                core = Core(source_file=self.file_path, schema_data=schema)
             core.validate(raise_exception=True)
         except Exception as err:
             try:
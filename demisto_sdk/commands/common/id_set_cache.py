@@ -0,0 +1,132 @@
+import os
+import pickle
+from functools import partial
+from hashlib import sha1
+from multiprocessing.pool import Pool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from demisto_sdk.commands.common.constants import (
+    CACHE_DIR,
+    PACKS_DIR,
+    PACKS_PACK_META_FILE_NAME,
+)
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    get_current_repo,
+    get_pack_name,
+    get_sdk_version,
+    sha1_dir,
+    sha1_file,
+)
+
+ID_SET_CACHE_DIR = CACHE_DIR / "id-set"
+# keyword arguments of the processing functions which do not affect the extracted data
+NON_CACHED_PROCESS_ARGS = ("packs", "print_logs")
+
+
+class IDSetCache:
+    def __init__(self, marketplace: str = "", pack_to_create: Optional[str] = None):
+        """Cache of the id_set data extracted from each content item.
+        Every entry is stored with the hash of the item files (and of its pack metadata), so only the items which
+        changed since the previous id_set creation are processed again.
+
+        Args:
+            marketplace: The marketplace the id_set is created for.
+            pack_to_create: The pack the id_set is created for, if any.
+        """
+        self.config = {
+            "sdk_version": get_sdk_version(),
+            "source": get_current_repo(),
+            "marketplace": marketplace,
+        }
+        cache_key = sha1(
+            f"{os.getcwd()}:{pack_to_create or ''}:{marketplace}".encode()
+        ).hexdigest()
+        self.path = ID_SET_CACHE_DIR / f"id_set-{cache_key}.pickle"
+        # the results are kept pickled, as the id_set creation modifies the objects it gets from them
+        self.previous_items: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+        self.items: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+
+        try:
+            previous_cache = pickle.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.debug(f"Could not load the id_set cache from {self.path}: {e}")
+            return
+        if previous_cache.get("config") == self.config:
+            self.previous_items = previous_cache.get("items", {})
+
+    @staticmethod
+    def get_context(process_func: partial) -> str:
+        """The processing function and the keyword arguments it is called with, as a cache key."""
+        keywords = {
+            key: getattr(value, "__qualname__", value)
+            for key, value in sorted(process_func.keywords.items())
+            if key not in NON_CACHED_PROCESS_ARGS
+        }
+        return sha1(
+            f"{process_func.func.__qualname__}:{keywords!r}".encode()
+        ).hexdigest()
+
+    @staticmethod
+    def get_item_hash(path: str) -> str:
+        """The hash of the item files, together with the metadata of the pack the item is in."""
+        if Path(path).is_dir():
+            item_hash = sha1_dir(path)
+        elif Path(path).is_file():
+            item_hash = sha1_file(path)
+        else:
+            item_hash = ""
+        if pack_name := get_pack_name(path):
+            parts = Path(path).parts
+            pack_path = Path(*parts[: parts.index(PACKS_DIR) + 1], pack_name)
+            if (pack_metadata_path := pack_path / PACKS_PACK_META_FILE_NAME).is_file():
+                item_hash += f":{sha1_file(pack_metadata_path)}"
+        return item_hash
+
+    def map(self, pool: Pool, process_func: partial, paths: List[str]) -> list:
+        """Process the given items like pool.map, processing only the items which are not cached.
+
+        Args:
+            pool: The pool to process the items with.
+            process_func: The function which extracts the id_set data of an item.
+            paths: The paths of the items.
+
+        Returns:
+            list: The results of process_func for each of the items, in the order of the paths.
+        """
+        context = self.get_context(process_func)
+        items_hashes = {path: self.get_item_hash(path) for path in paths}
+        results: Dict[str, Any] = {}
+        paths_to_process = []
+        for path, item_hash in items_hashes.items():
+            previous_hash, previous_result = self.previous_items.get(
+                (context, path), (None, b"")
+            )
+            if previous_hash == item_hash:
+                self.items[(context, path)] = (item_hash, previous_result)
+                results[path] = pickle.loads(previous_result)
+            else:
+                paths_to_process.append(path)
+
+        logger.debug(
+            f"{process_func.func.__name__}: {len(results)} cached items, processing {len(paths_to_process)} items"
+        )
+        for path, result in zip(
+            paths_to_process, pool.map(process_func, paths_to_process)
+        ):
+            self.items[(context, path)] = (items_hashes[path], pickle.dumps(result))
+            results[path] = result
+        return [results[path] for path in paths]
+
+    def save(self):
+        """Write the cache of the items processed in this run, dropping the items that were removed."""
+        ID_SET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so a concurrent run never loads a partially written cache
+        temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_bytes(
+            pickle.dumps({"config": self.config, "items": self.items})
+        )
+        temp_path.replace(self.path)
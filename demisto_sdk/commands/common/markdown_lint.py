@@ -1,7 +1,15 @@
+from typing import Dict, Optional
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
+MARKDOWN_SERVER_URL = "http://localhost:6161"
+# the max number of files to send in a single batch request
+MARKDOWNLINT_BATCH_SIZE = 50
+
+_SESSION: Optional[requests.Session] = None
+
 
 class MarkdownResult:
     """
@@ -14,6 +22,19 @@ class MarkdownResult:
         self.fixed_text = resp["fixedText"]
 
 
+def get_markdown_server_session() -> requests.Session:
+    """
+    Returns a session to the node server, shared by all the requests so the connections to the server are reused.
+    """
+    global _SESSION
+    if _SESSION is None:
+        retry = Retry(total=2)
+        adapter = HTTPAdapter(max_retries=retry)
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+
 def run_markdownlint(file_content: str, file_path="file", fix=False) -> MarkdownResult:
     """
     This function makes a request to the node server to check markdown lint validations
@@ -26,16 +47,51 @@ def run_markdownlint(file_content: str, file_path="file", fix=False) -> Markdown
     Returns: A MarkdownResult object response for the given request
 
     """
-    retry = Retry(total=2)
-    adapter = HTTPAdapter(max_retries=retry)
-    session = requests.Session()
-    session.mount("http://", adapter)
-
     return MarkdownResult(
-        session.request(
+        get_markdown_server_session()
+        .request(
             "POST",
-            f"http://localhost:6161/markdownlint?filename={file_path}&fix={fix}",
+            f"{MARKDOWN_SERVER_URL}/markdownlint?filename={file_path}&fix={fix}",
             data=file_content.encode("utf-8"),
             timeout=20,
-        ).json()
+        )
+        .json()
     )
+
+
+def run_markdownlint_batch(
+    files_contents: Dict[str, str], fix=False
+) -> Dict[str, MarkdownResult]:
+    """
+    This function makes requests to the node server to check markdown lint validations of many files at once,
+    sending up to MARKDOWNLINT_BATCH_SIZE files in each request
+    Args:
+        files_contents: The markdown contents to check, keyed by the name of the file to display in the
+        validation results
+        fix: Whether to fix the results, and return the fixed text in the fixed_text field. If provided, the validations
+        returned will be the validations that are left over that could not be fixed
+
+    Returns: A MarkdownResult object response for each of the given files, keyed by the file name
+
+    """
+    results: Dict[str, MarkdownResult] = {}
+    file_names = list(files_contents)
+    for i in range(0, len(file_names), MARKDOWNLINT_BATCH_SIZE):
+        batch = {
+            file_name: files_contents[file_name]
+            for file_name in file_names[i : i + MARKDOWNLINT_BATCH_SIZE]
+        }
+        response = get_markdown_server_session().request(
+            "POST",
+            f"{MARKDOWN_SERVER_URL}/markdownlint/batch",
+            json={"files": batch, "fix": fix},
+            timeout=20 + len(batch),
+        )
+        response.raise_for_status()
+        results.update(
+            {
+                file_name: MarkdownResult(file_result)
+                for file_name, file_result in response.json().items()
+            }
+        )
+    return results
@@ -13,9 +13,7 @@ const config = require( "./markdownlintconfig.js")
 // explanation of the config can be found at
 // https://github.com/DavidAnson/markdownlint/blob/main/schema/markdownlint-config-schema.json
 
-function markdownLint(req, res, body, query) {
-
-    let fileName = query.filename || 'readme'
+function lintMarkdown(fileName, body, fix) {
     const fixOptions = {
       "config" : config,
       "strings": {
@@ -27,7 +25,7 @@ function markdownLint(req, res, body, query) {
 
     let fixedText = null;
 
-    if(query.fix && query.fix.toLowerCase() == 'true') {
+    if(fix) {
         fixedText = body;
         const fixes = validationResults[fileName].filter(error => error.fixInfo);
         if (fixes.length > 0) {
@@ -41,12 +39,41 @@ function markdownLint(req, res, body, query) {
             validationResults = markdownlint.sync(fixOptions)
         }
     }
+    return { validations : validationResults.toString(),
+        fixedText : fixedText, errorNum : validationResults[fileName].length}
+}
+
+function markdownLint(req, res, body, query) {
+
+    let fileName = query.filename || 'readme'
+    let fix = Boolean(query.fix && query.fix.toLowerCase() == 'true')
     res.setHeader('Content-Type', 'application/json');
     res.statusCode = 200
-    res.end(JSON.stringify({ validations : validationResults.toString(),
-        fixedText : fixedText, errorNum : validationResults[fileName].length}))
+    res.end(JSON.stringify(lintMarkdown(fileName, body, fix)))
 
 }
+
+// lints many files in a single request.
+// the body is a json of the form {"files": {<filename>: <content>}, "fix": <bool>}
+// and the response is a json of the lint results keyed by filename.
+function markdownLintBatch(req, res, body) {
+    let request
+    try {
+        request = JSON.parse(body)
+    } catch (error) {
+        res.statusCode = 400
+        res.end("Invalid batch request: " + error)
+        return
+    }
+    let fix = Boolean(request.fix)
+    let results = {}
+    for (const [fileName, content] of Object.entries(request.files || {})) {
+        results[fileName] = lintMarkdown(fileName, content, fix)
+    }
+    res.setHeader('Content-Type', 'application/json');
+    res.statusCode = 200
+    res.end(JSON.stringify(results))
+}
 function requestHandler(req, res) {
     // console.log(req)
     if (req.method != 'POST') {
@@ -66,6 +93,10 @@ function requestHandler(req, res) {
         {
             markdownLint(req, res, body, urlObj.query)
         }
+        else if(urlObj.pathname == '/markdownlint/batch')
+        {
+            markdownLintBatch(req, res, body)
+        }
         else {
             try {
                 let parsed = await mdx(body)
@@ -1,7 +1,10 @@
 import pytest
 
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
-from demisto_sdk.commands.common.markdown_lint import run_markdownlint
+from demisto_sdk.commands.common.markdown_lint import (
+    run_markdownlint,
+    run_markdownlint_batch,
+)
 
 
 @pytest.mark.parametrize(
@@ -85,3 +88,24 @@ def test_filename_returned_in_validations():
     with ReadMeValidator.start_mdx_server():
         filename = "helloworld124"
         assert filename in run_markdownlint("##Hello", file_path=filename).validations
+
+
+def test_markdownlint_batch():
+    """
+    Given: Markdown texts of several files
+    When: calling run_markdownlint_batch
+    Then: Receive a response for each of the files, equal to the response of linting the file on its own
+    """
+    files_contents = {
+        "first": "##Hello",
+        "second": "## Hello\n\n## Hello",
+        "third": "<p>something</p>",
+    }
+    with ReadMeValidator.start_mdx_server():
+        results = run_markdownlint_batch(files_contents, fix=True)
+        assert set(results) == set(files_contents)
+        for file_name, file_content in files_contents.items():
+            expected = run_markdownlint(file_content, file_path=file_name, fix=True)
+            assert results[file_name].has_errors == expected.has_errors
+            assert results[file_name].validations == expected.validations
+            assert results[file_name].fixed_text == expected.fixed_text
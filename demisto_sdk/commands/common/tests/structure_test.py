@@ -45,6 +45,7 @@ from demisto_sdk.commands.common.hook_validations.base_validator import BaseVali
 from demisto_sdk.commands.common.hook_validations.structure import (
     StructureValidator,
     checked_type_by_reg,
+    load_schema,
 )
 from demisto_sdk.commands.common.tools import get_file, write_dict
 from demisto_sdk.tests.constants_test import (
@@ -323,6 +324,33 @@ class TestStructureValidator:
         structure = StructureValidator(file_path=no_extension)
         assert not structure.is_valid_file_extension()
 
+    def test_is_valid_scheme_uses_loaded_data(self, pack: Pack):
+        """
+        Given:
+            Two integrations, one of them invalid.
+        When:
+            Validating their schemes after their files were deleted.
+        Then:
+            Make sure the schemes are validated from the data loaded by the validators,
+            and the integration schema is loaded only once.
+        """
+        valid_integration = pack.create_integration("valid").yml
+        invalid_integration = pack.create_integration("invalid").yml
+        invalid_integration.delete_key("name")
+        validators = [
+            StructureValidator(valid_integration.path, is_new_file=True),
+            StructureValidator(invalid_integration.path, is_new_file=True),
+        ]
+        Path(valid_integration.path).unlink()
+        Path(invalid_integration.path).unlink()
+        load_schema.cache_clear()
+
+        assert [validator.is_valid_scheme() for validator in validators] == [
+            True,
+            False,
+        ]
+        assert load_schema.cache_info().misses == 1
+
     def test_is_field_with_open_ended(self, pack: Pack):
         field_content = {
             "cliName": "sanityname",
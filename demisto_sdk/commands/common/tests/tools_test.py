@@ -2799,6 +2799,26 @@ def test_find_type_by_path(path: Path, expected_type: Optional[FileType]):
     assert find_type_by_path(path) == expected_type
 
 
+def test_find_type_by_path_keeps_all_paths_cached():
+    """
+    Given
+        - More paths than the default size of an lru_cache
+    When
+        - Finding their types twice, as done when going over all the files of a repository
+    Then
+        - Make sure the second pass does not classify any path again
+    """
+    paths = [f"Packs/myPack/Scripts/script-{i}.yml" for i in range(300)]
+    find_type_by_path.cache_clear()
+    for path in paths:
+        assert find_type_by_path(path) == FileType.SCRIPT
+    misses = find_type_by_path.cache_info().misses
+
+    for path in paths:
+        assert find_type_by_path(path) == FileType.SCRIPT
+    assert find_type_by_path.cache_info().misses == misses
+
+
 @pytest.mark.parametrize(
     "value, expected",
     [
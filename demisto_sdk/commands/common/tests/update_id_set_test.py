@@ -51,6 +51,7 @@ from demisto_sdk.commands.common.update_id_set import (
     get_xsiam_report_data,
     has_duplicate,
     merge_id_sets,
+    merge_id_sets_from_files,
     process_general_items,
     process_incident_fields,
     process_integration,
@@ -3846,6 +3847,66 @@ def test_merge_id_sets(tmp_path):
     assert not duplicates
 
 
+def test_merge_id_sets_from_files(tmp_path):
+    """
+    Given
+    - two id_set files, the second containing an item of the first one and items with an id of the first one
+
+    When
+    - merged
+
+    Then
+    - ensure the output file is the same as dumping the merged id_set at once
+    - ensure the item of the first id_set is not added again
+    - ensure the items of the first id_set are not modified
+    """
+    first_id_set = {
+        "scripts": [
+            {"ScriptFoo": {"name": "ScriptFoo", "pack": "Foo", "toversion": "5.9.9"}},
+            {"ScriptBar": {"name": "ScriptBar", "pack": "Bar"}},
+        ],
+        "Packs": {"Foo": {"name": "Foo"}, "Bar": {"name": "Bar"}},
+    }
+    second_id_set = {
+        "scripts": [
+            {"ScriptBar": {"name": "ScriptBar", "pack": "Bar"}},
+            {
+                "ScriptFoo": {
+                    "name": "ScriptFoo",
+                    "pack": "Foo2",
+                    "fromversion": "6.0.0",
+                }
+            },
+            {"ScriptBaz": {"name": "ScriptBaz\nScript", "pack": "Baz"}},
+        ],
+        "Packs": {"Baz": {"name": "Baz"}},
+    }
+    first_id_set_path = tmp_path / "first_id_set.json"
+    first_id_set_path.write_text(json.dumps(first_id_set))
+    second_id_set_path = tmp_path / "second_id_set.json"
+    second_id_set_path.write_text(json.dumps(second_id_set))
+    output_id_set_path = tmp_path / "id_set.json"
+
+    output_id_set, duplicates = merge_id_sets_from_files(
+        first_id_set_path, second_id_set_path, output_id_set_path
+    )
+
+    assert not duplicates
+    assert output_id_set.get_dict() == {
+        "scripts": first_id_set["scripts"] + second_id_set["scripts"][1:],
+        "Packs": {**first_id_set["Packs"], **second_id_set["Packs"]},
+    }
+    assert output_id_set_path.read_text() == json.dumps(
+        output_id_set.get_dict(), indent=4
+    )
+
+    assert merge_id_sets(first_id_set, second_id_set)[0].get_dict() == (
+        output_id_set.get_dict()
+    )
+    assert len(first_id_set["scripts"]) == 2
+    assert list(first_id_set["Packs"]) == ["Foo", "Bar"]
+
+
 def test_merged_id_sets_with_duplicates(caplog):
     """
     Given
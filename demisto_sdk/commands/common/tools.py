@@ -3,14 +3,17 @@ from __future__ import annotations
 import contextlib
 import fcntl
 import glob
+import importlib.metadata
 import os
 import re
 import shlex
+import shutil
 import sys
 import time
 import traceback
 import urllib.parse
 import xml.etree.ElementTree as ET
+import zipfile
 from abc import ABC
 from collections import OrderedDict
 from concurrent.futures import as_completed
@@ -1635,7 +1638,7 @@ def get_dict_from_file(
     return {}, None
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def find_type_by_path(path: Union[str, Path] = "") -> Optional[FileType]:
     """Find FileType value of a path, without accessing the file.
     This function is here as we want to implement lru_cache and we can do it on `find_type`
@@ -1860,6 +1863,7 @@ def find_type(
     )
     from demisto_sdk.commands.content_graph.objects import List as ListObject
 
+    file_path = Path(path)
     type_by_path = find_type_by_path(path)
     if type_by_path:
         return type_by_path
@@ -1892,51 +1896,51 @@ def find_type(
     ):
         return FileType.BETA_INTEGRATION
 
-    if Integration.match(_dict, Path(path)):
+    if Integration.match(_dict, file_path):
         return FileType.INTEGRATION
 
-    if TestScript.match(_dict, Path(path)) and not ignore_sub_categories:
+    if TestScript.match(_dict, file_path) and not ignore_sub_categories:
         return FileType.TEST_SCRIPT
 
-    if Script.match(_dict, Path(path)):
+    if Script.match(_dict, file_path):
         return FileType.SCRIPT
 
-    if TestPlaybook.match(_dict, Path(path)):
+    if TestPlaybook.match(_dict, file_path):
         return FileType.TEST_PLAYBOOK
 
-    if Playbook.match(_dict, Path(path)):
+    if Playbook.match(_dict, file_path):
         return FileType.PLAYBOOK
 
-    if ParsingRule.match(_dict, Path(path)):
+    if ParsingRule.match(_dict, file_path):
         return FileType.PARSING_RULE
 
-    if MODELING_RULES_DIR in Path(path).parts:
-        if ModelingRule.match(_dict, Path(path)):
+    if MODELING_RULES_DIR in file_path.parts:
+        if ModelingRule.match(_dict, file_path):
             return FileType.MODELING_RULE
 
-    if CorrelationRule.match(_dict, Path(path)):
+    if CorrelationRule.match(_dict, file_path):
         return FileType.CORRELATION_RULE
 
     if (file_type == "json" or path.lower().endswith(".json")) and (
-        path.lower().endswith("_schema.json") and MODELING_RULES_DIR in Path(path).parts
+        path.lower().endswith("_schema.json") and MODELING_RULES_DIR in file_path.parts
     ):
         return FileType.MODELING_RULE_SCHEMA
 
-    if Widget.match(_dict, Path(path)):
+    if Widget.match(_dict, file_path):
         return FileType.WIDGET
 
-    if Report.match(_dict, Path(path)):
+    if Report.match(_dict, file_path):
         return FileType.REPORT
 
-    if GenericType.match(_dict, Path(path)):
+    if GenericType.match(_dict, file_path):
         return FileType.GENERIC_TYPE
 
-    if IncidentType.match(_dict, Path(path)):
+    if IncidentType.match(_dict, file_path):
         return FileType.INCIDENT_TYPE
 
     # 'regex' key can be found in new reputations files while 'reputations' key is for the old reputations
     # located in reputations.json file.
-    if IndicatorType.match(_dict, Path(path)):
+    if IndicatorType.match(_dict, file_path):
         return FileType.REPUTATION
 
     if (
@@ -1946,76 +1950,76 @@ def find_type(
     ):
         return FileType.OLD_CLASSIFIER
 
-    if Classifier.match(_dict, Path(path)):
+    if Classifier.match(_dict, file_path):
         return FileType.CLASSIFIER
 
-    if Mapper.match(_dict, Path(path)):
+    if Mapper.match(_dict, file_path):
         return FileType.MAPPER
 
     if (
         ("layout" in _dict or "kind" in _dict)
         and ("kind" in _dict or "typeId" in _dict)
-        and Path(path).suffix == ".json"
+        and file_path.suffix == ".json"
     ):
         return FileType.LAYOUT
 
     if isinstance(_dict, dict) and LAYOUT_CONTAINER_FIELDS.intersection(_dict):
-        if Layout.match(_dict, Path(path)):
+        if Layout.match(_dict, file_path):
             return FileType.LAYOUTS_CONTAINER
 
-    if Dashboard.match(_dict, Path(path)):
+    if Dashboard.match(_dict, file_path):
         return FileType.DASHBOARD
 
-    if PreProcessRule.match(_dict, Path(path)):
+    if PreProcessRule.match(_dict, file_path):
         return FileType.PRE_PROCESS_RULES
 
-    if GenericModule.match(_dict, Path(path)):
+    if GenericModule.match(_dict, file_path):
         return FileType.GENERIC_MODULE
 
-    if GenericDefinition.match(_dict, Path(path)):
+    if GenericDefinition.match(_dict, file_path):
         return FileType.GENERIC_DEFINITION
 
-    if Job.match(_dict, Path(path)):
+    if Job.match(_dict, file_path):
         return FileType.JOB
 
-    if Wizard.match(_dict, Path(path)):
+    if Wizard.match(_dict, file_path):
         return FileType.WIZARD
 
-    if XSIAMDashboard.match(_dict, Path(path)):
+    if XSIAMDashboard.match(_dict, file_path):
         return FileType.XSIAM_DASHBOARD
 
-    if XSIAMReport.match(_dict, Path(path)):
+    if XSIAMReport.match(_dict, file_path):
         return FileType.XSIAM_REPORT
 
-    if Trigger.match(_dict, Path(path)):
+    if Trigger.match(_dict, file_path):
         return FileType.TRIGGER
 
-    if XDRCTemplate.match(_dict, Path(path)):
+    if XDRCTemplate.match(_dict, file_path):
         return FileType.XDRC_TEMPLATE
 
-    if LayoutRule.match(_dict, Path(path)):
+    if LayoutRule.match(_dict, file_path):
         return FileType.LAYOUT_RULE
 
-    if CaseField.match(_dict, Path(path)):
+    if CaseField.match(_dict, file_path):
         return FileType.CASE_FIELD
 
-    if CaseLayout.match(_dict, Path(path)):
+    if CaseLayout.match(_dict, file_path):
         return FileType.CASE_LAYOUT
 
-    if CaseLayoutRule.match(_dict, Path(path)):
+    if CaseLayoutRule.match(_dict, file_path):
         return FileType.CASE_LAYOUT_RULE
 
-    if ListObject.match(_dict, Path(path)):
+    if ListObject.match(_dict, file_path):
         return FileType.LISTS
 
     # When using it for all files validation- sometimes 'id' can be integer
-    if GenericField.match(_dict, Path(path)):
+    if GenericField.match(_dict, file_path):
         return FileType.GENERIC_FIELD
 
-    if IncidentField.match(_dict, Path(path)):
+    if IncidentField.match(_dict, file_path):
         return FileType.INCIDENT_FIELD
 
-    if IndicatorField.match(_dict, Path(path)):
+    if IndicatorField.match(_dict, file_path):
         return FileType.INDICATOR_FIELD
 
     return None
@@ -3907,6 +3911,14 @@ def is_sdk_defined_working_offline() -> bool:
     return str2bool(os.getenv(ENV_SDK_WORKING_OFFLINE))
 
 
+def get_sdk_version() -> str:
+    """Return the installed demisto-sdk version, or an empty string if it is not installed as a package"""
+    try:
+        return importlib.metadata.version("demisto-sdk")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
 def sha1_update_from_file(filename: Union[str, Path], hash):
     """This will iterate the file and update the hash object"""
     assert Path(filename).is_file()
@@ -4651,3 +4663,34 @@ def should_disable_multiprocessing():
         "DEMISTO_SDK_DISABLE_MULTIPROCESSING", "false"
     ).lower() in ["true", "yes", "1"]
     return disable_multiprocessing
+
+
+# a fixed modification time for zip entries, so a zip only depends on its content
+ZIP_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def write_dir_to_zip(
+    zip_file: zipfile.ZipFile, dir: Path, root: Optional[Path] = None
+) -> None:
+    """
+    Writes a directory to a zip file, with the entries sorted and a fixed modification time,
+    so the same content is always written the same way.
+
+    Args:
+        zip_file: The zip file to write to.
+        dir: The directory to write.
+        root: The directory the entries' names are relative to, `dir` itself by default.
+    """
+    root = root or dir
+    paths = sorted(dir.rglob("*"))
+    if dir != root:
+        paths.insert(0, dir)
+    for path in paths:
+        zip_info = zipfile.ZipInfo.from_file(path, path.relative_to(root))
+        zip_info.date_time = ZIP_ENTRY_DATE_TIME
+        if path.is_dir():
+            zip_file.writestr(zip_info, b"")
+            continue
+        zip_info.compress_type = zipfile.ZIP_DEFLATED
+        with open(path, "rb") as src, zip_file.open(zip_info, "w") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
@@ -58,6 +58,7 @@ from demisto_sdk.commands.common.content_constant_paths import (
 )
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.id_set_cache import IDSetCache
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     find_type,
@@ -2555,11 +2556,14 @@ class IDSet:
     def get_list(self, item_type):
         return self._id_set_dict.get(item_type, [])
 
-    def add_to_list(self, object_type: IDSetType, obj):
+    def add_to_list(self, object_type: IDSetType, obj, is_new: bool = False):
+        """Adds an item to a section of the id_set.
+        Pass `is_new` if it is known that the section does not contain the item, to skip scanning the section for it.
+        """
         if not IDSetType.has_value(object_type):
             raise ValueError(f"Invalid IDSetType {object_type}")
 
-        if obj not in self._id_set_dict.get(object_type, {}):
+        if is_new or obj not in self._id_set_dict.get(object_type, {}):
             self._id_set_dict.setdefault(object_type, []).append(obj)
 
     def add_pack_to_id_set_packs(self, object_type: IDSetType, obj_name, obj_value):
@@ -2582,31 +2586,64 @@ def merge_id_sets_from_files(
 
     if unified_id_set:
         with open(output_id_set_path, mode="w", encoding="utf-8") as f:
-            json.dump(unified_id_set.get_dict(), f, indent=4)
+            dump_id_set(unified_id_set.get_dict(), f)
 
     return unified_id_set, duplicates
 
 
+def dump_id_set(id_set_dict: dict, id_set_file):
+    """
+    Writes an id_set to the given file one section at a time, so the whole serialized id_set is never held in memory.
+    The output is the same as json.dump(id_set_dict, id_set_file, indent=4).
+    """
+    id_set_file.write("{")
+    for i, (object_type, object_list) in enumerate(id_set_dict.items()):
+        id_set_file.write(",\n    " if i else "\n    ")
+        id_set_file.write(f"{json.dumps(object_type)}: ")
+        id_set_file.write(json.dumps(object_list, indent=4).replace("\n", "\n    "))
+    id_set_file.write("\n}" if id_set_dict else "}")
+
+
+def group_id_set_items_by_id(id_set_subset_list: list) -> Dict[str, list]:
+    """
+    Groups the items of an id_set section by their ids, so the items sharing an id are found without scanning the
+    whole section.
+    """
+    items_by_id: Dict[str, list] = {}
+    for item in id_set_subset_list:
+        items_by_id.setdefault(list(item.keys())[0], []).append(item)
+    return items_by_id
+
+
 def merge_id_sets(
     first_id_set_dict: dict, second_id_set_dict: dict, print_logs: bool = True
 ):
     """
     Merged two id_set dictionaries into single id_set. Returns the unified id_set dict.
+    The unified id_set shares the items of both id_sets, without modifying them or their sections.
     """
     duplicates = []
-    united_id_set = IDSet(copy.deepcopy(first_id_set_dict))
+    united_id_set = IDSet(
+        {
+            object_type: copy.copy(object_list)
+            for object_type, object_list in first_id_set_dict.items()
+        }
+    )
 
     first_id_set = IDSet(first_id_set_dict)
     second_id_set = IDSet(second_id_set_dict)
 
     for object_type, object_list in second_id_set.get_dict().items():
-        subset = first_id_set.get_list(object_type)
-
         if object_type != "Packs":
+            first_items_by_id = group_id_set_items_by_id(
+                first_id_set.get_list(object_type)
+            )
+            added_items_by_id: Dict[str, list] = {}
             for obj in object_list:
                 obj_id = list(obj.keys())[0]
+                first_items = first_items_by_id.get(obj_id, [])
                 is_duplicate = has_duplicate(
-                    subset,
+                    first_items,
                     obj_id,
                     object_type,
                     print_logs,
@@ -2615,8 +2652,11 @@ def merge_id_sets(
                 )
                 if is_duplicate:
                     duplicates.append(obj_id)
-                else:
-                    united_id_set.add_to_list(object_type, obj)
+                elif obj not in first_items and obj not in added_items_by_id.get(
+                    obj_id, []
+                ):
+                    united_id_set.add_to_list(object_type, obj, is_new=True)
+                    added_items_by_id.setdefault(obj_id, []).append(obj)
 
         else:
             for obj_name, obj_value in object_list.items():
@@ -2635,6 +2675,7 @@ def re_create_id_set(  # noqa: C901
     print_logs: bool = True,
     fail_on_duplicates: bool = False,
     marketplace: str = "",
+    incremental: bool = False,
 ):
     """Re create the id-set
 
@@ -2647,6 +2688,7 @@ def re_create_id_set(  # noqa: C901
         print_logs: Whether to print logs or not
         fail_on_duplicates: If value is True an error will be raised if duplicates are found
         marketplace: The marketplace the id set is created for.
+        incremental: Whether to process only the content items which changed since the previous id set creation.
 
     Returns: id-set object
     """
@@ -2741,6 +2783,12 @@ def re_create_id_set(  # noqa: C901
     excluded_items_by_type: Dict[str, set] = {}
 
     pool = Pool(processes=int(cpu_count()))
+    id_set_cache = IDSetCache(marketplace, pack_to_create) if incremental else None
+
+    def process_items(process_func: partial, paths: List[str]) -> list:
+        if id_set_cache:
+            return id_set_cache.map(pool, process_func, paths)
+        return pool.map(process_func, paths)
 
     logger.info("<green>Starting the creation of the id_set</green>")
 
@@ -2749,7 +2797,7 @@ def re_create_id_set(  # noqa: C901
     ) as progress_bar:
         if "Packs" in objects_to_create:
             logger.info("\n<green>Starting iteration over Packs</green>")
-            for pack_data in pool.map(
+            for pack_data in process_items(
                 partial(
                     get_pack_metadata_data,
                     print_logs=print_logs,
@@ -2763,7 +2811,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Integrations" in objects_to_create:
             logger.info("\n<green>Starting iteration over Integrations</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_integration,
                     packs=packs_dict,
@@ -2790,7 +2838,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Playbooks" in objects_to_create:
             logger.info("\n<green>Starting iteration over Playbooks</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -2819,7 +2867,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Scripts" in objects_to_create:
             logger.info("\n<green>Starting iteration over Scripts</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_script,
                     packs=packs_dict,
@@ -2846,7 +2894,7 @@ def re_create_id_set(  # noqa: C901
 
         if "TestPlaybooks" in objects_to_create:
             logger.info("\n<green>Starting iteration over TestPlaybooks</green>")
-            for pair in pool.map(
+            for pair in process_items(
                 partial(
                     process_test_playbook_path,
                     packs=packs_dict,
@@ -2864,7 +2912,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Classifiers" in objects_to_create:
             logger.info("\n<green>Starting iteration over Classifiers</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -2893,7 +2941,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Dashboards" in objects_to_create:
             logger.info("\n<green>Starting iteration over Dashboards</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -2922,7 +2970,7 @@ def re_create_id_set(  # noqa: C901
 
         if "IncidentTypes" in objects_to_create:
             logger.info("\n<green>Starting iteration over Incident Types</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -2952,7 +3000,7 @@ def re_create_id_set(  # noqa: C901
         # Has to be called after 'IncidentTypes' is called
         if "IncidentFields" in objects_to_create:
             logger.info("\n<green>Starting iteration over Incident Fields</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_incident_fields,
                     packs=packs_dict,
@@ -2980,7 +3028,7 @@ def re_create_id_set(  # noqa: C901
 
         if "IndicatorFields" in objects_to_create:
             logger.info("\n<green>Starting iteration over Indicator Fields</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3010,7 +3058,7 @@ def re_create_id_set(  # noqa: C901
         # Has to be called after 'Integrations' is called
         if "IndicatorTypes" in objects_to_create:
             logger.info("\n<green>Starting iteration over Indicator Types</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_indicator_types,
                     packs=packs_dict,
@@ -3038,7 +3086,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Layouts" in objects_to_create:
             logger.info("\n<green>Starting iteration over Layouts</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3056,7 +3104,7 @@ def re_create_id_set(  # noqa: C901
                     excluded_items_from_iteration,
                 )
 
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_layoutscontainers,
                     packs=packs_dict,
@@ -3083,7 +3131,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Reports" in objects_to_create:
             logger.info("\n<green>Starting iteration over Reports</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3112,7 +3160,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Widgets" in objects_to_create:
             logger.info("\n<green>Starting iteration over Widgets</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3141,7 +3189,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Mappers" in objects_to_create:
             logger.info("\n<green>Starting iteration over Mappers</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3170,7 +3218,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Lists" in objects_to_create:
             logger.info("\n<green>Starting iteration over Lists</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3199,7 +3247,7 @@ def re_create_id_set(  # noqa: C901
 
         if "GenericDefinitions" in objects_to_create:
             logger.info("\n<green>Starting iteration over Generic Definitions</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3228,7 +3276,7 @@ def re_create_id_set(  # noqa: C901
 
         if "GenericModules" in objects_to_create:
             logger.info("\n<green>Starting iteration over Generic Modules</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3257,7 +3305,7 @@ def re_create_id_set(  # noqa: C901
 
         if "GenericTypes" in objects_to_create:
             logger.info("\n<green>Starting iteration over Generic Types</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_generic_items,
                     packs=packs_dict,
@@ -3285,7 +3333,7 @@ def re_create_id_set(  # noqa: C901
         # Has to be called after 'GenericTypes' is called
         if "GenericFields" in objects_to_create:
             logger.info("\n<green>Starting iteration over Generic Fields</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_generic_items,
                     packs=packs_dict,
@@ -3313,7 +3361,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Jobs" in objects_to_create:
             logger.info("\n<green>Starting iteration over Jobs</green>")
-            for arr in pool.map(
+            for arr in process_items(
                 partial(
                     process_jobs,
                     packs=packs_dict,
@@ -3335,7 +3383,7 @@ def re_create_id_set(  # noqa: C901
 
         if "ParsingRules" in objects_to_create:
             logger.info("\n<green>Starting iteration over Parsing Rules</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3364,7 +3412,7 @@ def re_create_id_set(  # noqa: C901
 
         if "ModelingRules" in objects_to_create:
             logger.info("\n<green>Starting iteration over Modeling Rules</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3393,7 +3441,7 @@ def re_create_id_set(  # noqa: C901
 
         if "CorrelationRules" in objects_to_create:
             logger.info("\n<green>Starting iteration over Correlation Rules</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3422,7 +3470,7 @@ def re_create_id_set(  # noqa: C901
 
         if "XSIAMDashboards" in objects_to_create:
             logger.info("\n<green>Starting iteration over XSIAMDashboards</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3451,7 +3499,7 @@ def re_create_id_set(  # noqa: C901
 
         if "XSIAMReports" in objects_to_create:
             logger.info("\n<green>Starting iteration over XSIAMReports</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3480,7 +3528,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Triggers" in objects_to_create:
             logger.info("\n<green>Starting iteration over Triggers</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3509,7 +3557,7 @@ def re_create_id_set(  # noqa: C901
 
         if "Wizards" in objects_to_create:
             logger.info("\n<green>Starting iteration over Wizards</green>")
-            for arr in pool.map(
+            for arr in process_items(
                 partial(
                     process_wizards,
                     packs=packs_dict,
@@ -3531,7 +3579,7 @@ def re_create_id_set(  # noqa: C901
 
         if "XDRCTemplates" in objects_to_create:
             logger.info("\n<green>Starting iteration over XDRCTemplates</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3561,7 +3609,7 @@ def re_create_id_set(  # noqa: C901
 
         if "LayoutRules" in objects_to_create:
             logger.info("\n<green>Starting iteration over LayoutRules</green>")
-            for arr, excluded_items_from_iteration in pool.map(
+            for arr, excluded_items_from_iteration in process_items(
                 partial(
                     process_general_items,
                     packs=packs_dict,
@@ -3633,6 +3681,9 @@ def re_create_id_set(  # noqa: C901
         new_ids_dict["Widgets"] = []
         new_ids_dict["Dashboards"] = []
 
+    if id_set_cache:
+        id_set_cache.save()
+
     exec_time = time.time() - start_time
     logger.info(
         f"<green>Finished the creation of the id_set. Total time: {exec_time} seconds</green>"
@@ -3658,12 +3709,11 @@ def find_duplicates(id_set, print_logs, marketplace):
         if print_logs:
             logger.info(f"<green>Checking diff for {object_type}</green>")
         objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
 
         dup_list = []
-        for id_to_check in ids:
+        for id_to_check, id_objects in group_id_set_items_by_id(objects).items():
             if has_duplicate(
-                objects, id_to_check, object_type, print_logs, is_create_new=True
+                id_objects, id_to_check, object_type, print_logs, is_create_new=True
             ):
                 dup_list.append(id_to_check)
         lists_to_return.append(dup_list)
@@ -3672,12 +3722,11 @@ def find_duplicates(id_set, print_logs, marketplace):
         logger.info("<green>Checking diff for Incident and Indicator Fields</green>")
 
     fields = id_set["IncidentFields"] + id_set["IndicatorFields"]
-    field_ids = {list(field.keys())[0] for field in fields}
 
     field_list = []
-    for field_to_check in field_ids:
+    for field_to_check, id_fields in group_id_set_items_by_id(fields).items():
         if has_duplicate(
-            fields,
+            id_fields,
             field_to_check,
             "Indicator and Incident Fields",
             print_logs,
@@ -185,7 +185,9 @@ class BasePlaybook(ContentItem, content_type=ContentType.PLAYBOOK):  # type: ign
         summary = super().summary(marketplace, incident_to_alert)
         # taking the description from the data after preparing the playbook to upload
         # this might be different when replacing incident to alert in the description for marketplacev2
-        summary["description"] = self.data.get("description") or ""
+        summary["description"] = (
+            self.get_prepared_data(marketplace).get("description") or ""
+        )
         return summary
 
     def prepare_for_upload(
@@ -194,12 +196,14 @@ class BasePlaybook(ContentItem, content_type=ContentType.PLAYBOOK):  # type: ign
         **kwargs,
     ) -> dict:
         data = super().prepare_for_upload(current_marketplace, **kwargs)
-        return MarketplaceIncidentToAlertPlaybooksPreparer.prepare(
+        data = MarketplaceIncidentToAlertPlaybooksPreparer.prepare(
             self,
             data,
             current_marketplace=current_marketplace,
             supported_marketplaces=self.marketplaces,
         )
+        self.prepared_data[current_marketplace] = data
+        return data
 
     @classmethod
     def _client_upload_method(cls, client: demisto_client) -> Callable:
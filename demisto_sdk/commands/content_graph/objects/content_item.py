@@ -1,7 +1,8 @@
 from abc import abstractmethod
+from copy import deepcopy
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union
 
 import demisto_client
 from packaging.version import Version
@@ -57,6 +58,14 @@ class ContentItem(BaseContent):
     pack: Any = Field(None, exclude=True, repr=False)
     support: str = ""
     is_silent: bool = False
+    # the data prepared in advance for several marketplaces, see `prepare_for_marketplaces`
+    marketplaces_data: Optional[Dict[MarketplaceVersions, dict]] = Field(
+        None, exclude=True, repr=False
+    )
+    # the data of the item as prepared for upload to each marketplace, see `get_prepared_data`
+    prepared_data: Dict[MarketplaceVersions, dict] = Field(
+        default_factory=dict, exclude=True, repr=False
+    )
 
     @validator("path", always=True)
     def validate_path(cls, v: Path, values) -> Path:
@@ -272,12 +281,47 @@ class ContentItem(BaseContent):
     ) -> dict:
         if not self.path.exists():
             raise FileNotFoundError(f"Could not find file {self.path}")
-        data = self.data
         logger.debug(f"preparing {self.path}")
+        if self.marketplaces_data and current_marketplace in self.marketplaces_data:
+            # the data of the marketplaces shares the parts which are the same in all of them, so it's copied
+            # before the marketplace specific changes
+            data = deepcopy(self.marketplaces_data.pop(current_marketplace))
+            data = replace_marketplace_references(
+                data, current_marketplace, str(self.path)
+            )
+        else:
+            # Replace incorrect marketplace references
+            data = replace_marketplace_references(
+                self.data, current_marketplace, str(self.path)
+            )
+            data = MarketplaceSuffixPreparer.prepare(data, current_marketplace)
+        self.prepared_data[current_marketplace] = data
+        return data
+
+    def get_prepared_data(self, marketplace: Optional[MarketplaceVersions]) -> dict:
+        """
+        The data of the item after it was prepared for upload to the marketplace, as the preparation does not modify
+        `data`. Returns `data` if the item was not prepared for the marketplace.
+
+        Args:
+            marketplace: The marketplace the item was prepared for.
+        """
+        if marketplace and marketplace in self.prepared_data:
+            return self.prepared_data[marketplace]
+        return self.data
+
+    def prepare_for_marketplaces(self, marketplaces: List[MarketplaceVersions]):
+        """
+        Prepares the marketplace specific fields of the item for all the given marketplaces at once, so the item is
+        read and traversed once for all of them, instead of once in each `prepare_for_upload` call.
 
-        # Replace incorrect marketplace references
-        data = replace_marketplace_references(data, current_marketplace, str(self.path))
-        return MarketplaceSuffixPreparer.prepare(data, current_marketplace)
+        Args:
+            marketplaces: The marketplaces the item will be prepared for.
+        """
+        if self.path.exists():
+            self.marketplaces_data = MarketplaceSuffixPreparer.prepare_for_marketplaces(
+                self.data, marketplaces
+            )
 
     def summary(
         self,
@@ -293,7 +337,7 @@ class ContentItem(BaseContent):
         """
         summary_res = self.dict(include=self.metadata_fields(), by_alias=True)
         if marketplace and marketplace != MarketplaceVersions.XSOAR:
-            data = self.data
+            data = self.get_prepared_data(marketplace)
             if "id" in summary_res:
                 summary_res["id"] = (
                     data.get("commonfields", {}).get("id") or self.object_id
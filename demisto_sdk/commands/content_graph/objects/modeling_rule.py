@@ -31,7 +31,9 @@ class ModelingRule(ContentItemXSIAM, content_type=ContentType.MODELING_RULE):  #
         incident_to_alert: bool = False,
     ) -> dict:
         summary = super().summary(marketplace, incident_to_alert)
-        summary["datasets"] = list(json.loads(self.data.get("schema") or "{}").keys())
+        summary["datasets"] = list(
+            json.loads(self.get_prepared_data(marketplace).get("schema") or "{}").keys()
+        )
         return summary
 
     def prepare_for_upload(
@@ -44,6 +46,7 @@ class ModelingRule(ContentItemXSIAM, content_type=ContentType.MODELING_RULE):  #
         else:
             data = self.data
         data = RuleUnifier.unify(self.path, data, current_marketplace)
+        self.prepared_data[current_marketplace] = data
         return data
 
     @staticmethod
@@ -1,14 +1,17 @@
 import shutil
+import time
+import zipfile
 from collections import defaultdict
 from functools import cached_property
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import demisto_client
 from demisto_client.demisto_api.rest import ApiException
 from packaging.version import Version, parse
 from pydantic import DirectoryPath, Field, validator
+from urllib3.exceptions import HTTPError
 
 from demisto_sdk.commands.common.constants import (
     BASE_PACK,
@@ -26,6 +29,7 @@ from demisto_sdk.commands.common.tools import (
     get_file,
     get_relative_path,
     write_dict,
+    write_dir_to_zip,
 )
 from demisto_sdk.commands.content_graph.common import (
     PACK_METADATA_FILENAME,
@@ -64,7 +68,9 @@ from demisto_sdk.commands.prepare_content.markdown_images_handler import (
 from demisto_sdk.commands.upload.constants import (
     CONTENT_TYPES_EXCLUDED_FROM_UPLOAD,
     MULTIPLE_ZIPPED_PACKS_FILE_NAME,
-    MULTIPLE_ZIPPED_PACKS_FILE_STEM,
+    TRANSIENT_UPLOAD_ERROR_STATUSES,
+    UPLOAD_RETRIES,
+    UPLOAD_RETRY_BACKOFF_SECONDS,
 )
 from demisto_sdk.commands.upload.exceptions import IncompatibleUploadVersionException
 from demisto_sdk.commands.upload.tools import (
@@ -80,6 +86,26 @@ MINIMAL_UPLOAD_SUPPORTED_VERSION = Version("6.5.0")
 MINIMAL_ALLOWED_SKIP_VALIDATION_VERSION = Version("6.6.0")
 
 
+def _upload_content_packs(client: demisto_client, path: Path, **server_kwargs):
+    """
+    Uploads a zip to the server, retrying (with an exponential backoff) when the server is temporarily unavailable
+    """
+    for attempt in range(1, UPLOAD_RETRIES + 1):
+        try:
+            return client.upload_content_packs(file=str(path), **server_kwargs)
+        except (ApiException, HTTPError) as error:
+            if attempt == UPLOAD_RETRIES or (
+                isinstance(error, ApiException)
+                and error.status not in TRANSIENT_UPLOAD_ERROR_STATUSES
+            ):
+                raise
+            delay = UPLOAD_RETRY_BACKOFF_SECONDS**attempt
+            logger.debug(
+                f"Failed uploading {path.name} (attempt {attempt}/{UPLOAD_RETRIES}): {error}, retrying in {delay} seconds"
+            )
+            time.sleep(delay)
+
+
 def upload_zip(
     path: Path,
     client: demisto_client,
@@ -108,10 +134,7 @@ def upload_zip(
     ):
         server_kwargs["skip_validation"] = "true"
 
-    response = client.upload_content_packs(
-        file=str(path),
-        **server_kwargs,
-    )
+    response = _upload_content_packs(client=client, path=path, **server_kwargs)
     if response is None:  # uploaded successfully
         return True
 
@@ -403,6 +426,48 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         except Exception:
             logger.exception(f"Failed dumping pack {self.name}")
             raise
+        finally:
+            # the prepared data is kept only for the summaries in the metadata, which is already dumped
+            for content_item in self.content_items:
+                content_item.prepared_data.pop(marketplace, None)
+
+    def dump_marketplaces(
+        self, paths: Dict[MarketplaceVersions, Path], tpb: bool = False
+    ):
+        """
+        Dumps the pack for several marketplaces.
+        The content items are read and prepared for all the marketplaces at once, instead of once per marketplace.
+
+        Args:
+            paths: The path to dump the pack to, for each of the marketplaces.
+            tpb: Whether to dump the test playbooks.
+        """
+        if len(paths) > 1:
+            content_types_excluded_from_upload = (
+                CONTENT_TYPES_EXCLUDED_FROM_UPLOAD.copy()
+            )
+            if tpb:
+                content_types_excluded_from_upload.discard(ContentType.TEST_PLAYBOOK)
+            for content_item in self.content_items:
+                if content_item.content_type in content_types_excluded_from_upload:
+                    continue
+                if (
+                    len(
+                        marketplaces := [
+                            marketplace
+                            for marketplace in paths
+                            if marketplace in content_item.marketplaces
+                        ]
+                    )
+                    > 1
+                ):
+                    content_item.prepare_for_marketplaces(marketplaces)
+        try:
+            for marketplace, path in paths.items():
+                self.dump(path, marketplace, tpb=tpb)
+        finally:
+            for content_item in self.content_items:
+                content_item.marketplaces_data = None
 
     def upload(
         self,
@@ -446,40 +511,51 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         # this should only be called from Pack.upload
         logger.debug(f"Uploading zipped pack {self.object_id}")
 
-        # 1) dump the pack into a temporary file
-        with TemporaryDirectory() as temp_dump_dir:
-            temp_dir_path = Path(temp_dump_dir)
-            self.dump(temp_dir_path, marketplace=marketplace, tpb=tpb)
+        with TemporaryDirectory() as temp_dir:
+            temp_dir_path = Path(temp_dir)
 
-            # 2) zip the dumped pack
-            with TemporaryDirectory() as pack_zips_dir:
-                pack_zip_path = Path(
-                    shutil.make_archive(
-                        str(Path(pack_zips_dir, self.name)), "zip", temp_dir_path
-                    )
-                )
-                str(pack_zip_path)
-
-                # 3) zip the zipped pack into uploadable_packs.zip under the result directory
-                try:
-                    shutil.make_archive(
-                        str(destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_STEM),
-                        "zip",
-                        pack_zips_dir,
-                    )
-                except Exception:
-                    logger.exception(
-                        f"Cannot write to {str(destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_NAME)}"
-                    )
+            # 1) dump the pack into a temporary directory
+            start_time = time.time()
+            dump_dir = temp_dir_path / self.name
+            self.dump(dump_dir, marketplace=marketplace, tpb=tpb)
+            dumped_size = sum(
+                path.stat().st_size for path in dump_dir.rglob("*") if path.is_file()
+            )
+            logger.debug(
+                f"Dumped pack {self.object_id} ({dumped_size} bytes) in {time.time() - start_time:.2f} seconds"
+            )
 
-                # upload the pack zip (not the result)
-                return upload_zip(
-                    path=pack_zip_path,
-                    client=client,
-                    target_demisto_version=target_demisto_version,
-                    skip_validations=skip_validations,
-                    marketplace=marketplace,
+            # 2) zip the dumped pack in a single pass.
+            # the zip is written to disk, as the client uploads it from a file path
+            start_time = time.time()
+            pack_zip_path = temp_dir_path / f"{self.name}.zip"
+            with zipfile.ZipFile(pack_zip_path, "w") as zip_file:
+                write_dir_to_zip(zip_file, dump_dir)
+            logger.debug(
+                f"Zipped pack {self.object_id} ({pack_zip_path.stat().st_size} bytes) in {time.time() - start_time:.2f} seconds"
+            )
+
+            # 3) add the zipped pack to uploadable_packs.zip under the result directory
+            start_time = time.time()
+            uploadable_zip_path = destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_NAME
+            try:
+                # the pack zip is already compressed
+                with zipfile.ZipFile(uploadable_zip_path, "w") as uploadable_zip:
+                    uploadable_zip.write(pack_zip_path, pack_zip_path.name)
+                logger.debug(
+                    f"Wrote {uploadable_zip_path} ({uploadable_zip_path.stat().st_size} bytes) in {time.time() - start_time:.2f} seconds"
                 )
+            except Exception:
+                logger.exception(f"Cannot write to {str(uploadable_zip_path)}")
+
+            # upload the pack zip (not the result)
+            return upload_zip(
+                path=pack_zip_path,
+                client=client,
+                target_demisto_version=target_demisto_version,
+                skip_validations=skip_validations,
+                marketplace=marketplace,
+            )
 
     def _upload_item_by_item(
         self,
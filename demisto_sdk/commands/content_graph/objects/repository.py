@@ -1,9 +1,11 @@
 import shutil
 import time
-from functools import lru_cache
+import zipfile
+from contextlib import ExitStack
+from functools import lru_cache, partial
 from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import tqdm
 from pydantic import BaseModel, DirectoryPath
@@ -12,10 +14,36 @@ from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    should_disable_multiprocessing,
+    write_dir_to_zip,
+)
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.parsers.repository import RepositoryParser
+from demisto_sdk.commands.prepare_content.integration_script_unifier import (
+    IntegrationScriptUnifier,
+)
+from demisto_sdk.commands.prepare_content.markdown_images_handler import (
+    merge_markdown_images_shards,
+)
 
-USE_MULTIPROCESSING = False  # toggle this for better debugging
+
+def dump_pack(pack: Pack, dirs: Dict[MarketplaceVersions, Path]) -> bool:
+    """
+    Dumps a single pack into the directory of each of the marketplaces, so a failure of one pack does not stop the
+    other packs from being dumped.
+
+    Returns:
+        bool: whether the pack was dumped successfully.
+    """
+    try:
+        pack.dump_marketplaces(
+            {marketplace: dir / pack.path.name for marketplace, dir in dirs.items()}
+        )
+        return True
+    except Exception:
+        # the error is logged by Pack.dump
+        return False
 
 
 @lru_cache
@@ -59,8 +87,54 @@ class ContentDTO(BaseModel):
         zip: bool = True,
         packs_to_dump: Optional[list] = None,
         output_stem: str = "content_packs",  # without extension
+        use_multiprocessing: bool = False,
     ):
-        dir.mkdir(parents=True, exist_ok=True)
+        """
+        Dumps the packs to the given directory.
+
+        Args:
+            dir: The directory to dump the packs to.
+            marketplace: The marketplace to dump the packs for.
+            zip: Whether to zip the dumped packs into `<output_stem>.zip` next to `dir` (removing `dir`).
+            packs_to_dump: The IDs of the packs to dump, all the packs if not given.
+            output_stem: The name of the zip file, without extension.
+            use_multiprocessing: Whether to dump the packs in a pool of processes.
+                The output is identical to dumping the packs one by one.
+        """
+        self.dump_marketplaces(
+            {marketplace: dir},
+            zip=zip,
+            packs_to_dump=packs_to_dump,
+            output_stem=output_stem,
+            use_multiprocessing=use_multiprocessing,
+        )
+
+    def dump_marketplaces(
+        self,
+        dirs: Dict[MarketplaceVersions, DirectoryPath],
+        zip: bool = True,
+        packs_to_dump: Optional[list] = None,
+        output_stem: str = "content_packs",  # without extension
+        use_multiprocessing: bool = False,
+    ):
+        """
+        Dumps the packs for several marketplaces in one go, each content item is read and prepared once for all of them.
+        The output is identical to dumping the packs for each of the marketplaces separately.
+
+        Args:
+            dirs: The directory to dump the packs to, for each of the marketplaces.
+            zip: Whether to zip the dumped packs of each marketplace into `<output_stem>.zip` next to its directory
+                (removing the directory).
+            packs_to_dump: The IDs of the packs to dump, all the packs if not given.
+            output_stem: The name of the zip files, without extension.
+            use_multiprocessing: Whether to dump the packs in a pool of processes.
+        """
+        if zip and len({dir.parent for dir in dirs.values()}) < len(dirs):
+            raise ValueError(
+                "The directories of the marketplaces must be in different parent directories, to zip them"
+            )
+        for dir in dirs.values():
+            dir.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Got packs to dump: {packs_to_dump}")
         packs_to_dump = (
             [pack for pack in self.packs if pack.object_id in packs_to_dump]
@@ -73,29 +147,78 @@ class ContentDTO(BaseModel):
             return
 
         logger.debug(
-            f"Starting repository dump for packs: {[pack.object_id for pack in packs_to_dump]}"
+            f"Starting repository dump for packs: {[pack.object_id for pack in packs_to_dump]}, "
+            f"marketplaces: {[marketplace.value for marketplace in dirs]}"
         )
         start_time = time.time()
-        if USE_MULTIPROCESSING:
+        dump = partial(dump_pack, dirs=dirs)
+        if use_multiprocessing and not should_disable_multiprocessing():
+            # expanded once here, the API modules are shared by all the forked workers
+            IntegrationScriptUnifier.cache_api_modules(Path(self.path).absolute())
             with Pool(processes=cpu_count()) as pool:
-                pool.starmap(
-                    Pack.dump,
-                    (
-                        (pack, dir / pack.path.name, marketplace)
-                        for pack in packs_to_dump
-                    ),
+                # imap keeps the order of the packs, and yields each result as soon as it (and the ones before it) are ready
+                failed_packs = self._collect_dumped_packs(
+                    packs_to_dump,
+                    pool.imap(dump, packs_to_dump),
+                    list(dirs.values()),
+                    zip,
+                    output_stem,
                 )
 
         else:
-            for pack in packs_to_dump:
-                pack.dump(dir / pack.path.name, marketplace)
-
+            failed_packs = self._collect_dumped_packs(
+                packs_to_dump,
+                map(dump, packs_to_dump),
+                list(dirs.values()),
+                zip,
+                output_stem,
+            )
+
+        merge_markdown_images_shards()
         time_taken = time.time() - start_time
         logger.debug(f"Repository dump ended. Took {time_taken} seconds")
 
-        if zip:
-            shutil.make_archive(str(dir.parent / output_stem), "zip", dir)
+        if failed_packs:
+            raise RuntimeError(f"Failed dumping the packs: {', '.join(failed_packs)}")
+
+    @staticmethod
+    def _collect_dumped_packs(
+        packs: List[Pack],
+        results: Iterable[bool],
+        dirs: List[Path],
+        should_zip: bool,
+        output_stem: str,
+    ) -> List[str]:
+        """
+        Collects the packs as they are dumped, streaming each pack into the zip files (if needed) once it is dumped.
+
+        Returns:
+            List[str]: the IDs of the packs which failed to be dumped.
+        """
+        if not should_zip:
+            return [
+                pack.object_id for pack, success in zip(packs, results) if not success
+            ]
+
+        failed_packs = []
+        with ExitStack() as stack:
+            zip_files = [
+                stack.enter_context(
+                    zipfile.ZipFile(dir.parent / f"{output_stem}.zip", "w")
+                )
+                for dir in dirs
+            ]
+            for pack, success in zip(packs, results):
+                if not success:
+                    failed_packs.append(pack.object_id)
+                for dir, zip_file in zip(dirs, zip_files):
+                    pack_dir = dir / pack.path.name
+                    if success and pack_dir.exists():
+                        write_dir_to_zip(zip_file, pack_dir, dir)
+                    shutil.rmtree(pack_dir, ignore_errors=True)
+        for dir in dirs:
             shutil.rmtree(dir)
+        return failed_packs
 
     class Config:
         orm_mode = True
@@ -1197,6 +1197,44 @@ class TestParsersAndModels:
         )
         assert not model.is_test
 
+    def test_playbook_summary_after_prepare_for_upload(self, pack: Pack):
+        """
+        Given:
+            - A pack with a playbook which has a marketplacev2 specific description mentioning incidents.
+        When:
+            - Preparing the playbook for upload to xsoar and to marketplacev2, and getting its summaries.
+        Then:
+            - Verify the summary of each marketplace has the description prepared for that marketplace.
+            - Verify the data of the playbook is not modified by the preparation.
+        """
+        from demisto_sdk.commands.content_graph.objects.playbook import Playbook
+        from demisto_sdk.commands.content_graph.parsers.playbook import PlaybookParser
+
+        playbook = pack.create_playbook()
+        playbook.create_default_playbook(name="sample")
+        playbook.yml.update(
+            {
+                "description": "xsoar description",
+                "description:marketplacev2": "xsiam description of <-incident->",
+            }
+        )
+        model = Playbook.from_orm(
+            PlaybookParser(Path(playbook.path), list(MarketplaceVersions))
+        )
+
+        model.prepare_for_upload(current_marketplace=MarketplaceVersions.XSOAR)
+        model.prepare_for_upload(current_marketplace=MarketplaceVersions.MarketplaceV2)
+
+        assert (
+            model.summary(MarketplaceVersions.XSOAR)["description"]
+            == "xsoar description"
+        )
+        assert (
+            model.summary(MarketplaceVersions.MarketplaceV2)["description"]
+            == "xsiam description of incident"
+        )
+        assert "description:marketplacev2" in model.data
+
     def test_report_parser(self, pack: Pack):
         """
         Given:
@@ -1775,6 +1813,120 @@ class TestParsersAndModels:
         pack_ids = {pack.object_id for pack in model.packs}
         assert pack_ids == {"sample1", "sample2"}
 
+    def test_repo_dump_multiprocessing(self, mocker, repo: Repo, tmp_path: Path):
+        """
+        Given:
+            - A repository with two packs.
+        When:
+            - Dumping the repository into a zip, once pack by pack and once in a pool of processes.
+        Then:
+            - Verify both zip files are identical and contain both packs.
+        """
+        import zipfile
+
+        from demisto_sdk.commands.content_graph.objects import repository
+        from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+        from demisto_sdk.commands.content_graph.parsers.repository import (
+            RepositoryParser,
+        )
+
+        for pack_name in ("sample1", "sample2"):
+            pack = repo.create_pack(pack_name)
+            pack.pack_metadata.write_json(load_json("pack_metadata.json"))
+            pack.create_script(f"{pack_name}_script")
+        mocker.patch.object(PackParser, "parse_ignored_errors", return_value={})
+        mocker.patch.object(
+            repository, "should_disable_multiprocessing", return_value=False
+        )
+        parser = RepositoryParser(Path(repo.path))
+        parser.parse()
+        model = ContentDTO.from_orm(parser)
+
+        model.dump(
+            tmp_path / "sequential" / "packs",
+            MarketplaceVersions.XSOAR,
+            output_stem="content_packs",
+        )
+        model.dump(
+            tmp_path / "parallel" / "packs",
+            MarketplaceVersions.XSOAR,
+            output_stem="content_packs",
+            use_multiprocessing=True,
+        )
+
+        sequential_zip = tmp_path / "sequential" / "content_packs.zip"
+        parallel_zip = tmp_path / "parallel" / "content_packs.zip"
+        assert sequential_zip.read_bytes() == parallel_zip.read_bytes()
+        assert not (tmp_path / "parallel" / "packs").exists()
+        with zipfile.ZipFile(parallel_zip) as zip_file:
+            names = zip_file.namelist()
+        assert "sample1/metadata.json" in names
+        assert "sample2/Scripts/script-sample2_script.yml" in names
+
+    def test_repo_dump_marketplaces(self, mocker, repo: Repo, tmp_path: Path):
+        """
+        Given:
+            - A repository with a script which has marketplace specific fields.
+        When:
+            - Dumping the repository for several marketplaces at once, and for each of the marketplaces separately.
+        Then:
+            - Verify the dumped packs of each marketplace are the same in both cases.
+            - Verify the prepared data of the content items is not kept once the packs are dumped.
+        """
+        from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+        from demisto_sdk.commands.content_graph.parsers.repository import (
+            RepositoryParser,
+        )
+
+        pack = repo.create_pack("sample")
+        pack.pack_metadata.write_json(load_json("pack_metadata.json"))
+        script = pack.create_script("sample_script")
+        script.yml.update(
+            {
+                "comment": "A Cortex XSOAR script",
+                "comment:marketplacev2": "A marketplacev2 script",
+                "tags": ["Cortex XSOAR"],
+            }
+        )
+        mocker.patch.object(PackParser, "parse_ignored_errors", return_value={})
+        parser = RepositoryParser(Path(repo.path))
+        parser.parse()
+        model = ContentDTO.from_orm(parser)
+        marketplaces = [MarketplaceVersions.XSOAR, MarketplaceVersions.MarketplaceV2]
+
+        model.dump_marketplaces(
+            {
+                marketplace: tmp_path / "together" / marketplace.value
+                for marketplace in marketplaces
+            },
+            zip=False,
+        )
+        for marketplace in marketplaces:
+            model.dump(
+                tmp_path / "separately" / marketplace.value, marketplace, zip=False
+            )
+
+        dumped_script = Path("sample", "Scripts", "script-sample_script.yml")
+        for marketplace in marketplaces:
+            assert (
+                tmp_path / "together" / marketplace.value / dumped_script
+            ).read_text() == (
+                tmp_path / "separately" / marketplace.value / dumped_script
+            ).read_text()
+        xsoar_script = tools.get_yaml(tmp_path / "together" / "xsoar" / dumped_script)
+        assert xsoar_script["comment"] == "A Cortex XSOAR script"
+        assert xsoar_script["tags"] == ["Cortex XSOAR"]
+        xsiam_script = tools.get_yaml(
+            tmp_path / "together" / "marketplacev2" / dumped_script
+        )
+        assert xsiam_script["comment"] == "A marketplacev2 script"
+        assert xsiam_script["tags"] == ["Cortex"]
+        assert not any(
+            content_item.prepared_data
+            for pack in model.packs
+            for content_item in pack.content_items
+        )
+
     def test_lazy_properties_in_the_model(self, mocker, pack):
         """
         Given:
@@ -0,0 +1,132 @@
+import hashlib
+import shutil
+from pathlib import Path
+from typing import Dict
+from zipfile import ZipFile
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import get_sdk_version, write_dict
+
+ARTIFACTS_MANIFEST_FILE_NAME = "artifacts_manifest.json"
+PREVIOUS_CONTENT_PACKS_DIR = "previous_content_packs"
+
+
+def hash_dir_files(dir_path: Path) -> Dict[str, str]:
+    """Calculate the md5 hash of every file under the given directory.
+
+    Args:
+        dir_path: The directory to hash.
+
+    Returns:
+        Dict[str, str]: The hash of every file, keyed by its posix path relative to the directory.
+    """
+    return {
+        path.relative_to(dir_path).as_posix(): hashlib.md5(
+            path.read_bytes()
+        ).hexdigest()
+        for path in sorted(dir_path.rglob("*"))
+        if path.is_file()
+    }
+
+
+def hash_dir(dir_path: Path) -> str:
+    """Calculate a single md5 hash of all the files under the given directory.
+
+    Args:
+        dir_path: The directory to hash.
+
+    Returns:
+        str: The hash of the directory.
+    """
+    return hashlib.md5(
+        json.dumps(hash_dir_files(dir_path), sort_keys=True).encode()
+    ).hexdigest()
+
+
+class ArtifactsManifest:
+    def __init__(
+        self,
+        artifacts_path: Path,
+        content_packs_path: Path,
+        uploadable_zips_path: Path,
+        config: dict,
+    ):
+        """Manifest of the created content packs artifacts.
+        Records, per pack, the hashes of the pack's input files and of the artifacts created for it, so the next
+        runs only dump the packs whose inputs changed, and copy the rest from the previous artifacts.
+
+        Args:
+            artifacts_path: The artifacts destination directory, where the manifest is kept.
+            content_packs_path: The directory the packs are dumped to.
+            uploadable_zips_path: The directory of the pack zips, used when the previous dumped packs were deleted.
+            config: The artifacts creation configuration, all the previous artifacts are dropped when it changes.
+        """
+        self.path = artifacts_path / ARTIFACTS_MANIFEST_FILE_NAME
+        self.content_packs_path = content_packs_path
+        self.previous_content_packs_path = artifacts_path / PREVIOUS_CONTENT_PACKS_DIR
+        self.uploadable_zips_path = uploadable_zips_path
+        self.config = {"sdk_version": get_sdk_version(), **config}
+        self.packs: Dict[str, dict] = {}
+
+        previous_manifest = (
+            json.loads(self.path.read_text()) if self.path.exists() else {}
+        )
+        if previous_manifest.get("config") == self.config:
+            self.previous_packs: Dict[str, dict] = previous_manifest.get("packs", {})
+        else:
+            if previous_manifest:
+                logger.info(
+                    "The artifacts configuration or the SDK version changed, dumping all packs"
+                )
+            self.previous_packs = {}
+
+    def stash_previous_artifacts(self):
+        """Keep the previous dumped packs aside, as the artifacts directories are deleted before dumping."""
+        shutil.rmtree(self.previous_content_packs_path, ignore_errors=True)
+        if self.content_packs_path.exists():
+            self.content_packs_path.rename(self.previous_content_packs_path)
+
+    def restore_unchanged_pack(self, pack_id: str, pack_path: Path) -> bool:
+        """Copy the previous artifacts of a pack, if its input files didn't change since they were created.
+
+        Args:
+            pack_id: The pack id, which is the name of its artifacts directory.
+            pack_path: The pack source directory.
+
+        Returns:
+            bool: True if the artifacts of the pack were restored, False if the pack should be dumped.
+        """
+        inputs = hash_dir_files(pack_path)
+        self.packs[pack_id] = {"inputs": inputs}
+
+        previous_pack = self.previous_packs.get(pack_id)
+        if not previous_pack or previous_pack.get("inputs") != inputs:
+            return False
+
+        dumped_pack_path = self.content_packs_path / pack_id
+        if (previous_dump := self.previous_content_packs_path / pack_id).is_dir():
+            shutil.copytree(previous_dump, dumped_pack_path)
+        elif (previous_zip := self.uploadable_zips_path / f"{pack_id}.zip").is_file():
+            with ZipFile(previous_zip) as zip_file:
+                zip_file.extractall(dumped_pack_path)
+        else:
+            return False
+
+        if hash_dir_files(dumped_pack_path) != previous_pack.get("outputs"):
+            logger.debug(f"The previous artifacts of {pack_id} were modified")
+            shutil.rmtree(dumped_pack_path)
+            return False
+
+        self.packs[pack_id]["outputs"] = previous_pack["outputs"]
+        logger.debug(f"Pack {pack_id} did not change, copied its previous artifacts")
+        return True
+
+    def save(self):
+        """Record the artifacts of the dumped packs, and write the manifest."""
+        for pack_id, pack in self.packs.items():
+            if "outputs" not in pack:
+                pack["outputs"] = hash_dir_files(self.content_packs_path / pack_id)
+
+        write_dict(self.path, {"config": self.config, "packs": self.packs}, indent=4)
+        shutil.rmtree(self.previous_content_packs_path, ignore_errors=True)
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import re
 import sys
@@ -70,6 +71,7 @@ from demisto_sdk.commands.common.content.objects.pack_objects import (
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import arg_to_list, open_id_set_file
 
+from .artifacts_manifest import ArtifactsManifest, hash_dir
 from .artifacts_report import ArtifactsReport, ObjectReport
 
 ####################
@@ -188,6 +190,7 @@ class ArtifactsManager:
         remove_test_playbooks: bool = True,
         filter_by_id_set: bool = False,
         alternate_fields: bool = False,
+        incremental: bool = False,
         **kwargs,
     ):
         """Content artifacts configuration
@@ -205,6 +208,7 @@ class ArtifactsManager:
             signature_key: Base64 encoded signature key used for signing packs.
             sign_directory: Path to the signDirectory executable file.
             remove_test_playbooks: Should remove test playbooks from content packs or not.
+            incremental: Dump only the packs whose files changed since the previous run, copy the rest.
         """
         # options arguments
         self.artifacts_path = Path(artifacts_path)
@@ -251,7 +255,24 @@ class ArtifactsManager:
                     )
                 )
 
+        self.manifest: Optional[ArtifactsManifest] = None
+        if incremental:
+            if self.only_content_packs and not self.suffix and not self.signature_key:
+                self.manifest = ArtifactsManifest(
+                    artifacts_path=self.artifacts_path,
+                    content_packs_path=self.content_packs_path,
+                    uploadable_zips_path=self.content_uploadable_zips_path,
+                    config=self.get_manifest_config(),
+                )
+            else:
+                logger.warning(
+                    "Incremental artifacts creation is only supported for content packs artifacts, "
+                    "without a suffix or signing. Dumping all packs."
+                )
+
     def create_content_artifacts(self) -> int:
+        if self.manifest:
+            self.manifest.stash_previous_artifacts()
         with ArtifactsDirsHandler(self), ProcessPoolHandler(self) as pool:
             futures: List[ProcessFuture] = []
             # content/Packs
@@ -267,12 +288,48 @@ class ArtifactsManager:
             wait_futures_complete(futures, self)
             # Add suffix
             suffix_handler(self)
+            if self.manifest:
+                self.manifest.save()
 
         Path("keyfile").unlink(missing_ok=True)
         logger.info(f"\nExecution time: {time.time() - self.execution_start} seconds")
 
         return self.exit_code
 
+    def get_manifest_config(self) -> dict:
+        """
+
+        Returns:
+            the configuration the packs artifacts depend on, besides the files of the packs themselves
+        """
+        api_modules_path = self.content.path / PACKS_DIR / "ApiModules"
+        id_set_path = Path(self.id_set_path)
+        return {
+            "marketplace": self.marketplace,
+            "content_version": self.content_version,
+            "remove_test_playbooks": self.remove_test_playbooks,
+            "filter_by_id_set": self.filter_by_id_set,
+            "alternate_fields": self.alternate_fields,
+            # API modules code is unified into the integrations and scripts using it
+            "api_modules": hash_dir(api_modules_path),
+            "id_set": hashlib.md5(id_set_path.read_bytes()).hexdigest()
+            if self.id_set and id_set_path.is_file()
+            else "",
+        }
+
+    def restore_unchanged_pack(self, pack: Pack) -> bool:
+        """
+
+        Args:
+            pack: the pack to restore
+
+        Returns:
+            whether the pack artifacts were copied from the previous run, so the pack should not be dumped
+        """
+        if not self.manifest:
+            return False
+        return self.manifest.restore_unchanged_pack(pack.id, pack.path)
+
     def get_relative_pack_path(self, content_object: ContentObject):
         """
 
@@ -929,12 +986,21 @@ def dump_packs(
     futures = []
     if "all" in artifact_manager.pack_names:
         for pack_name, pack in artifact_manager.packs.items():
-            if pack_name not in IGNORED_PACKS:
+            if (
+                pack_name not in IGNORED_PACKS
+                and not artifact_manager.restore_unchanged_pack(pack)
+            ):
                 futures.append(pool.schedule(dump_pack, args=(artifact_manager, pack)))
 
     else:
         for pack_name in artifact_manager.pack_names:
-            if pack_name not in IGNORED_PACKS and pack_name in artifact_manager.packs:
+            if (
+                pack_name not in IGNORED_PACKS
+                and pack_name in artifact_manager.packs
+                and not artifact_manager.restore_unchanged_pack(
+                    artifact_manager.packs[pack_name]
+                )
+            ):
                 futures.append(
                     pool.schedule(
                         dump_pack,
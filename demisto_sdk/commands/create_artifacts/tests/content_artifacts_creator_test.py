@@ -250,6 +250,61 @@ def test_create_content_artifacts(mock_git):
         assert same_folders(temp, ARTIFACTS_EXPECTED_RESULTS / "content")
 
 
+def test_create_content_artifacts_incremental(mock_git, mocker):
+    """
+    Given
+    - Content packs artifacts created incrementally.
+
+    When
+    - Creating them again, before and after one of the packs changed.
+
+    Then
+    - Ensure only the changed pack is dumped, and the rest are copied from the previous artifacts.
+    - Ensure the artifacts are the same as when dumping all the packs.
+    """
+    from demisto_sdk.commands.create_artifacts.artifacts_manifest import (
+        ARTIFACTS_MANIFEST_FILE_NAME,
+        ArtifactsManifest,
+    )
+    from demisto_sdk.commands.create_artifacts.content_artifacts_creator import (
+        ArtifactsManager,
+    )
+
+    restore_spy = mocker.spy(ArtifactsManifest, "restore_unchanged_pack")
+
+    def create_artifacts(temp: Path) -> List[bool]:
+        previous_calls = len(restore_spy.spy_return_list)
+        config = ArtifactsManager(
+            artifacts_path=temp,
+            content_version="6.0.0",
+            zip=False,
+            suffix="",
+            cpus=1,
+            packs=True,
+            incremental=True,
+        )
+        assert config.create_content_artifacts() == 0
+        return restore_spy.spy_return_list[previous_calls:]
+
+    changed_file = TEST_CONTENT_REPO / PACKS_DIR / "Sample01" / "CHANGELOG.md"
+    old_data = changed_file.read_text()
+    with temp_dir() as temp:
+        assert create_artifacts(temp) == [False, False]
+        assert (temp / ARTIFACTS_MANIFEST_FILE_NAME).exists()
+
+        assert create_artifacts(temp) == [True, True]
+        assert same_folders(
+            temp / "content_packs",
+            ARTIFACTS_EXPECTED_RESULTS / "content" / "content_packs",
+        )
+
+        try:
+            changed_file.write_text(f"{old_data}\n")
+            assert create_artifacts(temp) == [False, True]
+        finally:
+            changed_file.write_text(old_data)
+
+
 def test_create_content_artifacts_by_id_set(mock_git):
     """
 
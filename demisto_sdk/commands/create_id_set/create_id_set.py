@@ -26,6 +26,7 @@ class IDSetCreator:
         print_logs: bool = True,
         fail_duplicates: bool = False,
         marketplace: str = "",
+        incremental: bool = False,
         **kwargs,
     ):
         """IDSetCreator
@@ -36,6 +37,8 @@ class IDSetCreator:
             print_logs (bool, optional): Print log output. Defaults to True.
             fail_duplicates(bool, optional): Flag which marks whether create_id_set fails when duplicates
              are found or not
+            incremental (bool, optional): Process only the content items which changed since the previous id set
+             creation. Defaults to False.
         """
         self.output = output
         self.input = input
@@ -43,6 +46,7 @@ class IDSetCreator:
         self.fail_duplicates = fail_duplicates
         self.id_set = OrderedDict()  # type: ignore
         self.marketplace = marketplace.lower()
+        self.incremental = incremental
 
     def create_id_set(self):
         self.id_set, excluded_items_by_pack, excluded_items_by_type = re_create_id_set(
@@ -51,6 +55,7 @@ class IDSetCreator:
             print_logs=self.print_logs,
             fail_on_duplicates=self.fail_duplicates,
             marketplace=self.marketplace,
+            incremental=self.incremental,
         )
 
         self.add_command_to_implementing_integrations_mapping()
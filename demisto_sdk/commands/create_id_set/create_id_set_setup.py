@@ -39,6 +39,14 @@ def create_id_set(
             "each pack. Default is all packs exists in the content repository."
         ),
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help=(
+            "Process only the content items which changed since the previous id set creation, "
+            "and take the rest from a local cache."
+        ),
+    ),
     console_log_threshold: str = typer.Option(
         None,
         "--console-log-threshold",
@@ -59,6 +67,7 @@ def create_id_set(
         "output": output,
         "fail_duplicates": fail_duplicates,
         "marketplace": marketplace,
+        "incremental": incremental,
     }
 
     update_command_args_from_config_file("create-id-set", kwargs)
@@ -1,9 +1,11 @@
 import os
 import shutil
 from collections import OrderedDict
+from multiprocessing.pool import Pool
 from pathlib import Path
 from tempfile import mkdtemp
 
+from demisto_sdk.commands.common import id_set_cache
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
@@ -301,6 +303,51 @@ def test_create_id_set_flow_xpanse(repo, monkeypatch):
             assert len(entity_content_in_id_set)
 
 
+def test_create_id_set_incremental(repo, mocker, tmp_path):
+    """
+    Given
+        A content repo, with an id set created incrementally.
+    When
+        Creating the id set incrementally again, before and after a script is modified.
+    Then
+        Make sure only the modified script is processed again, and the id set is the same as a full creation.
+    """
+    mocker.patch.dict(os.environ, {"DEMISTO_SDK_ID_SET_REFRESH_INTERVAL": "-1"})
+    mocker.patch.object(id_set_cache, "ID_SET_CACHE_DIR", tmp_path)
+    repo.setup_content_repo(2)
+    script = repo.packs[0].scripts[0]
+    pool_map_spy = mocker.spy(Pool, "map")
+
+    with ChangeCWD(repo.path):
+        IDSetCreator(
+            repo.id_set.path, print_logs=False, incremental=True
+        ).create_id_set()
+        first_id_set = repo.id_set.read_json_as_dict()
+        assert any(call.args[2] for call in pool_map_spy.call_args_list)
+
+        pool_map_spy.reset_mock()
+        IDSetCreator(
+            repo.id_set.path, print_logs=False, incremental=True
+        ).create_id_set()
+        assert repo.id_set.read_json_as_dict() == first_id_set
+        assert not any(call.args[2] for call in pool_map_spy.call_args_list)
+
+        script.yml.update({"name": "Modified script"})
+        pool_map_spy.reset_mock()
+        IDSetCreator(
+            repo.id_set.path, print_logs=False, incremental=True
+        ).create_id_set()
+        incremental_id_set = repo.id_set.read_json_as_dict()
+        assert [
+            call.args[2] for call in pool_map_spy.call_args_list if call.args[2]
+        ] == [[os.path.relpath(script.path, repo.path)]]
+
+        IDSetCreator(repo.id_set.path, print_logs=False).create_id_set()
+        assert repo.id_set.read_json_as_dict() == incremental_id_set
+
+    assert incremental_id_set != first_id_set
+
+
 def setup_id_set():
     integration1 = {
         "Integration1": OrderedDict(
@@ -1,3 +1,6 @@
+import hashlib
+import math
+import multiprocessing
 import os
 import re
 import ssl
@@ -8,10 +11,15 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 import nltk
+import spellchecker
 from nltk.corpus import brown, webtext
 from spellchecker import SpellChecker
 
-from demisto_sdk.commands.common.constants import PACKS_PACK_IGNORE_FILE_NAME, FileType
+from demisto_sdk.commands.common.constants import (
+    CACHE_DIR,
+    PACKS_PACK_IGNORE_FILE_NAME,
+    FileType,
+)
 from demisto_sdk.commands.common.content import (
     Content,
     Integration,
@@ -24,16 +32,21 @@ from demisto_sdk.commands.common.content.objects.abstract_objects import TextObj
 from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.yaml_content_object import (
     YAMLContentObject,
 )
+from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     add_default_pack_known_words,
     find_type,
     is_xsoar_supported_pack,
+    should_disable_multiprocessing,
 )
 from demisto_sdk.commands.doc_reviewer.known_words import KNOWN_WORDS
 from demisto_sdk.commands.doc_reviewer.rn_checker import ReleaseNotesChecker
 
 CAMEL_CASE_MATCH = re.compile(".+?(?:(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|$)")
+DICTIONARY_CACHE_DIR = CACHE_DIR / "doc-review"
+MIN_FILES_FOR_MULTIPROCESSING = 20
 
 
 def replace_escape_characters(sentence: str, replace_with: str = " ") -> str:
@@ -101,10 +114,12 @@ class DocReviewer:
         )
         self.load_known_words_from_pack = load_known_words_from_pack
         self.known_pack_words_file_path = ""
+        # the pack's known words which were added to the spellchecker on top of its dictionary
+        self.pack_known_words: Set[str] = set()
 
         self.is_xsoar_supported_rn_only: bool = xsoar_only
         self.files: List[str] = []
-        self.spellchecker = SpellChecker()
+        self._spellchecker: Optional[SpellChecker] = None
         self.unknown_words: dict = {}
         self.no_camel_case = no_camel_case
         self.found_misspelled = False
@@ -114,6 +129,19 @@ class DocReviewer:
         self.files_without_misspells: set = set()
         self.malformed_rn_files: set = set()
 
+    def __getstate__(self):
+        # the workers load the spellchecker from the cached dictionary rather than copying it
+        state = self.__dict__.copy()
+        state["_spellchecker"] = None
+        state["git_util"] = None
+        return state
+
+    @property
+    def spellchecker(self) -> SpellChecker:
+        if self._spellchecker is None:
+            self._spellchecker = self.load_spellchecker()
+        return self._spellchecker
+
     @staticmethod
     def find_known_words_from_pack(file_path: str) -> Tuple[str, list]:
         """Find known words in file_path's pack.
@@ -294,27 +322,44 @@ class DocReviewer:
             logger.info("Could not find any relevant files - Aborting.")
             return True
 
-        self.add_known_words()
-
+        files = []
         for file in self.files:
-            logger.info(f"\nChecking file {file}")
-
             # --xsoar-only flag is specified.
             if self.is_xsoar_supported_rn_only and not is_xsoar_supported_pack(file):
                 logger.info(
                     f"<yellow>File '{file}' was skipped because it does not belong to an XSOAR-supported Pack</yellow>"
                 )
                 continue
+            files.append(file)
 
-            restarted_spellchecker = self.update_known_words_from_pack(file)
-            if restarted_spellchecker:
-                self.add_known_words()
-            self.unknown_words = {}
-            if file.endswith(".md"):
-                self.check_md_file(file)
+        if (
+            len(files) < MIN_FILES_FOR_MULTIPROCESSING
+            or should_disable_multiprocessing()
+        ):
+            files_results = self.check_files(files)
+        else:
+            if not self.get_dictionary_cache_path().exists():
+                # build and cache the dictionary once, for all the workers to load
+                self.load_spellchecker()
+            chunk_size = math.ceil(len(files) / cpu_count())
+            with multiprocessing.Pool(processes=cpu_count()) as pool:
+                files_results = [
+                    file_result
+                    for chunk_results in pool.map(
+                        self.check_files,
+                        [
+                            files[i : i + chunk_size]
+                            for i in range(0, len(files), chunk_size)
+                        ],
+                    )
+                    for file_result in chunk_results
+                ]
 
-            elif file.endswith(".yml"):
-                self.check_yaml(file)
+        for file, unknown_words, is_malformed_rn in files_results:
+            logger.info(f"\nChecking file {file}")
+            self.unknown_words = unknown_words
+            if is_malformed_rn:
+                self.malformed_rn_files.add(file)
 
             if self.unknown_words:
                 logger.info(
@@ -334,15 +379,36 @@ class DocReviewer:
 
         return True
 
-    def update_known_words_from_pack(self, file_path: str) -> bool:
+    def check_files(self, files: List[str]) -> List[Tuple[str, dict, bool]]:
+        """Runs spell-check on the given files.
+
+        Args:
+            files: The paths of the files to check.
+
+        Returns:
+            list. (file path, unknown words, whether it is a malformed release notes file) for each of the files.
+        """
+        files_results = []
+        for file in files:
+            self.update_known_words_from_pack(file)
+            self.unknown_words = {}
+            if file.endswith(".md"):
+                self.check_md_file(file)
+
+            elif file.endswith(".yml"):
+                self.check_yaml(file)
+
+            files_results.append(
+                (file, self.unknown_words, file in self.malformed_rn_files)
+            )
+        return files_results
+
+    def update_known_words_from_pack(self, file_path: str) -> None:
         """Update spellchecker with the file's pack's known words.
 
         Args:
             file_path: The path of the file to update the spellchecker with the packs known words.
-
-        Return True if spellchecker was restarted, False otherwise
         """
-        restarted_spellchecker = False
         if self.load_known_words_from_pack:
             known_pack_words_file_path, known_words = self.find_known_words_from_pack(
                 file_path
@@ -351,29 +417,76 @@ class DocReviewer:
                 logger.info(
                     f"\n<yellow>Using known words file found within pack: {known_pack_words_file_path}</yellow>"
                 )
-                if self.known_pack_words_file_path:
-                    # Restart Spellchecker to remove old known_words packs file
-                    self.spellchecker = SpellChecker()
-                    self.known_pack_words_file_path = ""
-                    restarted_spellchecker = True
-
-            if known_pack_words_file_path:
+                # Remove the words of the old known_words packs file
+                self.spellchecker.word_frequency.remove_words(self.pack_known_words)
+                self.pack_known_words = set()
                 self.known_pack_words_file_path = known_pack_words_file_path
-                if known_words:
-                    # Add the new known_words packs file
-                    self.spellchecker.word_frequency.load_words(known_words)
 
-        return restarted_spellchecker
+                if known_pack_words_file_path and known_words:
+                    # Add the new known_words packs file, only the words that are not in the dictionary already
+                    # so they can be removed once the pack changes.
+                    self.pack_known_words = self.spellchecker.unknown(known_words)
+                    self.spellchecker.word_frequency.load_words(self.pack_known_words)
+
+    def get_dictionary_cache_path(self) -> Path:
+        """The path of the cached dictionary, which is unique to the known words the dictionary was built with."""
+        dictionary_hash = hashlib.md5()
+        dictionary_hash.update(spellchecker.__version__.encode())
+        dictionary_hash.update("\n".join(KNOWN_WORDS).encode())
+        for known_words_file_path in self.known_words_file_paths:
+            dictionary_hash.update(Path(known_words_file_path).read_bytes())
+        if self.expand_dictionary:
+            dictionary_hash.update(f"nltk-{nltk.__version__}".encode())
+        return DICTIONARY_CACHE_DIR / f"dictionary-{dictionary_hash.hexdigest()}.json"
+
+    def load_spellchecker(self) -> SpellChecker:
+        """Load a spellchecker with the known words.
+
+        The spellchecker's dictionary is cached once built, and loaded from the cache as long as the known words
+        (and the expanded dictionary) it was built with did not change.
+        """
+        dictionary_cache_path = self.get_dictionary_cache_path()
+        if dictionary_cache_path.exists():
+            try:
+                word_frequencies = json.loads(dictionary_cache_path.read_text())
+            except ValueError:
+                logger.debug(
+                    f"Could not load the cached dictionary {dictionary_cache_path}, rebuilding it."
+                )
+            else:
+                spell_checker = SpellChecker(language=None)
+                spell_checker.word_frequency.load_json(word_frequencies)
+                return spell_checker
+
+        spell_checker = SpellChecker()
+        self.add_known_words(spell_checker)
+        try:
+            DICTIONARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for old_dictionary_cache_path in DICTIONARY_CACHE_DIR.glob(
+                "dictionary-*.json"
+            ):
+                old_dictionary_cache_path.unlink(missing_ok=True)
+            # write to a temporary file first, so a concurrent run never loads a partially written dictionary
+            temp_dictionary_cache_path = dictionary_cache_path.with_suffix(
+                f".{os.getpid()}.tmp"
+            )
+            temp_dictionary_cache_path.write_text(
+                json.dumps(dict(spell_checker.word_frequency.dictionary))
+            )
+            temp_dictionary_cache_path.replace(dictionary_cache_path)
+        except OSError as error:
+            logger.debug(f"Could not cache the dictionary: {error}")
+        return spell_checker
 
-    def add_known_words(self):
+    def add_known_words(self, spell_checker: SpellChecker):
         """Add known words to the spellchecker from external and internal files"""
         # adding known words file if given - these words will not count as misspelled
         if self.known_words_file_paths:
             for known_words_file_path in self.known_words_file_paths:
-                self.spellchecker.word_frequency.load_text_file(known_words_file_path)
+                spell_checker.word_frequency.load_text_file(known_words_file_path)
 
         # adding the KNOWN_WORDS to the spellchecker recognized words.
-        self.spellchecker.word_frequency.load_words(KNOWN_WORDS)
+        spell_checker.word_frequency.load_words(KNOWN_WORDS)
 
         if self.expand_dictionary:
             # nltk - natural language tool kit - is a large package containing several dictionaries.
@@ -395,8 +508,8 @@ class DocReviewer:
             nltk.download("webtext")
 
             # adding nltk's word set to spellchecker.
-            self.spellchecker.word_frequency.load_words(brown.words())
-            self.spellchecker.word_frequency.load_words(webtext.words())
+            spell_checker.word_frequency.load_words(brown.words())
+            spell_checker.word_frequency.load_words(webtext.words())
 
     @staticmethod
     def remove_punctuation(word):
@@ -6,9 +6,23 @@ import pytest
 
 from demisto_sdk.commands.common.constants import PACK_SUPPORT_OPTIONS, XSOAR_SUPPORT
 from demisto_sdk.commands.common.tools import PACK_METADATA_SUPPORT
+from demisto_sdk.commands.doc_reviewer import doc_reviewer
 from TestSuite.pack import Pack
 
 
+@pytest.fixture(scope="session")
+def dictionary_cache_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("doc-review")
+
+
+@pytest.fixture(autouse=True)
+def mock_dictionary_cache_dir(monkeypatch, dictionary_cache_dir):
+    """
+    Cache the doc-review dictionary in a temporary directory rather than in the user's cache directory.
+    """
+    monkeypatch.setattr(doc_reviewer, "DICTIONARY_CACHE_DIR", dictionary_cache_dir)
+
+
 @pytest.fixture()
 def valid_spelled_content_pack(pack):
     """
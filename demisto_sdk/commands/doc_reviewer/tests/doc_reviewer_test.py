@@ -14,6 +14,7 @@ from demisto_sdk.commands.common.tools import (
     get_yaml,
     is_xsoar_supported_pack,
 )
+from demisto_sdk.commands.doc_reviewer import doc_reviewer
 from demisto_sdk.commands.doc_reviewer.doc_reviewer import (
     DocReviewer,
     replace_escape_characters,
@@ -1421,3 +1422,91 @@ def test_pack_known_word_arg(use_pack_known_words, expected_param_value, mocker)
     )
     runner.invoke(app, ["doc-review", use_pack_known_words])
     assert m.call_args.kwargs.get("load_known_words_from_pack") == expected_param_value
+
+
+def test_spellchecker_dictionary_is_cached(repo, mocker):
+    """
+    Given:
+        - A known_words file.
+
+    When:
+        - Loading the spellchecker of two doc reviewers with the same known_words file.
+        - Loading the spellchecker after the known_words file was changed.
+
+    Then:
+        - Ensure the dictionary is built only once, and the known words are loaded from the cached dictionary.
+        - Ensure the dictionary is rebuilt once the known_words file changes.
+    """
+    pack = repo.create_pack("test_pack")
+    known_words_file = pack._create_text_based("known_words.txt")
+    known_words_file.write_list(["nomnomone"])
+    add_known_words = mocker.spy(DocReviewer, "add_known_words")
+
+    first_doc_reviewer = DocReviewer(
+        file_paths=[known_words_file.path],
+        known_words_file_paths=[known_words_file.path],
+    )
+    assert not first_doc_reviewer.spellchecker.unknown(["nomnomone"])
+    second_doc_reviewer = DocReviewer(
+        file_paths=[known_words_file.path],
+        known_words_file_paths=[known_words_file.path],
+    )
+    assert not second_doc_reviewer.spellchecker.unknown(["nomnomone"])
+    assert second_doc_reviewer.spellchecker.unknown(["nomnomtwo"])
+    assert add_known_words.call_count == 1
+
+    known_words_file.write_list(["nomnomtwo"])
+    third_doc_reviewer = DocReviewer(
+        file_paths=[known_words_file.path],
+        known_words_file_paths=[known_words_file.path],
+    )
+    assert third_doc_reviewer.spellchecker.unknown(["nomnomone"])
+    assert not third_doc_reviewer.spellchecker.unknown(["nomnomtwo"])
+    assert add_known_words.call_count == 2
+
+
+def test_doc_review_multiprocessing(repo, mocker):
+    """
+    Given:
+        - 2 release notes files from different packs, each with words known only in its own pack.
+
+    When:
+        - Running doc_reviewer with workers.
+
+    Then:
+        - Ensure each file is checked with the known words of its own pack.
+    """
+    first_pack = repo.create_pack("first_test_pack")
+    second_pack = repo.create_pack("second_test_pack")
+    first_rn_file = first_pack.create_release_notes(
+        version="1_0_0", content="Added the nomnomone, nomnomtwo."
+    )
+    second_rn_file = second_pack.create_release_notes(
+        version="1_0_1", content="Added the killaone, killatwo."
+    )
+    first_pack.pack_ignore.write_list(["[known_words]", "nomnomone", "killaone"])
+    second_pack.pack_ignore.write_list(["[known_words]", "nomnomtwo", "killatwo"])
+    mocker.patch.object(doc_reviewer, "MIN_FILES_FOR_MULTIPROCESSING", 1)
+    mocker.patch.object(
+        doc_reviewer, "should_disable_multiprocessing", return_value=False
+    )
+    mocker.patch.object(doc_reviewer, "cpu_count", return_value=2)
+    print_unknown_words = mocker.patch.object(DocReviewer, "print_unknown_words")
+
+    with ChangeCWD(repo.path):
+        doc_reviewer_obj = DocReviewer(
+            file_paths=[first_rn_file.path, second_rn_file.path],
+            load_known_words_from_pack=True,
+        )
+        assert not doc_reviewer_obj.run_doc_review()
+
+    print_unknown_words.assert_has_calls(
+        [
+            mocker.call(unknown_words={("nomnomtwo", None): set()}),
+            mocker.call(unknown_words={("killaone", None): set()}),
+        ]
+    )
+    assert doc_reviewer_obj.files_with_misspells == {
+        first_rn_file.path,
+        second_rn_file.path,
+    }
@@ -5,11 +5,12 @@ import shutil
 import tarfile
 import traceback
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import DefaultDict, Dict
+from typing import Callable, DefaultDict, Dict
 
 import demisto_client.demisto_api
 import mergedeep
@@ -92,6 +93,9 @@ ITEM_TYPE_TO_REQUEST_TYPE = {
     ContentItemType.PLAYBOOK: "GET",
 }
 
+# The max number of system content items fetched from the server at the same time
+MAX_CONCURRENT_SYSTEM_FETCHES = 10
+
 # Fields to keep on existing content items when overwriting them with a download (fields that are omitted by the server)
 KEEP_EXISTING_JSON_FIELDS = ["fromVersion", "toVersion"]
 KEEP_EXISTING_YAML_FIELDS = [
@@ -167,7 +171,11 @@ class Downloader:
         self.should_list_files = list_files
         self.download_all_custom_content = all_custom_content
         self.should_run_format = run_format
-        self.client = demisto_client.configure(verify_ssl=not insecure)
+        self.client = demisto_client.configure(
+            verify_ssl=not insecure,
+            # system content items are fetched concurrently, over the connections of this pool
+            connection_pool_maxsize=MAX_CONCURRENT_SYSTEM_FETCHES,
+        )
         self.should_init_new_pack = init
         self.keep_empty_folders = keep_empty_folders
         self.auto_replace_uuids = auto_replace_uuids
@@ -590,6 +598,78 @@ class Downloader:
 
         return endpoint, request_type, request_body
 
+    def _fetch_system_items(
+        self,
+        fetch_item: Callable[[str], tuple[str, dict] | None],
+        content_items: list[str],
+    ) -> dict[str, dict]:
+        """
+        Fetch and parse system content items from server, up to MAX_CONCURRENT_SYSTEM_FETCHES items at a time.
+        Items that failed to be fetched are skipped.
+
+        Args:
+            fetch_item (Callable[[str], tuple[str, dict] | None]): A function fetching & parsing a single item by
+                its name, returning its file name and content item object, or None if it could not be fetched.
+            content_items (list[str]): A list of names of system content items to fetch.
+
+        Returns:
+            dict[str, dict]: A dictionary mapping the fetched items file names (in the order of the given names),
+                to corresponding dictionaries containing metadata and content.
+        """
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_SYSTEM_FETCHES, len(content_items) or 1)
+        ) as executor:
+            return dict(
+                fetched_item
+                for fetched_item in executor.map(fetch_item, content_items)
+                if fetched_item is not None
+            )
+
+    def _fetch_system_automation(self, automation: str) -> tuple[str, dict] | None:
+        """
+        Fetch a single system automation from server, and create its content item object.
+
+        Args:
+            automation (str): The name of the system automation to fetch.
+
+        Returns:
+            tuple[str, dict] | None: The file name and content item object of the automation,
+                or None if it could not be fetched.
+        """
+        try:
+            # This is required due to a server issue where the '/' character
+            # is considered a path separator for the expected_endpoint.
+            if "/" in automation:
+                raise ValueError(
+                    f"Automation name '{automation}' is invalid. "
+                    f"Automation names cannot contain the '/' character."
+                )
+
+            endpoint = f"automation/load/{automation}"
+            api_response = demisto_client.generic_request_func(
+                self.client,
+                endpoint,
+                "POST",
+                _preload_content=False,
+            )[0]
+
+        except Exception as e:
+            logger.error(f"Failed to fetch system automation '{automation}': {e}")
+            return None
+
+        automation_bytes_data = StringIO(safe_read_unicode(api_response.data))
+        automation_data = json.load(automation_bytes_data)
+
+        file_name = self.generate_system_content_file_name(
+            content_item_type=ContentItemType.AUTOMATION,
+            content_item=automation_data,
+        )
+        return file_name, self.create_content_item_object(
+            file_name=file_name,
+            file_data=automation_bytes_data,
+            _loaded_data=automation_data,
+        )
+
     def get_system_automations(self, content_items: list[str]) -> dict[str, dict]:
         """
         Fetch system automations from server.
@@ -601,56 +681,92 @@ class Downloader:
             dict[str, dict]: A dictionary mapping downloaded automations file names,
                 to corresponding dictionaries containing metadata and content.
         """
-        downloaded_automations: list[bytes] = []
         logger.info(
             f"Fetching system automations from server ({self.client.api_client.configuration.host})..."
         )
 
-        for automation in content_items:
-            try:
-                # This is required due to a server issue where the '/' character
-                # is considered a path separator for the expected_endpoint.
-                if "/" in automation:
-                    raise ValueError(
-                        f"Automation name '{automation}' is invalid. "
-                        f"Automation names cannot contain the '/' character."
-                    )
+        downloaded_automations = self._fetch_system_items(
+            fetch_item=self._fetch_system_automation, content_items=content_items
+        )
+
+        logger.debug(
+            f"Successfully fetched {len(downloaded_automations)} system automations."
+        )
+
+        return downloaded_automations
+
+    def _fetch_system_playbook(self, playbook: str) -> tuple[str, dict] | None:
+        """
+        Fetch a single system playbook from server, and create its content item object.
+
+        Args:
+            playbook (str): The name of the system playbook to fetch.
 
-                endpoint = f"automation/load/{automation}"
+        Returns:
+            tuple[str, dict] | None: The file name and content item object of the playbook,
+                or None if it could not be fetched.
+        """
+        try:
+            # This is required due to a server issue where the '/' character
+            # is considered a path separator for the expected_endpoint.
+            if "/" in playbook:
+                raise ValueError(
+                    f"Playbook name '{playbook}' is invalid. "
+                    f"Playbook names cannot contain the '/' character."
+                )
+
+            endpoint = f"/playbook/{playbook}/yaml"
+            try:
                 api_response = demisto_client.generic_request_func(
                     self.client,
                     endpoint,
-                    "POST",
+                    "GET",
                     _preload_content=False,
                 )[0]
 
-                downloaded_automations.append(api_response.data)
+            except ApiException as err:
+                # handling in case the id and name are not the same,
+                # trying to get the id by the name through a different api call
+                logger.debug(
+                    f"API call using playbook's name failed:\n{err}\n"
+                    f"Attempting to fetch using playbook's ID..."
+                )
 
-            except Exception as e:
-                logger.error(f"Failed to fetch system automation '{automation}': {e}")
+                playbook_id = self.get_playbook_id_by_playbook_name(playbook)
 
-        logger.debug(
-            f"Successfully fetched {len(downloaded_automations)} system automations."
-        )
+                if not playbook_id:
+                    logger.debug(f"No matching ID found for playbook '{playbook}'.")
+                    raise
 
-        content_items_objects: dict[str, dict] = {}
+                logger.debug(
+                    f"Found matching ID for '{playbook}' - {playbook_id}.\n"
+                    f"Attempting to fetch playbook's YAML file using the ID."
+                )
 
-        for downloaded_automation in downloaded_automations:
-            automation_bytes_data = StringIO(safe_read_unicode(downloaded_automation))
-            automation_data = json.load(automation_bytes_data)
+                endpoint = f"/playbook/{playbook_id}/yaml"
+                api_response = demisto_client.generic_request_func(
+                    self.client,
+                    endpoint,
+                    "GET",
+                    _preload_content=False,
+                )[0]
 
-            file_name = self.generate_system_content_file_name(
-                content_item_type=ContentItemType.AUTOMATION,
-                content_item=automation_data,
-            )
-            content_object = self.create_content_item_object(
-                file_name=file_name,
-                file_data=automation_bytes_data,
-                _loaded_data=automation_data,
-            )
-            content_items_objects[file_name] = content_object
+        except Exception as e:
+            logger.error(f"Failed to fetch system playbook '{playbook}': {e}")
+            return None
 
-        return content_items_objects
+        playbook_bytes_data = StringIO(safe_read_unicode(api_response.data))
+        playbook_data = yaml.load(playbook_bytes_data)
+
+        file_name = self.generate_system_content_file_name(
+            content_item_type=ContentItemType.PLAYBOOK,
+            content_item=playbook_data,
+        )
+        return file_name, self.create_content_item_object(
+            file_name=file_name,
+            file_data=playbook_bytes_data,
+            _loaded_data=playbook_data,
+        )
 
     def get_system_playbooks(self, content_items: list[str]) -> dict[str, dict]:
         """
@@ -663,61 +779,13 @@ class Downloader:
             dict[str, dict]: A dictionary mapping downloaded playbooks file names,
                 to corresponding dictionaries containing metadata and content.
         """
-        downloaded_playbooks: list[bytes] = []
         logger.info(
             f"Fetching system playbooks from server ({self.client.api_client.configuration.host})..."
         )
 
-        for playbook in content_items:
-            try:
-                # This is required due to a server issue where the '/' character
-                # is considered a path separator for the expected_endpoint.
-                if "/" in playbook:
-                    raise ValueError(
-                        f"Playbook name '{playbook}' is invalid. "
-                        f"Playbook names cannot contain the '/' character."
-                    )
-
-                endpoint = f"/playbook/{playbook}/yaml"
-                try:
-                    api_response = demisto_client.generic_request_func(
-                        self.client,
-                        endpoint,
-                        "GET",
-                        _preload_content=False,
-                    )[0]
-
-                except ApiException as err:
-                    # handling in case the id and name are not the same,
-                    # trying to get the id by the name through a different api call
-                    logger.debug(
-                        f"API call using playbook's name failed:\n{err}\n"
-                        f"Attempting to fetch using playbook's ID..."
-                    )
-
-                    playbook_id = self.get_playbook_id_by_playbook_name(playbook)
-
-                    if not playbook_id:
-                        logger.debug(f"No matching ID found for playbook '{playbook}'.")
-                        raise
-
-                    logger.debug(
-                        f"Found matching ID for '{playbook}' - {playbook_id}.\n"
-                        f"Attempting to fetch playbook's YAML file using the ID."
-                    )
-
-                    endpoint = f"/playbook/{playbook_id}/yaml"
-                    api_response = demisto_client.generic_request_func(
-                        self.client,
-                        endpoint,
-                        "GET",
-                        _preload_content=False,
-                    )[0]
-
-                downloaded_playbooks.append(api_response.data)
-
-            except Exception as e:
-                logger.error(f"Failed to fetch system playbook '{playbook}': {e}")
+        downloaded_playbooks = self._fetch_system_items(
+            fetch_item=self._fetch_system_playbook, content_items=content_items
+        )
 
         if len(downloaded_playbooks):
             logger.debug(
@@ -727,24 +795,7 @@ class Downloader:
         else:
             logger.info("No system playbooks were downloaded.")
 
-        content_objects: dict[str, dict] = {}
-
-        for downloaded_playbook in downloaded_playbooks:
-            playbook_bytes_data = StringIO(safe_read_unicode(downloaded_playbook))
-            playbook_data = yaml.load(playbook_bytes_data)
-
-            file_name = self.generate_system_content_file_name(
-                content_item_type=ContentItemType.PLAYBOOK,
-                content_item=playbook_data,
-            )
-            content_object = self.create_content_item_object(
-                file_name=file_name,
-                file_data=playbook_bytes_data,
-                _loaded_data=playbook_data,
-            )
-            content_objects[file_name] = content_object
-
-        return content_objects
+        return downloaded_playbooks
 
     def generate_system_content_file_name(
         self, content_item_type: ContentItemType, content_item: dict
@@ -1545,3 +1545,36 @@ def test_download_with_subplaybook(mocker):
         "playbook-task_with_sub-playbook"
     ]["data"]["tasks"]["1"]["task"]["playbookName"]
     assert returned_playbookName_value == "test2"
+
+
+def test_get_system_automations_concurrently(mocker, caplog):
+    """
+    Given:
+        Names of system automations to download, where fetching one of them fails.
+    When:
+        Calling get_system_automations function.
+    Then:
+        Ensure all other automations are fetched and returned in the requested order,
+        and that the failure is logged.
+    """
+    automation_names = [f"Automation{i}" for i in range(20)]
+
+    def _generic_request_func(client, endpoint: str, *args, **kwargs):
+        name = endpoint.split("/")[-1]
+        if name == "Automation7":
+            raise ApiException(status=500, reason="Test Error Message")
+        body = json.dumps({"id": name, "name": name, "script": "", "type": "python"})
+        return HTTPResponse(body=body.encode(), status=200), 200, None
+
+    generic_request_func_mock = mocker.patch.object(
+        demisto_client, "generic_request_func", side_effect=_generic_request_func
+    )
+    downloader = Downloader(input=tuple(automation_names))
+
+    results = downloader.get_system_automations(content_items=automation_names)
+
+    assert generic_request_func_mock.call_count == len(automation_names)
+    assert list(results) == [
+        f"{name}.yml" for name in automation_names if name != "Automation7"
+    ]
+    assert "Failed to fetch system automation 'Automation7'" in caplog.text
@@ -4,7 +4,7 @@ import sys
 from copy import deepcopy
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Iterable, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 import networkx as nx
 from packaging.version import Version
@@ -42,6 +42,23 @@ CORE_ALERT_FIELDS_PACK = "CoreAlertFields"
 PACKS_FULL_PATH = os.path.join(CONTENT_PATH, PACKS_DIR)  # type: ignore
 
 
+class IdSetSectionIndex(NamedTuple):
+    """
+    Inverted indexes of an id set section, mapping each id/name/alias/command to the positions of its items.
+    """
+
+    items: List[Tuple[str, dict]]
+    by_id: Dict[str, List[int]]
+    by_name: Dict[Optional[str], List[int]]
+    by_alias: Dict[str, List[int]]
+    by_command: Dict[str, List[int]]
+
+
+MAX_CACHED_ID_SET_SECTIONS = 100
+# id(section) -> (section, index), the section is kept so its id is not reused while it is cached
+_ID_SET_SECTIONS_INDEXES: Dict[int, Tuple[list, IdSetSectionIndex]] = {}
+
+
 def parse_for_pack_metadata(
     dependency_graph: nx.DiGraph,
     graph_root: str,
@@ -279,6 +296,41 @@ class PackDependencies:
             and is_marketplace_match
         )
 
+    @staticmethod
+    def _get_id_set_section_index(items_list: list) -> IdSetSectionIndex:
+        """
+        Returns the inverted indexes of an id set section, built once per section.
+
+        Args:
+            items_list (list): specific section of id set.
+
+        Returns:
+            IdSetSectionIndex: the indexes of the section.
+        """
+        cached = _ID_SET_SECTIONS_INDEXES.get(id(items_list))
+        if (
+            cached
+            and cached[0] is items_list
+            and len(cached[1].items) == len(items_list)
+        ):
+            return cached[1]
+
+        index = IdSetSectionIndex([], {}, {}, {}, {})
+        for position, item in enumerate(items_list):
+            item_id, item_details = next(iter(item.items()))
+            index.items.append((item_id, item_details))
+            index.by_id.setdefault(item_id, []).append(position)
+            index.by_name.setdefault(item_details.get("name"), []).append(position)
+            for alias in set(item_details.get("aliases", [])):
+                index.by_alias.setdefault(alias, []).append(position)
+            for command in set(item_details.get("commands", [])):
+                index.by_command.setdefault(command, []).append(position)
+
+        if len(_ID_SET_SECTIONS_INDEXES) >= MAX_CACHED_ID_SET_SECTIONS:
+            _ID_SET_SECTIONS_INDEXES.clear()
+        _ID_SET_SECTIONS_INDEXES[id(items_list)] = (items_list, index)
+        return index
+
     @staticmethod
     def _search_packs_by_items_names(
         items_names: Union[str, list],
@@ -309,13 +361,19 @@ class PackDependencies:
             items_names = [items_names]
 
         pack_names = set()
-        for item in items_list:
-            item_id = list(item.keys())[0]
-            item_details = list(item.values())[0]
+        index = PackDependencies._get_id_set_section_index(items_list)
+        positions: Set[int] = set()
+        for item_name in items_names:
+            positions.update(index.by_name.get(item_name, ()))
+            if item_name == "":  # items without a name
+                positions.update(index.by_name.get(None, ()))
+
+        for position in sorted(positions):
+            item_id, item_details = index.items[position]
 
             if PackDependencies._should_add_item_as_dependency(
                 item_details,
-                item_details.get("name", "") in items_names,
+                True,
                 exclude_ignored_dependencies,
                 marketplace,
             ):
@@ -360,6 +418,7 @@ class PackDependencies:
         if not isinstance(items_names, list):
             items_names = [items_names]
         item_possible_ids = []
+        index = PackDependencies._get_id_set_section_index(items_list)
 
         for item_name in items_names:
             if incident_or_indicator == "Incident":
@@ -388,23 +447,18 @@ class PackDependencies:
                     f"{item_name}-mapper",
                 ]
 
-            for item_from_id_set in items_list:
-                item_id = list(item_from_id_set.keys())[0]
-                item_details = list(item_from_id_set.values())[0]
-                id_set_item_aliases = set(item_details.get("aliases", []))
-
-                is_item_id_match = (
-                    item_id in item_possible_ids
-                    or item_name == item_details.get("name")
-                )
+            positions: Set[int] = set(index.by_name.get(item_name, ()))
+            for item_possible_id in item_possible_ids:
+                positions.update(index.by_id.get(item_possible_id, ()))
                 if item_type == "incidentfield":
-                    is_item_id_match = is_item_id_match or set(
-                        item_possible_ids
-                    ).intersection(id_set_item_aliases)
+                    positions.update(index.by_alias.get(item_possible_id, ()))
+
+            for position in sorted(positions):
+                item_id, item_details = index.items[position]
 
                 if PackDependencies._should_add_item_as_dependency(
                     item_details,
-                    is_item_id_match,
+                    True,
                     exclude_ignored_dependencies,
                     marketplace,
                 ):
@@ -439,13 +493,13 @@ class PackDependencies:
         """
         packs_and_items_dict: dict = {}
         pack_names: set = set()
-        for item in id_set["integrations"]:
-            item_id = list(item.keys())[0]
-            item_details = list(item.values())[0]
+        index = PackDependencies._get_id_set_section_index(id_set["integrations"])
+        for position in index.by_command.get(command, ()):
+            item_id, item_details = index.items[position]
 
             if PackDependencies._should_add_item_as_dependency(
                 item_details,
-                command in item_details.get("commands", []),
+                True,
                 exclude_ignored_dependencies,
                 marketplace,
             ):
@@ -741,6 +741,66 @@ class TestIdSetFilters:
 
         assert found_filtered_result == expected_result
 
+    def test_id_set_section_index_is_cached(self):
+        """
+        Given
+            - An id set section.
+        When
+            - Getting its index before and after an item is added to it.
+        Then
+            - Ensure the index is built once, and rebuilt after the section changed.
+            - Ensure the index maps the ids, names, aliases and commands to the positions of the items.
+        """
+        section = [
+            {"id_0": {"name": "name_0", "aliases": ["alias_0"], "pack": "pack_0"}},
+            {"id_1": {"name": "name_0", "commands": ["command_1"], "pack": "pack_1"}},
+        ]
+
+        index = PackDependencies._get_id_set_section_index(section)
+        assert PackDependencies._get_id_set_section_index(section) is index
+        assert index.by_id == {"id_0": [0], "id_1": [1]}
+        assert index.by_name == {"name_0": [0, 1]}
+        assert index.by_alias == {"alias_0": [0]}
+        assert index.by_command == {"command_1": [1]}
+
+        section.append({"id_2": {"name": "name_2", "pack": "pack_2"}})
+        index = PackDependencies._get_id_set_section_index(section)
+        assert index.by_id == {"id_0": [0], "id_1": [1], "id_2": [2]}
+
+    def test_search_packs_by_incident_field_alias(self):
+        """
+        Given
+            - An incident field with an alias.
+        When
+            - Searching packs by the alias of the incident field.
+        Then
+            - Ensure the pack of the incident field is found.
+        """
+        incident_fields = [
+            {
+                "incident_field_0": {
+                    "name": "Field 0",
+                    "aliases": ["incident_alias_0"],
+                    "pack": "pack_0",
+                    "marketplaces": ["xsoar"],
+                }
+            },
+            {
+                "incident_field_1": {
+                    "name": "Field 1",
+                    "pack": "pack_1",
+                    "marketplaces": ["xsoar"],
+                }
+            },
+        ]
+
+        assert PackDependencies._search_packs_by_items_names_or_ids(
+            "alias_0",
+            incident_fields,
+            incident_or_indicator="Incident",
+            item_type="incidentfield",
+        ) == ({"pack_0"}, {"pack_0": [("incidentfield", "incident_field_0")]})
+
 
 class TestDependsOnScriptAndIntegration:
     @pytest.mark.parametrize(
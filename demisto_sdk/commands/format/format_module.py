@@ -11,7 +11,11 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import find_type, get_files_in_dir
+from demisto_sdk.commands.common.tools import (
+    find_type,
+    find_type_by_path,
+    get_files_in_dir,
+)
 from demisto_sdk.commands.content_graph.commands.update import update_content_graph
 from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
     Neo4jContentGraphInterface as ContentGraphInterface,
@@ -221,6 +225,13 @@ def format_manager(
                 )
                 logger.debug(f"Error encountered when updating content graph: {e}")
                 graph = False
+        ReadmeFormat.prefetch_markdownlint_fixes(
+            [
+                str(Path(file))
+                for file in files
+                if find_type_by_path(file) == FileType.README
+            ]
+        )
         for file in files:
             file_path = str(Path(file))
             file_type = find_type(file_path, clear_cache=clear_cache)
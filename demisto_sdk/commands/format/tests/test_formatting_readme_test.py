@@ -165,3 +165,40 @@ class TestReadmeFormat:
             == "https://goodurl.com"
         )
         assert get_new_url_from_user_skip(mocker, readme_url) is None
+
+
+def test_readme_markdown_fixes_prefetched(mocker):
+    """
+    Given: README files linted in advance in a single batch request
+    When: Calling format on the files
+    Then: The prefetched fixes are used, and markdownlint is called only for a file changed since it was linted
+
+    """
+    from demisto_sdk.commands.common.markdown_lint import MarkdownResult
+    from demisto_sdk.commands.format import update_readme
+
+    mocker.patch.object(update_readme, "mdx_server_is_up", return_value=True)
+    fixed_result = MarkdownResult(
+        {"errorNum": 0, "validations": "", "fixedText": "## Fixed"}
+    )
+    run_markdownlint_batch = mocker.patch.object(
+        update_readme,
+        "run_markdownlint_batch",
+        return_value={INVALID_MD: fixed_result},
+    )
+    run_markdownlint_mock = mocker.patch.object(
+        update_readme, "run_markdownlint", return_value=fixed_result
+    )
+
+    ReadmeFormat.prefetch_markdownlint_fixes([INVALID_MD])
+    run_markdownlint_batch.assert_called_once()
+    readme_formatter = ReadmeFormat(INVALID_MD, assume_answer=True)
+    readme_formatter.fix_lint_markdown()
+    assert readme_formatter.readme_content == "## Fixed"
+    run_markdownlint_mock.assert_not_called()
+
+    ReadmeFormat.prefetch_markdownlint_fixes([INVALID_MD])
+    readme_formatter = ReadmeFormat(INVALID_MD, assume_answer=True)
+    readme_formatter.readme_content += "\n## Changed"
+    readme_formatter.fix_lint_markdown()
+    run_markdownlint_mock.assert_called_once()
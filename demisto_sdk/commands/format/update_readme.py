@@ -1,4 +1,5 @@
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from demisto_sdk.commands.common.hook_validations.readme import (
     ReadmeUrl,
@@ -6,7 +7,11 @@ from demisto_sdk.commands.common.hook_validations.readme import (
     mdx_server_is_up,
 )
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.markdown_lint import run_markdownlint
+from demisto_sdk.commands.common.markdown_lint import (
+    MarkdownResult,
+    run_markdownlint,
+    run_markdownlint_batch,
+)
 from demisto_sdk.commands.format.format_constants import (
     ERROR_RETURN_CODE,
     SKIP_RETURN_CODE,
@@ -24,6 +29,9 @@ class ReadmeFormat(BaseUpdate):
          output_file (str): the desired file name to save the updated version to.
     """
 
+    # markdownlint fixes of README files which were linted in advance, keyed by the file path
+    prefetched_markdownlint_results: Dict[str, Tuple[str, MarkdownResult]] = {}
+
     def __init__(
         self,
         input: str = "",
@@ -136,14 +144,45 @@ class ReadmeFormat(BaseUpdate):
         else:
             return format_res, self.initiate_file_validator()
 
+    @classmethod
+    def prefetch_markdownlint_fixes(cls, file_paths: List[str]):
+        """Runs markdownlint on all the given README files in batch requests, rather than a request per file.
+        A README formatted later uses its prefetched fixes as long as its content was not changed since.
+
+        Args:
+            file_paths: The paths of the README files to lint.
+        """
+        if not file_paths or not mdx_server_is_up():
+            return
+        files_contents = {}
+        for file_path in file_paths:
+            if readme_content := Path(file_path).read_text():
+                files_contents[file_path] = readme_content
+        try:
+            results = run_markdownlint_batch(files_contents, fix=True)
+        except Exception as e:
+            logger.debug(
+                f"Failed to run markdownlint on the README files in batch: {e}"
+            )
+            return
+        for file_path, result in results.items():
+            cls.prefetched_markdownlint_results[file_path] = (
+                files_contents[file_path],
+                result,
+            )
+
     def fix_lint_markdown(self):
         if mdx_server_is_up():
             if self.readme_content:
-                response = run_markdownlint(
-                    file_path=self.source_file,
-                    file_content=self.readme_content,
-                    fix=True,
+                prefetched_content, response = self.prefetched_markdownlint_results.pop(
+                    self.source_file, ("", None)
                 )
+                if response is None or prefetched_content != self.readme_content:
+                    response = run_markdownlint(
+                        file_path=self.source_file,
+                        file_content=self.readme_content,
+                        fix=True,
+                    )
                 if response.validations:
                     logger.info(
                         f"<yellow>Markdown lint was not able to fix the following "
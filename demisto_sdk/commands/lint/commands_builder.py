@@ -272,12 +272,15 @@ def build_pylint_command(
     return command
 
 
-def build_pytest_command(test_xml: str = "", json: bool = False, cov: str = "") -> str:
+def build_pytest_command(
+    test_xml: str = "", json: bool = False, cov: str = "", report_dir: str = "/devwork"
+) -> str:
     """Build command to execute with pytest module
         https://docs.pytest.org/en/latest/usage.html
     Args:
         test_xml(str): path indicate if required or not
         json(bool): Define json creation after test
+        report_dir(str): The directory in the container to save the reports in
 
     Returns:
         str: pytest command
@@ -285,10 +288,10 @@ def build_pytest_command(test_xml: str = "", json: bool = False, cov: str = "")
     command = "pytest -ra --override-ini='asyncio_mode=auto'"
     # Generating junit-xml report - used in circle ci
     if test_xml:
-        command += " --junitxml=/devwork/report_pytest.xml"
+        command += f" --junitxml={report_dir}/report_pytest.xml"
     # Generating json report
     if json:
-        command += " --json=/devwork/report_pytest.json"
+        command += f" --json={report_dir}/report_pytest.json"
 
     if cov:
         command += f" --cov-report= --cov={cov}"
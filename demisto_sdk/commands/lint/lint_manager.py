@@ -4,6 +4,7 @@ import os
 import re
 import sys
 import textwrap
+from collections import defaultdict
 from typing import Any, Dict, List, Set, Tuple, Union
 
 import docker
@@ -51,7 +52,12 @@ from demisto_sdk.commands.lint.helpers import (
     generate_coverage_report,
     get_test_modules,
 )
-from demisto_sdk.commands.lint.linter import DockerImageFlagOption, Linter
+from demisto_sdk.commands.lint.linter import (
+    DockerImageFlagOption,
+    Linter,
+    SharedTestContainers,
+    TestImageKey,
+)
 
 # Third party packages
 
@@ -484,6 +490,12 @@ class LintManager:
         Returns:
             Tuple[int, int]: exit code, warning code
         """
+        # The python checks of the packages run in a container per test image, unless the containers are kept
+        shared_containers = (
+            SharedTestContainers()
+            if self._facts["docker_engine"] and not keep_container
+            else None
+        )
         try:
             with concurrent.futures.ThreadPoolExecutor(
                 max_workers=parallel
@@ -491,7 +503,9 @@ class LintManager:
                 return_exit_code: int = 0
                 return_warning_code: int = 0
                 results = []
-                # Executing lint checks in different threads
+                linters: List[Linter] = []
+                # Test images shared by the packages which resolve to the same docker image
+                test_images: Dict[TestImageKey, Tuple[str, str]] = {}
                 for pack in sorted(self._pkgs):
                     linter: Linter = Linter(
                         pack_dir=pack,
@@ -508,7 +522,30 @@ class LintManager:
                         docker_image_target=docker_image_target,
                         all_packs=self._all_packs,
                         use_git=self._git_modified_files,
+                        test_images=test_images,
+                        shared_containers=shared_containers,
                     )
+                    linters.append(linter)
+
+                if self._facts["docker_engine"]:
+                    # Resolve the docker images of all packages first, to create each test image once per group
+                    skipped = executor.map(
+                        lambda linter: linter.gather_facts(self._facts["test_modules"]),
+                        linters,
+                    )
+                    test_images.update(
+                        self._create_test_images(
+                            linters=[
+                                linter
+                                for linter, skip in zip(linters, skipped)
+                                if not skip
+                            ],
+                            executor=executor,
+                        )
+                    )
+
+                # Executing lint checks in different threads
+                for linter in linters:
                     results.append(
                         executor.submit(
                             linter.run_pack,
@@ -568,6 +605,54 @@ class LintManager:
             logger.debug("{}", msg, exc_info=True)  # noqa: PLE1205
             executor.shutdown(wait=True, cancel_futures=True)  # type: ignore[call-arg]
             return 1, 0
+        finally:
+            if shared_containers:
+                shared_containers.remove()
+
+    @staticmethod
+    def _create_test_images(
+        linters: List[Linter], executor: concurrent.futures.Executor
+    ) -> Dict[TestImageKey, Tuple[str, str]]:
+        """Groups the packages by their resolved docker images, and creates the test image of each group once.
+
+        Args:
+            linters(List[Linter]): Linters of the packages to lint, after their facts were gathered.
+            executor(Executor): The executor to create the test images of the different groups on.
+
+        Returns:
+            Dict[TestImageKey, Tuple[str, str]]: The test image name and creation errors of each group.
+        """
+        image_groups: Dict[TestImageKey, List[Tuple[Linter, List[Any]]]] = defaultdict(
+            list
+        )
+        for linter in linters:
+            for image in linter.docker_images:
+                image_groups[linter.get_test_image_key(image)].append((linter, image))
+        if not image_groups:
+            return {}
+        logger.info(
+            f"Linting {sum(len(group) for group in image_groups.values())} package images "
+            f"using {len(image_groups)} test images"
+        )
+
+        def create_group_test_image(
+            linter: Linter, image: List[Any]
+        ) -> Tuple[str, str]:
+            image_id, errors = "", ""
+            for _ in range(2):
+                image_id, errors = linter._docker_image_create(docker_base_image=image)
+                if not errors:
+                    break
+            return image_id, errors
+
+        futures = {
+            test_image_key: executor.submit(create_group_test_image, *group[0])
+            for test_image_key, group in image_groups.items()
+        }
+        return {
+            test_image_key: future.result()
+            for test_image_key, future in futures.items()
+        }
 
     def run(
         self,
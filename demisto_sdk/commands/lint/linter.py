@@ -4,9 +4,13 @@ import copy
 import os
 import platform
 import re
+import threading
+import time
 import traceback
+import uuid
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import docker
 import docker.errors
@@ -85,6 +89,153 @@ from demisto_sdk.commands.lint.helpers import (
 # Local packages
 
 
+# (base docker image, python major version, pack type, additional requirements)
+TestImageKey = Tuple[str, Optional[int], Optional[str], Tuple[str, ...]]
+# the interval between the checks whether a command executed in a shared test container finished, in seconds
+SHARED_CONTAINER_EXEC_POLLING_INTERVAL = 0.5
+SHARED_CONTAINER_EXEC_OUTPUT_FILE = ".lint_output"
+
+
+@dataclass
+class SharedContainerExecResult:
+    exit_code: int
+    output: str
+    container: docker.models.containers.Container
+    workdir: str
+
+    def get_file(self, file_name: str, encoding: str = "") -> Union[str, bytes]:
+        """Copies a file from the working directory of the package in the shared container."""
+        return get_file_from_container(
+            container_obj=self.container,
+            container_path=f"{self.workdir}/{file_name}",
+            encoding=encoding,
+        )
+
+
+class SharedTestContainers:
+    """Long running containers of the test images, shared by all the packages linted on the same test image.
+
+    Instead of creating a container for every check of every package, each check runs as an `exec` in the shared
+    container of its test image. Every package is copied to its own working directory, and its environment variables
+    are set on each `exec`. As the network of a container cannot be changed per `exec`, the packages whose tests
+    require network use a separate shared container of the test image, with network enabled.
+    The powershell checks, and the checks of packages whose containers are kept, still run in containers of their own.
+    """
+
+    def __init__(self):
+        self._containers: Dict[
+            Tuple[str, bool], docker.models.containers.Container
+        ] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_container_name(test_image: str, network_disabled: bool) -> str:
+        # Get rid of chars that are not suitable for container names
+        image_cont_name = re.sub(r"[^a-zA-Z0-9_.-]", "_", test_image.split("/")[-1])
+        image_cont_name = re.sub(r"^[^a-zA-Z0-9]", "", image_cont_name)
+        network = "no-network" if network_disabled else "network"
+        return f"lint-shared-{image_cont_name}-{network}"
+
+    def _get_container(
+        self, test_image: str, network_disabled: bool
+    ) -> docker.models.containers.Container:
+        with self._lock:
+            if (test_image, network_disabled) not in self._containers:
+                container_name = self.get_container_name(test_image, network_disabled)
+                docker_client = init_global_docker_client()
+                # Check if previous run left container a live if it does, Remove it
+                try:
+                    docker_client.containers.get(container_name).remove(force=True)
+                except docker.errors.NotFound:
+                    pass
+                logger.info(f"Starting shared test container {container_name}")
+                container = get_docker().create_container(
+                    name=container_name,
+                    image=test_image,
+                    # keep the container running, the checks are executed in it
+                    command=["tail -f /dev/null"],
+                    network_disabled=network_disabled,
+                )
+                container.start()
+                self._containers[(test_image, network_disabled)] = container
+            return self._containers[(test_image, network_disabled)]
+
+    def exec(
+        self,
+        test_image: str,
+        command: str,
+        pack_dir: Path,
+        environment: Dict[str, str],
+        user: str,
+        network_disabled: bool,
+    ) -> SharedContainerExecResult:
+        """Runs a command of a package in the shared container of the test image.
+
+        The package is copied to a working directory of its own, which should be removed with `remove_workdir`
+        once the files needed from it were read.
+
+        Args:
+            test_image(str): The test image to run the command on.
+            command(str): The command to run.
+            pack_dir(Path): The package directory.
+            environment(dict): The environment variables of the package.
+            user(str): The user to run the command as.
+            network_disabled(bool): Whether the command should run without network.
+
+        Returns:
+            SharedContainerExecResult: The exit code and output of the command.
+        """
+        container = self._get_container(test_image, network_disabled)
+        workdir = f"/devwork/{pack_dir.name}-{uuid.uuid4().hex[:8]}"
+        get_docker().copy_files_container(container, [(pack_dir, workdir)])
+        api = init_global_docker_client().api
+        # the command runs detached, so a command without output for long is not stopped by the client timeout
+        exec_id = api.exec_create(
+            container.id,
+            cmd=[
+                "/bin/sh",
+                "-c",
+                f"{command} > {SHARED_CONTAINER_EXEC_OUTPUT_FILE} 2>&1",
+            ],
+            environment=environment,
+            workdir=workdir,
+            user=user,
+        )["Id"]
+        api.exec_start(exec_id, detach=True)
+        while (exec_status := api.exec_inspect(exec_id))["Running"]:
+            time.sleep(SHARED_CONTAINER_EXEC_POLLING_INTERVAL)
+        output = get_file_from_container(
+            container_obj=container,
+            container_path=f"{workdir}/{SHARED_CONTAINER_EXEC_OUTPUT_FILE}",
+            encoding="utf-8",
+        )
+        return SharedContainerExecResult(
+            exit_code=exec_status["ExitCode"],
+            output=output if isinstance(output, str) else output.decode("utf-8"),
+            container=container,
+            workdir=workdir,
+        )
+
+    @staticmethod
+    def remove_workdir(result: SharedContainerExecResult):
+        try:
+            result.container.exec_run(["rm", "-rf", result.workdir], user="root")
+        except docker.errors.APIError as e:
+            logger.debug(f"Unable to remove {result.workdir} - {e}")
+
+    def remove(self):
+        """Removes the shared containers."""
+        with self._lock:
+            for container in self._containers.values():
+                try:
+                    container.remove(force=True)
+                except docker.errors.APIError as e:
+                    logger.critical(
+                        f"Unable to remove shared test container {container.name} - {e}"
+                    )
+            self._containers.clear()
+
+
 class DockerImageFlagOption(Enum):
     FROM_YML = "from-yml"
     NATIVE = "native:"
@@ -106,6 +257,9 @@ class Linter:
         docker_timeout(int): Timeout for docker requests.
         docker_image_flag(str): Indicates the desirable docker image to run lint on (default value is 'from-yml).
         all_packs (bool): Indicates whether all the packs should go through lint
+        test_images(dict): Test images shared between linters of packages resolving to the same docker image.
+        shared_containers(SharedTestContainers): Containers of the test images to run the python checks in,
+            shared between the linters. If not given, each check runs in a container of its own.
     """
 
     def __init__(
@@ -118,8 +272,14 @@ class Linter:
         all_packs: bool = False,
         docker_image_target: str = "",
         use_git: bool = False,
+        test_images: Optional[Dict[TestImageKey, Tuple[str, str]]] = None,
+        shared_containers: Optional[SharedTestContainers] = None,
     ):
         self._content_repo = content_repo
+        self._test_images = test_images if test_images is not None else {}
+        self._shared_containers = shared_containers
+        self._facts_gathered = False
+        self._skip = False
 
         # For covering the case when a path file is sent instead of a directory
         self._pack_abs_dir = pack_dir if pack_dir.is_dir() else pack_dir.parent
@@ -247,7 +407,7 @@ class Linter:
         log_prompt = f"{self._pack_name} - Run"
         logger.info(f"{log_prompt} - Start")
         try:
-            skip = self._gather_facts(modules)
+            skip = self._skip if self._facts_gathered else self._gather_facts(modules)
             # If not python pack - skip pack
             if skip:
                 return self._pkg_lint_status
@@ -289,6 +449,53 @@ class Linter:
         logger.info(f"{log_prompt} - Finished Successfully")
         return self._pkg_lint_status
 
+    def gather_facts(self, modules: dict) -> bool:
+        """Gathering facts about the package ahead of `run_pack`, so the docker images of all packages are
+        resolved before any of them is linted.
+
+        Args:
+            modules(dict): Test mandatory modules to be ignore in lint check
+
+        Returns:
+            bool: Whether the package should be skipped.
+        """
+        try:
+            self._skip = self._gather_facts(modules)
+        except Exception as ex:
+            err = f"{self._pack_abs_dir}: Unexpected fatal exception: {str(ex)}"
+            logger.error(f"{err}. Traceback: {traceback.format_exc()}")
+            self._pkg_lint_status["errors"].append(err)
+            self._pkg_lint_status["exit_code"] += FAIL
+            self._skip = True
+        self._facts_gathered = True
+        return self._skip
+
+    @property
+    def docker_images(self) -> List[List[Any]]:
+        """The docker images (name and python version) the package is linted on, once the facts are gathered."""
+        return self._facts["images"]
+
+    def get_test_image_key(self, docker_base_image: List[Any]) -> TestImageKey:
+        """Identifies the test image created for the given docker image of the package.
+
+        Packages with the same key share the same test image.
+
+        Args:
+            docker_base_image(list): docker image to use as base for installing dev deps and python version.
+
+        Returns:
+            TestImageKey: The base image, python major version, pack type and additional requirements.
+        """
+        py_ver = None
+        if docker_base_image[1] != -1:
+            py_ver = parse(docker_base_image[1]).major  # type: ignore
+        return (
+            docker_base_image[0],
+            py_ver,
+            self._pkg_lint_status["pack_type"],
+            tuple(sorted(self._facts["additional_requirements"])),
+        )
+
     @timer(group_name="lint")
     def _gather_facts(self, modules: dict) -> bool:
         """Gathering facts about the package - python version, docker images, valid docker image, yml parsing
@@ -925,6 +1132,8 @@ class Linter:
             3. The docker image build done by Dockerfile template located in
                 demisto_sdk/commands/lint/templates/dockerfile.jinja2
 
+        If the test image was already created for the docker image group of the package, it is reused.
+
         Args:
             docker_base_image(list): docker image to use as base for installing dev deps and python version.
 
@@ -932,15 +1141,19 @@ class Linter:
             str, str. image name to use and errors string.
         """
         log_prompt = f"{self._pack_name} - Image create"
+        test_image_key = self.get_test_image_key(docker_base_image)
+        if test_image_key in self._test_images:
+            logger.debug(
+                f"{log_prompt} - Using the shared test image of {test_image_key}"
+            )
+            return self._test_images[test_image_key]
         docker_base = get_docker()
         # Get requirements file for image
-        py_ver = None
-        if docker_base_image[1] != -1:
-            py_ver = parse(docker_base_image[1]).major  # type: ignore
+        _, py_ver, pack_type, _ = test_image_key
         test_image_name, errors = docker_base.get_or_create_test_image(
             docker_base_image[0],
             additional_requirements=self._facts["additional_requirements"],
-            container_type=self._pkg_lint_status["pack_type"],
+            container_type=pack_type,
             log_prompt=log_prompt,
             python_version=py_ver,
             push=self._docker_hub_login,
@@ -985,6 +1198,24 @@ class Linter:
         log_prompt = f"{self._pack_name} - {linter} - Image {test_image}"
         logger.info(f"{log_prompt} - Start")
 
+        command = [self._facts["lint_to_commands"][linter]]
+        if self._shared_containers and not keep_container:
+            try:
+                result = self._shared_containers.exec(
+                    test_image=test_image,
+                    command=command[0],
+                    pack_dir=self._pack_abs_dir,
+                    environment=self._facts["env_vars"],
+                    user=f"{os.getuid()}:4000",
+                    network_disabled=False,
+                )
+            except Exception as e:
+                logger.exception(f"{log_prompt} - Unable to run {linter}")
+                return RERUN, str(e)
+            self._shared_containers.remove_workdir(result)
+            stream_docker_container_output(iter([result.output.encode("utf-8")]))
+            return self._get_linter_result(log_prompt, result.exit_code, result.output)
+
         container_name = self.get_container_name(linter, test_image)
         # Check if previous run left container a live if it do, we remove it
         self._docker_remove_container(container_name)
@@ -992,7 +1223,6 @@ class Linter:
         # Run container
         exit_code = SUCCESS
         output = ""
-        command = [self._facts["lint_to_commands"][linter]]
         try:
             container: docker.models.containers.Container = (
                 get_docker().create_container(
@@ -1018,26 +1248,9 @@ class Linter:
             container_exit_code = container_status.get("StatusCode")
             # Getting container logs
             container_log = container.logs().decode("utf-8")
-            logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
-            if container_exit_code in [1, 2, 127]:
-                # 1-fatal message issued
-                # 2-Error message issued
-                # 127-Command failure (for instance the linter is not exists)
-                exit_code = FAIL
-                output = container_log
-                logger.error(f"{log_prompt} - Finished, errors found")
-            elif container_exit_code in [4, 8, 16]:
-                # 4-Warning message issued
-                # 8-refactor message issued
-                # 16-convention message issued
-                logger.info(f"{log_prompt} - Successfully finished - warnings found")
-                exit_code = SUCCESS
-            elif container_exit_code == 32:
-                # 32-usage error
-                logger.critical(f"{log_prompt} - Finished - Usage error")
-                exit_code = RERUN
-            else:
-                logger.info(f"{log_prompt} - Successfully finished")
+            exit_code, output = self._get_linter_result(
+                log_prompt, container_exit_code, container_log
+            )
         except Exception as e:
             logger.exception(f"{log_prompt} - Unable to run {linter}")
             exit_code = RERUN
@@ -1054,6 +1267,34 @@ class Linter:
                     logger.critical(f"{log_prompt} - Unable to delete container - {e}")
         return exit_code, output
 
+    @staticmethod
+    def _get_linter_result(
+        log_prompt: str, container_exit_code: Optional[int], container_log: str
+    ) -> Tuple[int, str]:
+        exit_code = SUCCESS
+        output = ""
+        logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
+        if container_exit_code in [1, 2, 127]:
+            # 1-fatal message issued
+            # 2-Error message issued
+            # 127-Command failure (for instance the linter is not exists)
+            exit_code = FAIL
+            output = container_log
+            logger.error(f"{log_prompt} - Finished, errors found")
+        elif container_exit_code in [4, 8, 16]:
+            # 4-Warning message issued
+            # 8-refactor message issued
+            # 16-convention message issued
+            logger.info(f"{log_prompt} - Successfully finished - warnings found")
+            exit_code = SUCCESS
+        elif container_exit_code == 32:
+            # 32-usage error
+            logger.critical(f"{log_prompt} - Finished - Usage error")
+            exit_code = RERUN
+        else:
+            logger.info(f"{log_prompt} - Successfully finished")
+        return exit_code, output
+
     @timer(group_name="lint")
     def _docker_run_pytest(
         self,
@@ -1078,6 +1319,42 @@ class Linter:
 
         log_prompt = f"{self._pack_name} - Pytest - Image {test_image}, network: {network_status}"
         logger.info(f"{log_prompt} - Start")
+        cov = self._pack_abs_dir.stem if not no_coverage else ""
+        uid = os.getuid() or 4000
+        logger.debug(
+            f"{log_prompt} - user uid for running lint/test: {uid}"
+        )  # lgtm[py/clear-text-logging-sensitive-data]
+        if self._shared_containers and not keep_container:
+            try:
+                result = self._shared_containers.exec(
+                    test_image=test_image,
+                    # the reports are saved in the working directory of the package
+                    command=build_pytest_command(
+                        test_xml=test_xml, json=True, cov=cov, report_dir="."
+                    ),
+                    pack_dir=self._pack_abs_dir,
+                    environment=self._facts["env_vars"],
+                    user=f"{uid}:4000",
+                    network_disabled=should_disable_network,
+                )
+            except (docker.errors.ImageNotFound, docker.errors.APIError) as e:
+                logger.critical(f"{log_prompt} - Unable to run pytest container {e}")
+                return RERUN, "", {}
+            try:
+                stream_docker_container_output(iter([result.output.encode("utf-8")]))
+                exit_code, output, test_json = self._get_pytest_result(
+                    log_prompt=log_prompt,
+                    container_exit_code=result.exit_code,
+                    get_file=result.get_file,
+                    get_logs=lambda: result.output,
+                    test_xml=test_xml,
+                    cov=cov,
+                )
+            finally:
+                self._shared_containers.remove_workdir(result)
+            logger.info(f"{self._pack_name} - Pytest finished image {test_image}")
+            return exit_code, output, test_json
+
         container_name = self.get_container_name("pytest", test_image)
         # Check if previous run left container a live if it does, Remove it
         self._docker_remove_container(container_name)
@@ -1087,12 +1364,6 @@ class Linter:
         test_json = {}
         try:
             # Running pytest container
-            cov_file_path = Path.joinpath(self._pack_abs_dir, ".coverage")
-            cov = self._pack_abs_dir.stem if not no_coverage else ""
-            uid = os.getuid() or 4000
-            logger.debug(
-                f"{log_prompt} - user uid for running lint/test: {uid}"
-            )  # lgtm[py/clear-text-logging-sensitive-data]
             container: docker.models.containers.Container = (
                 get_docker().create_container(
                     name=container_name,
@@ -1112,71 +1383,18 @@ class Linter:
             container_status: dict = container.wait()
             # Getting container exit code
             container_exit_code = container_status.get("StatusCode")
-            # Getting container logs
-            logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
-            if container_exit_code in [0, 1, 2, 5]:
-                # 0-All tests passed
-                # 1-Tests were collected and run but some of the tests failed
-                # 2-Test execution was interrupted by the user
-                # 5-No tests were collected
-
-                if test_xml:
-                    test_data_xml = get_file_from_container(
-                        container_obj=container,
-                        container_path="/devwork/report_pytest.xml",
-                    )
-                    xml_apth = Path(test_xml) / f"{self._pack_name}_pytest.xml"
-
-                    with open(file=xml_apth, mode="bw") as f:
-                        f.write(test_data_xml)  # type: ignore
-
-                if cov:
-                    cov_data = get_file_from_container(
-                        container_obj=container, container_path="/devwork/.coverage"
-                    )
-                    cov_data = (
-                        cov_data if isinstance(cov_data, bytes) else cov_data.encode()
-                    )
-                    with open(cov_file_path, "wb") as coverage_file:
-                        coverage_file.write(cov_data)
-                    coverage_report_editor(
-                        cov_file_path,
-                        os.path.join(
-                            self._pack_abs_dir, f"{self._pack_abs_dir.stem}.py"
-                        ),
-                    )
-
-                test_json = json.loads(
-                    get_file_from_container(
-                        container_obj=container,
-                        container_path="/devwork/report_pytest.json",
-                        encoding="utf-8",
-                    )
-                )
-                for test in test_json.get("report", {}).get("tests"):
-                    if test.get("call", {}).get("longrepr"):
-                        test["call"]["longrepr"] = test["call"]["longrepr"].split("\n")
-                if container_exit_code in [0, 5]:
-                    logger.info(f"{log_prompt} - Successfully finished")
-                    exit_code = SUCCESS
-                elif container_exit_code in [2]:
-                    output = container.logs().decode("utf-8")
-                    exit_code = FAIL
-                else:
-                    logger.error(f"{log_prompt} - Finished, errors found")
-                    exit_code = FAIL
-            elif container_exit_code in [3, 4]:
-                # 3-Internal error happened while executing tests
-                # 4-pytest command line usage error
-                logger.critical(f"{log_prompt} - Usage error")
-                exit_code = RERUN
-                output = container.logs().decode("utf-8")
-            else:
-                # Any other container exit code
-                logger.error(
-                    f"{log_prompt} - Finished, docker container error found ({container_exit_code})"
-                )
-                exit_code = FAIL
+            exit_code, output, test_json = self._get_pytest_result(
+                log_prompt=log_prompt,
+                container_exit_code=container_exit_code,
+                get_file=lambda file_name, encoding="": get_file_from_container(
+                    container_obj=container,
+                    container_path=f"/devwork/{file_name}",
+                    encoding=encoding,
+                ),
+                get_logs=lambda: container.logs().decode("utf-8"),
+                test_xml=test_xml,
+                cov=cov,
+            )
             # Remove container if not needed
             if keep_container:
                 logger.info(f"{log_prompt} - Container name {container_name}")
@@ -1192,6 +1410,87 @@ class Linter:
         logger.info(f"{self._pack_name} - Pytest finished image {test_image}")
         return exit_code, output, test_json
 
+    def _get_pytest_result(
+        self,
+        log_prompt: str,
+        container_exit_code: Optional[int],
+        get_file: Callable[..., Union[str, bytes]],
+        get_logs: Callable[[], str],
+        test_xml: str,
+        cov: str,
+    ) -> Tuple[int, str, dict]:
+        """Collects the results of pytest from the container it ran in
+
+        Args:
+            log_prompt(str): The log prompt
+            container_exit_code(int): The exit code of pytest
+            get_file(Callable): Gets a file (and its encoding) from the directory pytest ran in
+            get_logs(Callable): Gets the logs of pytest
+            test_xml(str): Xml saving path
+            cov(str): The module the coverage was reported for, empty if without coverage
+
+        Returns:
+            int: 0 on successful, errors 1, need to retry 2
+            str: The output of the failure
+            dict: Unit test json report
+        """
+        exit_code = SUCCESS
+        output = ""
+        test_json: dict = {}
+        logger.info(f"{log_prompt} - exit-code: {container_exit_code}")
+        if container_exit_code in [0, 1, 2, 5]:
+            # 0-All tests passed
+            # 1-Tests were collected and run but some of the tests failed
+            # 2-Test execution was interrupted by the user
+            # 5-No tests were collected
+
+            if test_xml:
+                test_data_xml = get_file("report_pytest.xml")
+                xml_apth = Path(test_xml) / f"{self._pack_name}_pytest.xml"
+
+                with open(file=xml_apth, mode="bw") as f:
+                    f.write(test_data_xml)  # type: ignore
+
+            if cov:
+                cov_file_path = Path.joinpath(self._pack_abs_dir, ".coverage")
+                cov_data = get_file(".coverage")
+                cov_data = (
+                    cov_data if isinstance(cov_data, bytes) else cov_data.encode()
+                )
+                with open(cov_file_path, "wb") as coverage_file:
+                    coverage_file.write(cov_data)
+                coverage_report_editor(
+                    cov_file_path,
+                    os.path.join(self._pack_abs_dir, f"{self._pack_abs_dir.stem}.py"),
+                )
+
+            test_json = json.loads(get_file("report_pytest.json", encoding="utf-8"))
+            for test in test_json.get("report", {}).get("tests"):
+                if test.get("call", {}).get("longrepr"):
+                    test["call"]["longrepr"] = test["call"]["longrepr"].split("\n")
+            if container_exit_code in [0, 5]:
+                logger.info(f"{log_prompt} - Successfully finished")
+                exit_code = SUCCESS
+            elif container_exit_code in [2]:
+                output = get_logs()
+                exit_code = FAIL
+            else:
+                logger.error(f"{log_prompt} - Finished, errors found")
+                exit_code = FAIL
+        elif container_exit_code in [3, 4]:
+            # 3-Internal error happened while executing tests
+            # 4-pytest command line usage error
+            logger.critical(f"{log_prompt} - Usage error")
+            exit_code = RERUN
+            output = get_logs()
+        else:
+            # Any other container exit code
+            logger.error(
+                f"{log_prompt} - Finished, docker container error found ({container_exit_code})"
+            )
+            exit_code = FAIL
+        return exit_code, output, test_json
+
     def _docker_run_pwsh_analyze(
         self, test_image: str, keep_container: bool
     ) -> Tuple[int, str]:
@@ -62,6 +62,59 @@ def test_report_failed_image_creation():
     assert not pkgs_status.called
 
 
+def test_create_test_images_once_per_image_group():
+    """
+    Given:
+        - Three packages, two of them resolve to the same docker image and one to a different image.
+
+    When:
+        - Creating the test images before linting the packages.
+
+    Then:
+        - Ensure a test image is created once per docker image group.
+        - Ensure every group is mapped to its test image and creation errors.
+    """
+    import concurrent.futures
+
+    from demisto_sdk.commands.lint import lint_manager
+
+    def mock_linter(image: str):
+        linter = MagicMock()
+        linter.docker_images = [[image, "3.10"]]
+        linter.get_test_image_key.side_effect = lambda docker_image: (
+            docker_image[0],
+            3,
+            TYPE_PYTHON,
+            (),
+        )
+        linter._docker_image_create.return_value = (f"devtest-{image}", "")
+        return linter
+
+    linters = [
+        mock_linter("demisto/python3:3.10.1"),
+        mock_linter("demisto/python3:3.10.1"),
+        mock_linter("demisto/python3:3.10.2"),
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        test_images = lint_manager.LintManager._create_test_images(
+            linters=linters, executor=executor
+        )
+
+    assert test_images == {
+        ("demisto/python3:3.10.1", 3, TYPE_PYTHON, ()): (
+            "devtest-demisto/python3:3.10.1",
+            "",
+        ),
+        ("demisto/python3:3.10.2", 3, TYPE_PYTHON, ()): (
+            "devtest-demisto/python3:3.10.2",
+            "",
+        ),
+    }
+    assert linters[0]._docker_image_create.call_count == 1
+    assert linters[1]._docker_image_create.call_count == 0
+    assert linters[2]._docker_image_create.call_count == 1
+
+
 def test_create_failed_unit_tests_report_with_failed_tests():
     """
     Given`:
@@ -5,7 +5,11 @@ import pytest
 from demisto_sdk.commands.common.constants import TYPE_PWSH, TYPE_PYTHON
 from demisto_sdk.commands.common.docker_helper import DockerBase
 from demisto_sdk.commands.lint import linter
-from demisto_sdk.commands.lint.linter import Linter
+from demisto_sdk.commands.lint.linter import (
+    Linter,
+    SharedContainerExecResult,
+    SharedTestContainers,
+)
 
 
 @dataclass
@@ -324,3 +328,154 @@ class TestRunLintInContainer:
         ].kwargs.get("name")
 
         assert container_name_native_image != container_name_native_dev_image
+
+
+class TestDockerImageCreate:
+    def test_shared_test_image_is_reused(self, mocker, linter_obj: Linter):
+        """
+        Given:
+            - A test image already created for the docker image group of the package.
+
+        When:
+            - Creating the test image of the package.
+
+        Then:
+            - Ensure the shared test image is returned without creating it again.
+        """
+        get_or_create_test_image_mock = mocker.patch.object(
+            DockerBase, "get_or_create_test_image"
+        )
+        linter_obj._pkg_lint_status["pack_type"] = TYPE_PYTHON
+        linter_obj._test_images[
+            linter_obj.get_test_image_key(["demisto/python3:3.10.1", "3.10"])
+        ] = ("devtestdemisto/python3:3.10.1-abc", "")
+
+        assert linter_obj._docker_image_create(
+            docker_base_image=["demisto/python3:3.10.1", "3.10"]
+        ) == ("devtestdemisto/python3:3.10.1-abc", "")
+        get_or_create_test_image_mock.assert_not_called()
+
+
+class TestSharedTestContainers:
+    def test_exec(self, mocker, tmp_path):
+        """
+        Given:
+            - Packages linted on the same test image, one of them requires network.
+
+        When:
+            - Running commands of the packages in the shared test containers.
+
+        Then:
+            - Ensure a single container is created for the test image per network setting.
+            - Ensure each command runs in a working directory of its own, with the environment of its package.
+            - Ensure the exit code and output of the command are returned once it finishes.
+        """
+        mocker.patch.object(linter, "SHARED_CONTAINER_EXEC_POLLING_INTERVAL", 0)
+        docker_client = mocker.MagicMock()
+        mocker.patch.object(
+            linter, "init_global_docker_client", return_value=docker_client
+        )
+        docker_client.api.exec_create.return_value = {"Id": "exec-id"}
+        docker_client.api.exec_inspect.side_effect = [
+            {"Running": True},
+            {"Running": False, "ExitCode": 1},
+            {"Running": False, "ExitCode": 0},
+            {"Running": False, "ExitCode": 0},
+        ]
+        create_container_mock = mocker.patch.object(DockerBase, "create_container")
+        copy_files_mock = mocker.patch.object(DockerBase, "copy_files_container")
+        mocker.patch.object(linter, "get_file_from_container", return_value="output")
+
+        shared_containers = SharedTestContainers()
+        results = [
+            shared_containers.exec(
+                test_image="test-image",
+                command="pylint",
+                pack_dir=tmp_path / pack_name,
+                environment={"PACK": pack_name},
+                user="1000:4000",
+                network_disabled=network_disabled,
+            )
+            for pack_name, network_disabled in (
+                ("Pack0", True),
+                ("Pack1", True),
+                ("Pack2", False),
+            )
+        ]
+
+        assert create_container_mock.call_count == 2
+        assert [
+            call.kwargs["network_disabled"]
+            for call in create_container_mock.call_args_list
+        ] == [True, False]
+        assert [result.exit_code for result in results] == [1, 0, 0]
+        assert all(result.output == "output" for result in results)
+        workdirs = [result.workdir for result in results]
+        assert len(set(workdirs)) == 3
+        assert [
+            call.args[1][0][1] for call in copy_files_mock.call_args_list
+        ] == workdirs
+        exec_create_kwargs = docker_client.api.exec_create.call_args_list[2].kwargs
+        assert exec_create_kwargs["environment"] == {"PACK": "Pack2"}
+        assert exec_create_kwargs["workdir"] == workdirs[2]
+        assert exec_create_kwargs["user"] == "1000:4000"
+
+        shared_containers.remove()
+        assert create_container_mock.return_value.remove.call_count == 2
+
+    def test_run_linters_in_shared_container(self, mocker, linter_obj: Linter):
+        """
+        Given:
+            - A linter sharing the test containers with other linters.
+
+        When:
+            - Running pylint and pytest of the package.
+
+        Then:
+            - Ensure the checks run in the shared container instead of a container of their own.
+            - Ensure pytest saves its reports in the working directory of the package, without network.
+            - Ensure the working directory of the package is removed afterwards.
+        """
+        create_container_mock = mocker.patch.object(DockerBase, "create_container")
+        mocker.patch.object(linter, "json")
+        linter.json.loads.return_value = {"report": {"tests": []}}
+        get_file_mock = mocker.patch.object(linter, "get_file_from_container")
+        shared_containers = mocker.MagicMock(spec=SharedTestContainers)
+        shared_containers.exec.side_effect = [
+            SharedContainerExecResult(
+                exit_code=1,
+                output="errors",
+                container=mocker.MagicMock(),
+                workdir="/devwork/pack-1",
+            ),
+            SharedContainerExecResult(
+                exit_code=0,
+                output="",
+                container=mocker.MagicMock(),
+                workdir="/devwork/pack-2",
+            ),
+        ]
+        linter_obj._shared_containers = shared_containers
+        linter_obj._linter_to_commands()
+
+        assert linter_obj._docker_run_linter(
+            linter="pylint", test_image="test-image", keep_container=False
+        ) == (1, "errors")
+        exit_code, _, _ = linter_obj._docker_run_pytest(
+            test_image="test-image",
+            keep_container=False,
+            test_xml="",
+            no_coverage=True,
+            should_disable_network=True,
+        )
+
+        assert exit_code == 0
+        create_container_mock.assert_not_called()
+        pytest_exec_kwargs = shared_containers.exec.call_args_list[1].kwargs
+        assert "--json=./report_pytest.json" in pytest_exec_kwargs["command"]
+        assert pytest_exec_kwargs["network_disabled"]
+        assert (
+            get_file_mock.call_args.kwargs["container_path"]
+            == "/devwork/pack-2/report_pytest.json"
+        )
+        assert shared_containers.remove_workdir.call_count == 2
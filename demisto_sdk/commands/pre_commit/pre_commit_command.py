@@ -4,10 +4,10 @@ import re
 import subprocess
 import sys
 from collections import defaultdict
-from functools import partial
+from functools import lru_cache, partial
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
 
 import more_itertools
 from packaging.version import Version
@@ -17,21 +17,33 @@ from demisto_sdk.commands.common.constants import (
     DEFAULT_PYTHON_VERSION,
     INTEGRATIONS_DIR,
     PACKS_FOLDER,
+    PACKS_PACK_META_FILE_NAME,
     SCRIPTS_DIR,
 )
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH, PYTHONPATH
 from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.docker.docker_image import DockerImage
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import should_disable_multiprocessing, write_dict
+from demisto_sdk.commands.common.string_to_bool import string_to_bool
+from demisto_sdk.commands.common.tools import (
+    get_file,
+    get_pack_name,
+    get_value,
+    should_disable_multiprocessing,
+    write_dict,
+)
 from demisto_sdk.commands.content_graph.commands.update import update_content_graph
 from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
-from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.content_graph.objects.integration import Integration
 from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
 from demisto_sdk.commands.content_graph.objects.script import Script
+from demisto_sdk.commands.content_graph.parsers.content_item import (
+    ContentItemParser,
+)
 from demisto_sdk.commands.pre_commit.hooks.docker import DockerHook
 from demisto_sdk.commands.pre_commit.hooks.hook import GeneratedHooks, Hook, join_files
 from demisto_sdk.commands.pre_commit.hooks.mypy import MypyHook
@@ -391,6 +403,72 @@ class PreCommitRunner:
         return ret_val
 
 
+@lru_cache
+def _get_pack_support(pack_path: Path) -> str:
+    pack_metadata_path = pack_path / PACKS_PACK_META_FILE_NAME
+    if not pack_metadata_path.exists():
+        return ""
+    return (get_file(pack_metadata_path) or {}).get("support") or ""
+
+
+def parse_integration_script_metadata(
+    code_dir: Path,
+) -> Optional[IntegrationScript]:
+    """A lightweight alternative to `BaseContent.from_path` for integrations and scripts.
+
+    Only the YAML keys needed to group the files by language are read (id, name, type, docker images,
+    deprecation and support level), skipping the related files, git status, relationships and the model validation.
+
+    Args:
+        code_dir (Path): The integration/script directory.
+
+    Returns:
+        Optional[IntegrationScript]: An unvalidated Integration/Script model holding only the pre-commit metadata,
+        or None if the directory does not hold a valid integration/script.
+    """
+    if code_dir.parent.name == INTEGRATIONS_DIR:
+        model: Type[IntegrationScript] = Integration
+        script_prefix = "script."
+    elif code_dir.parent.name == SCRIPTS_DIR:
+        model = Script
+        script_prefix = ""
+    else:
+        return None
+
+    yml_paths = [path for path in code_dir.iterdir() if path.suffix == ".yml"]
+    if not yml_paths:
+        logger.debug(f"Pre-Commit: could not find a yml file in {code_dir}, skipping")
+        return None
+    yml_path = next(
+        (path for path in yml_paths if path.stem == code_dir.name), yml_paths[0]
+    )
+    try:
+        yml_data = get_file(yml_path, raise_on_error=True)
+    except Exception as e:
+        logger.debug(f"Pre-Commit: could not load {yml_path}, skipping: {e}")
+        return None
+    if not isinstance(yml_data, dict):
+        return None
+
+    return model.construct(
+        path=yml_path,
+        object_id=get_value(yml_data, "commonfields.id"),
+        name=yml_data.get("name"),
+        type=get_value(yml_data, f"{script_prefix}type"),
+        docker_image=DockerImage(
+            get_value(yml_data, f"{script_prefix}dockerimage", "") or ""
+        ),
+        alt_docker_images=get_value(yml_data, f"{script_prefix}alt_dockerimages", [])
+        or [],
+        deprecated=string_to_bool(
+            get_value(yml_data, "deprecated", False), default_when_empty=False
+        ),
+        is_unified=ContentItemParser.is_unified_file(yml_path),
+        support=yml_data.get("supportlevelheader")
+        or _get_pack_support(code_dir.parent.parent),
+    )
+
+
 def group_by_language(
     files: Set[Path],
 ) -> Tuple[Dict[str, Set[Tuple[Path, Optional[IntegrationScript]]]], Set[Path]]:
@@ -436,29 +514,33 @@ def group_by_language(
     language_to_files: Dict[str, Set] = defaultdict(set)
     integrations_scripts: Set[IntegrationScript] = set()
     logger.debug("Pre-Commit: Starting to parse all integrations and scripts")
-    for integration_script_paths in more_itertools.chunked_even(
-        integrations_scripts_mapping.keys(), INTEGRATIONS_BATCH
-    ):
-        if should_disable_multiprocessing():
-            # Run sequentially
-            content_items: List[Optional[BaseContent]] = list(
-                map(BaseContent.from_path, integration_script_paths)
-            )
-        else:
-            # Use multiprocessing (not supported when running within Content scripts/integrations).
-            with multiprocessing.Pool(processes=cpu_count()) as pool:
-                content_items = list(
-                    pool.map(BaseContent.from_path, integration_script_paths)
+    if should_disable_multiprocessing():
+        # Run sequentially
+        content_items: List[Optional[IntegrationScript]] = list(
+            map(parse_integration_script_metadata, integrations_scripts_mapping)
+        )
+    else:
+        # Use multiprocessing (not supported when running within Content scripts/integrations).
+        # A single pool is shared by all the batches, to avoid re-spawning the workers per batch.
+        content_items = []
+        with multiprocessing.Pool(processes=cpu_count()) as pool:
+            for integration_script_paths in more_itertools.chunked_even(
+                integrations_scripts_mapping.keys(), INTEGRATIONS_BATCH
+            ):
+                content_items.extend(
+                    pool.map(
+                        parse_integration_script_metadata, integration_script_paths
+                    )
                 )
 
-        for content_item in content_items:
-            if isinstance(content_item, IntegrationScript):
-                integrations_scripts.add(content_item)
+    for content_item in content_items:
+        if isinstance(content_item, IntegrationScript):
+            integrations_scripts.add(content_item)
 
     logger.debug("Pre-Commit: Finished parsing all integrations and scripts")
     exclude_integration_script = set()
     for integration_script in integrations_scripts:
-        if (pack := integration_script.in_pack) and pack.object_id == API_MODULES_PACK:
+        if get_pack_name(integration_script.path) == API_MODULES_PACK:
             # add api modules to the api_modules list, we will handle them later
             api_modules.append(integration_script)
             continue
@@ -489,7 +571,7 @@ def group_by_language(
                 )
         logger.debug("Pre-Commit: Finished handling API Modules")
     for integration_script in integrations_scripts:
-        if (pack := integration_script.in_pack) and pack.object_id == API_MODULES_PACK:
+        if get_pack_name(integration_script.path) == API_MODULES_PACK:
             # we dont need to lint them individually, they will be run with the integrations that uses them
             continue
         if integration_script.deprecated:
@@ -258,6 +258,50 @@ def test_handle_api_modules(mocker, git_repo: Repo):
     ) in files_to_run
 
 
+def test_parse_integration_script_metadata(repo: Repo):
+    """
+    Given:
+        - An integration and a script, the script is deprecated and has alternative docker images
+
+    When:
+        - Parsing them with the lightweight parser used to group the files by language
+
+    Then:
+        - Ensure the parsed objects hold the same pre-commit metadata as the fully parsed content items
+        - Ensure the support level is taken from the pack metadata
+    """
+    from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+
+    pack = repo.create_pack("Pack1")
+    integration = pack.create_integration(
+        "integration1", docker_image="demisto/python3:3.10.2.14969"
+    )
+    script = pack.create_script("script1", docker_image="demisto/python3:3.9.1.14969")
+    script.yml.update(
+        {"deprecated": True, "alt_dockerimages": ["demisto/python3:3.10.2.1"]}
+    )
+
+    for content_item in (integration, script):
+        parsed = pre_commit_command.parse_integration_script_metadata(
+            Path(content_item.path)
+        )
+        expected = BaseContent.from_path(Path(content_item.path))
+        assert isinstance(parsed, type(expected))
+        assert parsed.path == expected.path
+        for attr in (
+            "object_id",
+            "name",
+            "type",
+            "docker_image",
+            "docker_images",
+            "deprecated",
+            "is_unified",
+            "is_powershell",
+        ):
+            assert getattr(parsed, attr) == getattr(expected, attr), attr
+        assert parsed.support == "xsoar"
+
+
 @pytest.mark.parametrize("github_actions", [True, False])
 def test_ruff_hook(github_actions, mocker):
     """
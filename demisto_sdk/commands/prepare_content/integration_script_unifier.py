@@ -4,8 +4,9 @@ import glob
 import os
 import re
 import tempfile
+from hashlib import sha1
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 from inflection import dasherize, underscore
 from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
@@ -65,6 +66,20 @@ CONTRIBUTOR_COMMUNITY_DETAILED_DESC = (
 INTEGRATIONS_DOCS_REFERENCE = "https://xsoar.pan.dev/docs/reference/integrations/"
 
 
+class ExpandedApiModule(NamedTuple):
+    # the API module code, with the code of the API modules it imports inserted in place of the imports
+    code: str
+    # the name and source hash of every API module included in the code, keyed by the module path
+    sources: Dict[str, Tuple[str, str]]
+
+
+# the expanded API modules of this process, keyed by the module path
+API_MODULES_CODE_CACHE: Dict[str, ExpandedApiModule] = {}
+API_MODULES_CACHE_HITS: Dict[str, int] = {}
+# the source hash of every API module file, with the modification time and size of the file when it was hashed
+API_MODULES_SOURCE_HASHES: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
 class IntegrationScriptUnifier(Unifier):
     @staticmethod
     def unify(
@@ -442,25 +457,9 @@ class IntegrationScriptUnifier(Unifier):
         :return: The integration script with the module code appended in place of the import
         """
         for module_import, module_name in import_to_name.items():
-            module_path = Path(
-                content_path,
-                "Packs",
-                "ApiModules",
-                "Scripts",
-                module_name,
-                f"{module_name}.py",
-            )
-            module_code = IntegrationScriptUnifier._get_api_module_code(
-                module_name, module_path
-            )
-
-            # handles cases where ApiModuleA imports ApiModuleB
-            tmp_imports_to_names = IntegrationScriptUnifier.check_api_module_imports(
-                module_code
-            )
-            module_code = IntegrationScriptUnifier.insert_module_code(
-                module_code, tmp_imports_to_names, content_path
-            )
+            module_code = IntegrationScriptUnifier.get_expanded_api_module(
+                module_name, content_path
+            ).code
 
             # the wrapper numbers represents the number of generated lines added
             # before (negative) or after (positive) the registration line
@@ -476,6 +475,88 @@ class IntegrationScriptUnifier(Unifier):
             script_code = script_code.replace(module_import, module_code)
         return script_code
 
+    @staticmethod
+    def get_api_module_path(module_name: str, content_path: Path) -> Path:
+        return Path(
+            content_path,
+            "Packs",
+            "ApiModules",
+            "Scripts",
+            module_name,
+            f"{module_name}.py",
+        )
+
+    @staticmethod
+    def get_expanded_api_module(
+        module_name: str, content_path: Path
+    ) -> ExpandedApiModule:
+        """
+        Gets the API module code, with the API modules it imports inserted in place of their imports.
+        The expanded code is cached, and is expanded again only when the source of one of the included modules changes.
+        :param module_name: The API module name
+        :param content_path: The path to the content repo
+        :return: The expanded API module
+        """
+        module_path = str(
+            IntegrationScriptUnifier.get_api_module_path(module_name, content_path)
+        )
+        cached_module = API_MODULES_CODE_CACHE.get(module_path)
+        if cached_module and all(
+            IntegrationScriptUnifier._get_api_module_hash(name, Path(path))
+            == source_hash
+            for path, (name, source_hash) in cached_module.sources.items()
+        ):
+            API_MODULES_CACHE_HITS[module_name] = (
+                API_MODULES_CACHE_HITS.get(module_name, 0) + 1
+            )
+            logger.debug(
+                f"Using the cached code of {module_name} ({API_MODULES_CACHE_HITS[module_name]} cache hits)"
+            )
+            return cached_module
+
+        module_code = IntegrationScriptUnifier._get_api_module_code(
+            module_name, Path(module_path)
+        )
+        sources = {module_path: (module_name, sha1(module_code.encode()).hexdigest())}
+        # handles cases where ApiModuleA imports ApiModuleB
+        tmp_imports_to_names = IntegrationScriptUnifier.check_api_module_imports(
+            module_code
+        )
+        for imported_module_name in tmp_imports_to_names.values():
+            sources.update(
+                IntegrationScriptUnifier.get_expanded_api_module(
+                    imported_module_name, content_path
+                ).sources
+            )
+        module_code = IntegrationScriptUnifier.insert_module_code(
+            module_code, tmp_imports_to_names, content_path
+        )
+
+        API_MODULES_CODE_CACHE[module_path] = ExpandedApiModule(module_code, sources)
+        return API_MODULES_CODE_CACHE[module_path]
+
+    @staticmethod
+    def cache_api_modules(content_path: Path):
+        """
+        Expands all the API modules of the content repo into the cache, so the processes forked afterwards
+        (e.g. the workers dumping the packs) use it instead of expanding the API modules themselves.
+        :param content_path: The path to the content repo
+        """
+        api_modules_path = Path(content_path, "Packs", "ApiModules", "Scripts")
+        if not api_modules_path.is_dir():
+            return
+        for module_dir in sorted(api_modules_path.iterdir()):
+            if not module_dir.name.endswith(API_MODULE_FILE_SUFFIX):
+                continue
+            try:
+                IntegrationScriptUnifier.get_expanded_api_module(
+                    module_dir.name, content_path
+                )
+            except ValueError as e:
+                # the error is raised again when unifying the items importing the module
+                logger.debug(str(e))
+        logger.debug(f"Cached the code of {len(API_MODULES_CODE_CACHE)} API modules")
+
     @staticmethod
     def insert_pack_version(
         script_type: str, script_code: str, pack_version: str, pack_name: str
@@ -539,6 +620,37 @@ class IntegrationScriptUnifier(Unifier):
 
         return module_code
 
+    @staticmethod
+    def _get_api_module_hash(module_name, module_path) -> str:
+        """
+        Gets the hash of the API module source, which is calculated again only when the file is modified.
+        :param module_name: The API module name
+        :param module_path: The API module code file path
+        :return: The API module source hash
+        """
+        try:
+            stat = module_path.stat()
+            file_signature: Optional[Tuple[int, int]] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
+        except OSError:
+            file_signature = None
+        if file_signature and (
+            cached_hash := API_MODULES_SOURCE_HASHES.get(str(module_path))
+        ):
+            if cached_hash[0] == file_signature:
+                return cached_hash[1]
+
+        source_hash = sha1(
+            IntegrationScriptUnifier._get_api_module_code(
+                module_name, module_path
+            ).encode()
+        ).hexdigest()
+        if file_signature:
+            API_MODULES_SOURCE_HASHES[str(module_path)] = (file_signature, source_hash)
+        return source_hash
+
     @staticmethod
     def clean_python_code(script_code, remove_print_future=True):
         # we use '[ \t]' and not \s as we don't want to match newline
@@ -1,7 +1,9 @@
 import os
 import re
+import shutil
+import threading
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse
 
 from demisto_sdk.commands.common.constants import (
@@ -18,13 +20,15 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
-    get_file,
     run_sync,
     write_dict,
 )
 
 json = JSON_Handler()
 
+# the directory (next to the artifact file) where each process writes the updates of an artifact file
+MARKDOWN_IMAGES_SHARDS_DIR_SUFFIX = "_shards"
+
 
 def update_markdown_images_with_urls_and_rel_paths(
     markdown_path: Path,
@@ -41,21 +45,103 @@ def update_markdown_images_with_urls_and_rel_paths(
     return (urls_dict, rel_paths_dict)
 
 
-def safe_init_json_file(file_path: str):
-    """Calling the init_json_file function using the synced function.
+def get_markdown_images_shard(markdown_images_file_name: str) -> Optional[Path]:
+    """Get the shard file of the current process (and thread) for a markdown images artifact file.
+    Each process appends its updates to its own shard, so no locking is needed while dumping,
+    and the shards are merged into the artifact file once, by merge_markdown_images_shards.
 
     Args:
-        file_path (str): The json file path to init
+        markdown_images_file_name (str): The artifact file name.
+
+    Returns:
+        Path: The shard file, or None if there is no artifacts folder.
     """
     if (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
         artifacts_folder
     ).exists():
-        lock_file_path = f"{artifacts_folder}/{file_path.replace('json', 'lock')}"
-        run_sync(
-            lock_file_path,
-            init_json_file,
-            {"markdown_images_file_name": file_path},
+        shard = Path(
+            artifacts_folder,
+            f"{Path(markdown_images_file_name).stem}{MARKDOWN_IMAGES_SHARDS_DIR_SUFFIX}",
+            f"{os.getpid()}-{threading.get_ident()}.jsonl",
         )
+        shard.parent.mkdir(exist_ok=True)
+        # the artifact file is created even if no images are found
+        shard.touch()
+        return shard
+    return None
+
+
+def append_to_markdown_images_shard(
+    shard: Path, images_dict: dict, pack_name: str, file_type: ImagesFolderNames
+):
+    """Append an update of the markdown images artifact file to the shard of the current process.
+
+    Args:
+        shard (Path): The shard file to append to.
+        images_dict (dict): The dict contains all the images info for the current pack.
+        pack_name (str): The name of the pack to update.
+        file_type (ImagesFolderNames): The markdown file the pics was obtained from.
+    """
+    with shard.open("a") as f:
+        f.write(
+            json.dumps(
+                {
+                    "images_dict": images_dict,
+                    "pack_name": pack_name,
+                    "file_type": file_type.value,
+                }
+            )
+            + "\n"
+        )
+
+
+def merge_markdown_images_shards():
+    """Merge the shards written by all the processes into the markdown images artifact files.
+    Called once the dump is done. The merge itself is synced, as several dumps may share the artifacts folder.
+    """
+    if (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
+        artifacts_folder
+    ).exists():
+        for file_name in (
+            MARKDOWN_IMAGES_ARTIFACT_FILE_NAME,
+            MARKDOWN_RELATIVE_PATH_IMAGES_ARTIFACT_FILE_NAME,
+        ):
+            shards_dir = Path(
+                artifacts_folder,
+                f"{Path(file_name).stem}{MARKDOWN_IMAGES_SHARDS_DIR_SUFFIX}",
+            )
+            if shards_dir.exists():
+                run_sync(
+                    f"{artifacts_folder}/{file_name.replace('json', 'lock')}",
+                    merge_markdown_images_file_shards,
+                    {"shards_dir": shards_dir, "markdown_images_file_name": file_name},
+                )
+
+
+def merge_markdown_images_file_shards(shards_dir: Path, markdown_images_file_name: str):
+    """Merge the shards of a markdown images artifact file into it, and delete them.
+
+    Args:
+        shards_dir (Path): The directory of the shards.
+        markdown_images_file_name (str): The artifact file name.
+    """
+    artifacts_markdown_images_path = shards_dir.parent / markdown_images_file_name
+    markdown_images_data_dict = (
+        json.loads(artifacts_markdown_images_path.read_text())
+        if artifacts_markdown_images_path.exists()
+        else {}
+    )
+    for shard in sorted(shards_dir.glob("*.jsonl")):
+        for line in shard.read_text().splitlines():
+            update = json.loads(line)
+            add_markdown_images_to_dict(
+                markdown_images_data_dict,
+                update["images_dict"],
+                update["pack_name"],
+                ImagesFolderNames(update["file_type"]),
+            )
+    write_dict(artifacts_markdown_images_path, data=markdown_images_data_dict, indent=4)
+    shutil.rmtree(shards_dir)
 
 
 def replace_markdown_urls_and_update_markdown_images(
@@ -75,7 +161,7 @@ def replace_markdown_urls_and_update_markdown_images(
     Returns:
         - A dict in the form of {pack_name: [images_data]} or empty dict if no images urls were found in the README
     """
-    safe_init_json_file(MARKDOWN_IMAGES_ARTIFACT_FILE_NAME)
+    shard = get_markdown_images_shard(MARKDOWN_IMAGES_ARTIFACT_FILE_NAME)
     urls_list = collect_images_from_markdown_and_replace_with_storage_path(
         markdown_path, pack_name, marketplace, file_type
     )
@@ -85,9 +171,8 @@ def replace_markdown_urls_and_update_markdown_images(
         return {}
 
     save_to_artifact = {pack_name: {file_type: urls_list}}
-    safe_update_markdown_images_file_links(
-        save_to_artifact, pack_name, file_type, MARKDOWN_IMAGES_ARTIFACT_FILE_NAME
-    )
+    if shard:
+        append_to_markdown_images_shard(shard, save_to_artifact, pack_name, file_type)
 
     logger.debug(f"returning the following urls to artifacts.\n{save_to_artifact=}")
     return save_to_artifact
@@ -110,7 +195,7 @@ def replace_markdown_rel_paths_and_upload_to_artifacts(
     Returns:
         - A dict in the form of {pack_name: [images_data]} or empty dict if no images relative paths were found in the README
     """
-    safe_init_json_file(MARKDOWN_RELATIVE_PATH_IMAGES_ARTIFACT_FILE_NAME)
+    shard = get_markdown_images_shard(MARKDOWN_RELATIVE_PATH_IMAGES_ARTIFACT_FILE_NAME)
     rel_paths_list = (
         collect_images_relative_paths_from_markdown_and_replace_with_storage_path(
             markdown_path, pack_name, marketplace, file_type
@@ -122,43 +207,13 @@ def replace_markdown_rel_paths_and_upload_to_artifacts(
         return {}
 
     save_to_artifact = {pack_name: {file_type: rel_paths_list}}
-    safe_update_markdown_images_file_links(
-        save_to_artifact,
-        pack_name,
-        file_type,
-        MARKDOWN_RELATIVE_PATH_IMAGES_ARTIFACT_FILE_NAME,
-    )
+    if shard:
+        append_to_markdown_images_shard(shard, save_to_artifact, pack_name, file_type)
 
     logger.debug(f"Saved the following rel_paths to artifacts.\n{save_to_artifact=}")
     return save_to_artifact
 
 
-def safe_update_markdown_images_file_links(
-    images_dict, pack_name, file_type, image_file_path
-):
-    """Calling the update_markdown_images_file_links function using the synced function.
-
-    Args:
-        images_dict (dict): The dict contains all the images info for the current pack.
-        pack_name (str): The name of the pack to update.
-        file_type (ImagesFolderNames): The markdown file the pics was obtained from.
-        image_file_path (str): The json file path to update
-    """
-    if (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
-        artifacts_folder
-    ).exists():
-        run_sync(
-            f"{artifacts_folder}/{image_file_path.replace('json', 'lock')}",
-            update_markdown_images_file_links,
-            {
-                "images_dict": images_dict,
-                "pack_name": pack_name,
-                "file_type": file_type,
-                "markdown_images_file_name": image_file_path,
-            },
-        )
-
-
 def collect_images_from_markdown_and_replace_with_storage_path(
     markdown_path: Path,
     pack_name: str,
@@ -227,71 +282,35 @@ def collect_images_from_markdown_and_replace_with_storage_path(
     return urls_list
 
 
-def init_json_file(markdown_images_file_name: str):
-    """Initialize a json file at with the given file name if doesn't exist.
-
-    Args:
-        markdown_images_file_name (str): The file name to create.
-    """
-    if (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
-        artifacts_folder
-    ).exists():
-        artifacts_markdown_images_path = Path(
-            f"{artifacts_folder}/{markdown_images_file_name}"
-        )
-        if not artifacts_markdown_images_path.exists():
-            with open(artifacts_markdown_images_path, "w") as f:
-                # If this is the first pack init the file with an empty dict.
-                json.dump({}, f)
-
-
-def update_markdown_images_file_links(
+def add_markdown_images_to_dict(
+    markdown_images_data_dict: dict,
     images_dict: dict,
     pack_name: str,
     file_type: ImagesFolderNames,
-    markdown_images_file_name: str = MARKDOWN_IMAGES_ARTIFACT_FILE_NAME,
 ):
-    """Update the markdown_images.json file containing all the modified links.
+    """Add the images info of a pack markdown file to the markdown images data.
 
     Args:
+        markdown_images_data_dict (dict): The markdown images data to update.
         images_dict (dict): The dict contains all the images info for the current pack.
         pack_name (str): The name of the pack to update.
         file_type (ImagesFolderNames): The markdown file the pics was obtained from.
-        markdown_images_file_name (str): The file to write the results into. The default is markdown_images.json
     """
-    if (artifacts_folder := os.getenv("ARTIFACTS_FOLDER")) and Path(
-        artifacts_folder
-    ).exists():
-        artifacts_markdown_images_path = Path(
-            f"{artifacts_folder}/{markdown_images_file_name}"
-        )
-
-        markdown_images_data_dict = get_file(
-            artifacts_markdown_images_path, raise_on_error=True
-        )
-        if pack_name in markdown_images_data_dict:
-            integration_desc = ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES.value
-            if (
-                file_type == ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
-                and markdown_images_data_dict.get(pack_name, {}).get(
-                    integration_desc, {}
-                )
-            ):
-                # There is already an entry for the integration_description_images.
-                markdown_images_data_dict[pack_name][integration_desc].append(
-                    images_dict[pack_name][integration_desc]
-                )
-            else:
-                # No entry for the readme images of the integration_description_images.
-                markdown_images_data_dict[pack_name].update(images_dict[pack_name])
+    if pack_name in markdown_images_data_dict:
+        integration_desc = ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES.value
+        if (
+            file_type == ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+            and markdown_images_data_dict.get(pack_name, {}).get(integration_desc, {})
+        ):
+            # There is already an entry for the integration_description_images.
+            markdown_images_data_dict[pack_name][integration_desc].append(
+                images_dict[pack_name][integration_desc]
+            )
         else:
-            markdown_images_data_dict.update(images_dict)
-
-        write_dict(
-            artifacts_markdown_images_path,
-            data=markdown_images_data_dict,
-            indent=4,
-        )
+            # No entry for the readme images of the integration_description_images.
+            markdown_images_data_dict[pack_name].update(images_dict[pack_name])
+    else:
+        markdown_images_data_dict.update(images_dict)
 
 
 def collect_images_relative_paths_from_markdown_and_replace_with_storage_path(
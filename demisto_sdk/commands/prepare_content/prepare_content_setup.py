@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import List
 
 import typer
 
@@ -67,12 +68,14 @@ def prepare_content(
         help="Whether to ignore the addition of the native image key to "
         "the YML of a script/integration",
     ),
-    marketplace: MarketplaceVersions = typer.Option(
-        MarketplaceVersions.XSOAR,
+    marketplace: List[MarketplaceVersions] = typer.Option(
+        [MarketplaceVersions.XSOAR],
         "-mp",
         "--marketplace",
         help="The marketplace the content items are created for, "
-        "that determines usage of marketplace unique text.",
+        "that determines usage of marketplace unique text. "
+        "Can be used multiple times with '-a', to prepare the content for each of the marketplaces "
+        "in a directory of its own under the output path.",
     ),
     console_log_threshold: str = typer.Option(
         None,
@@ -95,16 +98,36 @@ def prepare_content(
         sum([bool(all), bool(input)]) == 1
     ), "Exactly one of '-a' or '-i' must be provided."
 
+    marketplaces = list(dict.fromkeys(marketplace))
+
     # Process `all` option
     if all:
         content_dto = ContentDTO.from_path()
         output_path = output or Path(".")
-        content_dto.dump(
-            dir=output_path / "prepare-content-tmp",
-            marketplace=parse_marketplace_kwargs({"marketplace": marketplace}),
-        )
+        if len(marketplaces) == 1:
+            content_dto.dump(
+                dir=output_path / "prepare-content-tmp",
+                marketplace=parse_marketplace_kwargs({"marketplace": marketplaces[0]}),
+                use_multiprocessing=True,
+            )
+        else:
+            # the content items are read and prepared once for all the marketplaces
+            content_dto.dump_marketplaces(
+                {
+                    marketplace_version: output_path
+                    / marketplace_version.value
+                    / "prepare-content-tmp"
+                    for marketplace_version in marketplaces
+                },
+                use_multiprocessing=True,
+            )
         raise typer.Exit(0)
 
+    assert (
+        len(marketplaces) == 1
+    ), "Several marketplaces can be provided only together with '-a'."
+    ctx.params["marketplace"] = marketplaces[0]
+
     # Split and process inputs
     inputs = input.split(",") if input else []
     output_path = output if output else Path(".")
@@ -129,8 +152,7 @@ def prepare_content(
         update_command_args_from_config_file("unify", ctx.params)
 
         file_type = find_type(input_content)
-        if marketplace:
-            os.environ[ENV_DEMISTO_SDK_MARKETPLACE] = marketplace.lower()
+        os.environ[ENV_DEMISTO_SDK_MARKETPLACE] = marketplaces[0].lower()
 
         # Execute the appropriate unification method
         if file_type == FileType.GENERIC_MODULE:
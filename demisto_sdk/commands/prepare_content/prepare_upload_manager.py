@@ -19,6 +19,9 @@ from demisto_sdk.commands.content_graph.interface import (
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.pack import Pack
+from demisto_sdk.commands.prepare_content.markdown_images_handler import (
+    merge_markdown_images_shards,
+)
 
 
 class PrepareUploadManager:
@@ -67,6 +70,7 @@ class PrepareUploadManager:
         output: Path  # Output is not optional anymore (for mypy)
         if isinstance(content_item, Pack):
             Pack.dump(content_item, output, marketplace)
+            merge_markdown_images_shards()
             shutil.make_archive(str(output), "zip", output)
             shutil.rmtree(output)
             return output.with_suffix(".zip")
@@ -76,6 +80,7 @@ class PrepareUploadManager:
             )
         content_item: ContentItem
         data = content_item.prepare_for_upload(marketplace, **kwargs)
+        merge_markdown_images_shards()
         if output.exists() and not force:
             raise FileExistsError(
                 f"Output file {output} already exists. Use --force to overwrite."
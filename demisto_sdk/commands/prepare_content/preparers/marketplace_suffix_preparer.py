@@ -1,4 +1,5 @@
-from typing import Any
+from copy import copy
+from typing import Any, Dict, Iterable, List, Optional
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.logger import logger
@@ -17,60 +18,121 @@ class MarketplaceSuffixPreparer:
         then use that value as the value of the original field (the corresponding one without the suffix).
         Args:
             data: content item data
-            supported_marketplaces: list of the marketplaces this content item supports.
             current_marketplace: Marketplace. Used to determine the specific suffix
 
         Returns: A (possibliy) modified content item data
 
         """
+        return MarketplaceSuffixPreparer.prepare_for_marketplaces(
+            data, [current_marketplace]
+        )[current_marketplace]
+
+    @staticmethod
+    def prepare_for_marketplaces(
+        data: dict,
+        marketplaces: Iterable[MarketplaceVersions],
+    ) -> Dict[MarketplaceVersions, dict]:
+        """
+        Prepares the content item data for several marketplaces in a single traversal, as done by `prepare`.
+        The given data is not modified. The parts of it without suffixed fields are the same in all the marketplaces,
+        so they are shared by the returned data of all the marketplaces instead of being copied.
+        Args:
+            data: content item data
+            marketplaces: The marketplaces to prepare the data for.
+
+        Returns: The (possibly) modified content item data of each of the marketplaces
+
+        """
+        marketplaces_list: List[MarketplaceVersions] = list(marketplaces)
+        marketplaces_suffixes = [
+            MarketplaceSuffixPreparer._get_suffixes(marketplace)
+            for marketplace in marketplaces_list
+        ]
+
+        def fix_recursively(datum: Any) -> Optional[list]:
+            """Returns the fixed datum of each of the marketplaces, or None if the datum does not change"""
+            if isinstance(datum, list):
+                fixed_items = [fix_recursively(item) for item in datum]
+                if all(fixed_item is None for fixed_item in fixed_items):
+                    return None
+                return [
+                    [
+                        item if fixed_item is None else fixed_item[i]
+                        for item, fixed_item in zip(datum, fixed_items)
+                    ]
+                    for i in range(len(marketplaces_list))
+                ]
+
+            elif isinstance(datum, dict):
+                fixed_values = {
+                    key: fixed_value
+                    for key, value in datum.items()
+                    if (fixed_value := fix_recursively(value)) is not None
+                }
+                suffixed_keys = [
+                    key for key in datum if isinstance(key, str) and SEPARATOR in key
+                ]
+                if not fixed_values and not suffixed_keys:
+                    return None
+                fixed_data = []
+                for i, suffixes in enumerate(marketplaces_suffixes):
+                    fixed_datum = copy(datum)
+                    for key, fixed_value in fixed_values.items():
+                        fixed_datum[key] = fixed_value[i]
+                    MarketplaceSuffixPreparer._replace_suffixed_keys(
+                        fixed_datum, suffixed_keys, suffixes
+                    )
+                    fixed_data.append(fixed_datum)
+                return fixed_data
+            return None
+
+        if not isinstance(data, dict):
+            raise ValueError(
+                f"unexpected result type {type(data)}, expected dictionary"
+            )
+        fixed_data = fix_recursively(data)
+        return {
+            marketplace: data if fixed_data is None else fixed_data[i]
+            for i, marketplace in enumerate(marketplaces_list)
+        }
+
+    @staticmethod
+    def _get_suffixes(current_marketplace: MarketplaceVersions) -> List[str]:
         suffix = f"{SEPARATOR}{current_marketplace.value}"
         suffixes = [suffix]
         if current_marketplace == MarketplaceVersions.XSOAR_ON_PREM:
             suffixes.append(f"{SEPARATOR}{MarketplaceVersions.XSOAR.value}")
         if current_marketplace == MarketplaceVersions.XSOAR_SAAS:
             suffixes.append(f"{SEPARATOR}{MarketplaceVersions.XSOAR.value}")
+        return suffixes
 
-        def fix_recursively(datum: Any) -> Any:
-            if isinstance(datum, list):
-                return [fix_recursively(item) for item in datum]
-
-            elif isinstance(datum, dict):
-                for key in tuple(
-                    datum.keys()
-                ):  # deliberately not iterating over .items(), as the dict changes during iteration
-                    value = datum[key]
-                    if isinstance(value, (list, dict)):
-                        fix_recursively(value)
-                    if SEPARATOR not in key:
-                        continue
-                    for suffix in suffixes:
-                        # iterate each suffix to see if it's relevant for the key.
-                        # the order of the suffixes matter, as XSOAR_SAAS and XSOAR_ON_PREM are more specific
-                        suffix_len = len(suffix)
-                        if isinstance(key, str) and key.casefold().endswith(suffix):
-                            clean_key = key[:-suffix_len]  # without suffix
-                            if clean_key not in datum:
-                                logger.info(
-                                    "Deleting field %s as it has no counterpart without suffix",
-                                    key,
-                                )
-                                datum.pop(key, None)
-                                continue
-                            logger.debug(
-                                f"Replacing {clean_key}={datum[clean_key]} to {value}."
-                            )
-                            datum[clean_key] = value
-                            datum.pop(key, None)
-                            break
-                    else:
-                        logger.debug(
-                            f"Field {key} does not end with any relevant suffix, deleting"
+    @staticmethod
+    def _replace_suffixed_keys(
+        datum: dict, suffixed_keys: List[str], suffixes: List[str]
+    ):
+        for key in suffixed_keys:
+            value = datum[key]
+            for suffix in suffixes:
+                # iterate each suffix to see if it's relevant for the key.
+                # the order of the suffixes matter, as XSOAR_SAAS and XSOAR_ON_PREM are more specific
+                suffix_len = len(suffix)
+                if key.casefold().endswith(suffix):
+                    clean_key = key[:-suffix_len]  # without suffix
+                    if clean_key not in datum:
+                        logger.info(
+                            "Deleting field %s as it has no counterpart without suffix",
+                            key,
                         )
                         datum.pop(key, None)
-            return datum
-
-        if not isinstance(result := fix_recursively(data), dict):  # to calm mypy
-            raise ValueError(
-                f"unexpected result type {type(result)}, expected dictionary"
-            )
-        return result
+                        continue
+                    logger.debug(
+                        f"Replacing {clean_key}={datum[clean_key]} to {value}."
+                    )
+                    datum[clean_key] = value
+                    datum.pop(key, None)
+                    break
+            else:
+                logger.debug(
+                    f"Field {key} does not end with any relevant suffix, deleting"
+                )
+                datum.pop(key, None)
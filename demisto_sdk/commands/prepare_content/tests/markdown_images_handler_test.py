@@ -18,8 +18,10 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.tools import get_file
 from demisto_sdk.commands.prepare_content import markdown_images_handler
 from demisto_sdk.commands.prepare_content.markdown_images_handler import (
-    init_json_file,
-    update_markdown_images_file_links,
+    MARKDOWN_IMAGES_SHARDS_DIR_SUFFIX,
+    add_markdown_images_to_dict,
+    append_to_markdown_images_shard,
+    merge_markdown_images_file_shards,
 )
 
 expected_urls_ret = [
@@ -171,17 +173,15 @@ def image_data_two():
     ]
 
 
-def test_dump_same_pack_images_in_desc_and_readme(
-    monkeypatch, image_data_one, image_data_two
-):
+def test_dump_same_pack_images_in_desc_and_readme(image_data_one, image_data_two):
     """
     Given:
         - pack readmes with images and description with images for the same pack
     When:
         - After the readme images were parsed and data was collected for each url
     Then:
-        - Validate that the data stored in the file that gathers all the pake readme
-            images data is created succesfully.
+        - Validate that the data that gathers all the pack readme images data
+            is updated succesfully.
     """
     pack_name = "PrismaCloudCompute"
     return_value1 = {pack_name: {ImagesFolderNames.README_IMAGES.value: image_data_one}}
@@ -193,29 +193,25 @@ def test_dump_same_pack_images_in_desc_and_readme(
     }
     excepted_res = deepcopy(return_value1)
     excepted_res[pack_name].update(deepcopy(return_value2[pack_name]))
-    with TemporaryDirectory() as artifact_dir:
-        monkeypatch.setenv("DEMISTO_SDK_CONTENT_PATH", artifact_dir)
-        monkeypatch.setenv("ARTIFACTS_FOLDER", artifact_dir)
-        init_json_file(MARKDOWN_IMAGES_ARTIFACT_FILE_NAME)
-        update_markdown_images_file_links(
-            return_value1, pack_name, ImagesFolderNames.README_IMAGES
-        )
-        update_markdown_images_file_links(
-            return_value2, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
-        )
-        res = get_file(f"{artifact_dir}/{MARKDOWN_IMAGES_ARTIFACT_FILE_NAME}")
+    res: dict = {}
+    add_markdown_images_to_dict(
+        res, return_value1, pack_name, ImagesFolderNames.README_IMAGES
+    )
+    add_markdown_images_to_dict(
+        res, return_value2, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+    )
     assert res == excepted_res
 
 
-def test_dump_pack_readme(monkeypatch, image_data_one, image_data_two):
+def test_dump_pack_readme(image_data_one, image_data_two):
     """
     Given:
         - pack readmes with images
     When:
         - After the readme images were parsed and data was collected for each url
     Then:
-        - Validate that the data stored in the file that gathers all the pake readme
-            images data is created succesfully.
+        - Validate that the data that gathers all the pack readme images data
+            is updated succesfully.
     """
     return_value1 = {
         "PrismaCloudCompute": {ImagesFolderNames.README_IMAGES.value: image_data_one}
@@ -228,23 +224,20 @@ def test_dump_pack_readme(monkeypatch, image_data_one, image_data_two):
     }
     excepted_res = deepcopy(return_value1)
     excepted_res.update(deepcopy(return_value2))
-    with TemporaryDirectory() as artifact_dir:
-        monkeypatch.setenv("DEMISTO_SDK_CONTENT_PATH", artifact_dir)
-        monkeypatch.setenv("ARTIFACTS_FOLDER", artifact_dir)
-        init_json_file(MARKDOWN_IMAGES_ARTIFACT_FILE_NAME)
-        update_markdown_images_file_links(
-            return_value1, "PrismaCloudCompute", ImagesFolderNames.README_IMAGES
-        )
-        update_markdown_images_file_links(
-            return_value2,
-            "CVE_2022_30190",
-            ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES,
-        )
-        res = get_file(f"{artifact_dir}/{MARKDOWN_IMAGES_ARTIFACT_FILE_NAME}")
+    res: dict = {}
+    add_markdown_images_to_dict(
+        res, return_value1, "PrismaCloudCompute", ImagesFolderNames.README_IMAGES
+    )
+    add_markdown_images_to_dict(
+        res,
+        return_value2,
+        "CVE_2022_30190",
+        ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES,
+    )
     assert res == excepted_res
 
 
-def test_dump_more_than_one_description_file_one_empty(monkeypatch, image_data_one):
+def test_dump_more_than_one_description_file_one_empty(image_data_one):
     pack_name = "PrismaCloudCompute"
     return_value1 = {
         pack_name: {
@@ -265,23 +258,17 @@ def test_dump_more_than_one_description_file_one_empty(monkeypatch, image_data_o
             ]
         )
     )
-    with TemporaryDirectory() as artifact_dir:
-        monkeypatch.setenv("DEMISTO_SDK_CONTENT_PATH", artifact_dir)
-        monkeypatch.setenv("ARTIFACTS_FOLDER", artifact_dir)
-        init_json_file(MARKDOWN_IMAGES_ARTIFACT_FILE_NAME)
-        update_markdown_images_file_links(
-            return_value1, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
-        )
-        update_markdown_images_file_links(
-            return_value2, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
-        )
-        res = get_file(f"{artifact_dir}/{MARKDOWN_IMAGES_ARTIFACT_FILE_NAME}")
+    res: dict = {}
+    add_markdown_images_to_dict(
+        res, return_value1, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+    )
+    add_markdown_images_to_dict(
+        res, return_value2, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+    )
     assert res == excepted_res
 
 
-def test_dump_more_than_one_description_file(
-    image_data_one, image_data_two, monkeypatch
-):
+def test_dump_more_than_one_description_file(image_data_one, image_data_two):
     pack_name = "PrismaCloudCompute"
     return_value1 = {
         pack_name: {
@@ -306,18 +293,73 @@ def test_dump_more_than_one_description_file(
             )
         )
     )
-    with TemporaryDirectory() as artifact_dir:
-        monkeypatch.setenv("DEMISTO_SDK_CONTENT_PATH", artifact_dir)
-        monkeypatch.setenv("ARTIFACTS_FOLDER", artifact_dir)
-        init_json_file(MARKDOWN_IMAGES_ARTIFACT_FILE_NAME)
-        update_markdown_images_file_links(
-            return_value1, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+    res: dict = {}
+    add_markdown_images_to_dict(
+        res, return_value1, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+    )
+    add_markdown_images_to_dict(
+        res, return_value2, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+    )
+    assert res == excepted_res
+
+
+def test_merge_markdown_images_file_shards(image_data_one, image_data_two, tmp_path):
+    """
+    Given:
+        - Updates of the markdown images artifact appended to the shards of two processes
+    When:
+        - Merging the shards once the dump is done
+    Then:
+        - Validate the artifact file is the same as when all the updates are added by a single process
+        - Validate the shards are deleted
+    """
+    updates = [
+        (
+            {"PackA": {ImagesFolderNames.README_IMAGES.value: image_data_one}},
+            "PackA",
+            ImagesFolderNames.README_IMAGES,
+        ),
+        (
+            {"PackB": {ImagesFolderNames.README_IMAGES.value: image_data_two}},
+            "PackB",
+            ImagesFolderNames.README_IMAGES,
+        ),
+        (
+            {
+                "PackA": {
+                    ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES.value: image_data_two
+                }
+            },
+            "PackA",
+            ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES,
+        ),
+        (
+            {
+                "PackA": {
+                    ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES.value: image_data_one
+                }
+            },
+            "PackA",
+            ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES,
+        ),
+    ]
+    expected_res: dict = {}
+    for images_dict, pack_name, file_type in updates:
+        add_markdown_images_to_dict(
+            expected_res, deepcopy(images_dict), pack_name, file_type
         )
-        update_markdown_images_file_links(
-            return_value2, pack_name, ImagesFolderNames.INTEGRATION_DESCRIPTION_IMAGES
+
+    shards_dir = tmp_path / f"markdown_images{MARKDOWN_IMAGES_SHARDS_DIR_SUFFIX}"
+    shards_dir.mkdir()
+    # the updates of PackA are made by one process, and the updates of PackB by another
+    for images_dict, pack_name, file_type in updates:
+        append_to_markdown_images_shard(
+            shards_dir / f"{pack_name}.jsonl", images_dict, pack_name, file_type
         )
-        res = get_file(f"{artifact_dir}/{MARKDOWN_IMAGES_ARTIFACT_FILE_NAME}")
-    assert res == excepted_res
+    merge_markdown_images_file_shards(shards_dir, MARKDOWN_IMAGES_ARTIFACT_FILE_NAME)
+
+    assert get_file(tmp_path / MARKDOWN_IMAGES_ARTIFACT_FILE_NAME) == expected_res
+    assert not shards_dir.exists()
 
 
 @pytest.mark.parametrize(
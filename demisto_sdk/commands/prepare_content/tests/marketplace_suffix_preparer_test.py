@@ -292,3 +292,32 @@ def test_remove_xsoar_on_prem():
             "required": False,
         },
     }
+
+
+def test_prepare_for_marketplaces():
+    """
+    Given:
+        - data with suffixes for all marketplaces
+
+    When:
+        - Calling MarketplaceSuffixPreparer.prepare_for_marketplaces on the data for all the marketplaces
+
+    Then:
+        - The data of each marketplace is the same as when preparing it for the marketplace alone
+        - The given data is not modified
+        - The parts of the data without suffixes are shared by all the marketplaces
+    """
+    data = deepcopy(DATA)
+    marketplaces = list(MarketplaceVersions)
+
+    prepared = MarketplaceSuffixPreparer.prepare_for_marketplaces(data, marketplaces)
+
+    assert data == DATA
+    for marketplace in marketplaces:
+        assert prepared[marketplace] == MarketplaceSuffixPreparer.prepare(
+            deepcopy(DATA), marketplace
+        )
+    assert (
+        prepared[MarketplaceVersions.MarketplaceV2]["1"]["scriptarguments"]
+        is data["1"]["scriptarguments"]
+    )
@@ -24,6 +24,7 @@ from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
 )
 from demisto_sdk.commands.prepare_content.integration_script_unifier import (
+    API_MODULES_CACHE_HITS,
     IntegrationScriptUnifier,
 )
 from demisto_sdk.commands.prepare_content.prepare_upload_manager import (
@@ -561,6 +562,48 @@ def test_insert_hierarchy_api_module(mocker):
     )
 
 
+def test_insert_module_code_uses_cached_api_modules(tmp_path):
+    """
+    Given:
+     - An ApiModule which imports another ApiModule, both cached
+
+    When:
+     - calling insert_module_code before and after the inner ApiModule changes
+
+    Then:
+     - Ensure the cached code is used while the sources did not change
+     - Ensure the code is expanded again once the inner ApiModule changes
+    """
+    for module_name, module_code in (
+        ("SubApiModule", "from InnerApiModule import *\nSUB = 1"),
+        ("InnerApiModule", "INNER = 'old'"),
+    ):
+        module_path = IntegrationScriptUnifier.get_api_module_path(
+            module_name, tmp_path
+        )
+        module_path.parent.mkdir(parents=True)
+        module_path.write_text(module_code)
+    IntegrationScriptUnifier.cache_api_modules(tmp_path)
+    hits = API_MODULES_CACHE_HITS.get("SubApiModule", 0)
+    import_to_name = {"from SubApiModule import *": "SubApiModule"}
+
+    code = IntegrationScriptUnifier.insert_module_code(
+        "from SubApiModule import *", import_to_name, tmp_path
+    )
+    assert "INNER = 'old'" in code
+    assert API_MODULES_CACHE_HITS["SubApiModule"] == hits + 1
+
+    IntegrationScriptUnifier.get_api_module_path("InnerApiModule", tmp_path).write_text(
+        "INNER = 'changed'"
+    )
+    code = IntegrationScriptUnifier.insert_module_code(
+        "from SubApiModule import *", import_to_name, tmp_path
+    )
+    assert "INNER = 'changed'" in code
+    assert "INNER = 'old'" not in code
+    assert API_MODULES_CACHE_HITS["SubApiModule"] == hits + 1
+
+
 def test_insert_pack_version_and_script_to_yml_js_and_ps1():
     """
     Given:
@@ -1,10 +1,11 @@
 import math
+import multiprocessing
 import os
 import string
-from collections import defaultdict
+from collections import defaultdict, deque
 from functools import lru_cache
 from pathlib import Path
-from typing import DefaultDict
+from typing import DefaultDict, Dict, Iterable, List, NamedTuple, Optional, Set, Union
 
 import PyPDF2
 from bs4 import BeautifulSoup
@@ -19,6 +20,7 @@ from demisto_sdk.commands.common.constants import (
     re,
 )
 from demisto_sdk.commands.common.content import Content
+from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     find_type,
@@ -26,6 +28,7 @@ from demisto_sdk.commands.common.tools import (
     get_pack_name,
     is_file_path_in_pack,
     run_command,
+    should_disable_multiprocessing,
 )
 
 # secrets settings
@@ -68,6 +71,8 @@ TEXT_FILE_TYPES = {
     ".xif",
 }
 SKIP_FILE_TYPE_ENTROPY_CHECKS = {".eml"}
+# below this number of files, scanning them in a process pool costs more than it saves
+MIN_FILES_FOR_MULTIPROCESSING = 20
 SKIP_DEMISTO_TYPE_ENTROPY_CHECKS = {"playbook-"}
 YML_FILE_EXTENSION = ".yml"
 
@@ -106,6 +111,88 @@ WHILEIST_REGEX = r"\S*{}\S*"
 # disable-secrets-detection-end
 
 
+class WhiteListMatcher:
+    """Aho-Corasick automaton over the whitelist strings, checking whether any of them is a substring of a text
+    in a single pass over the text, regardless of the whitelist size.
+
+    Strings containing whitespaces can never be a substring of a single (whitespace separated) string, so they
+    are kept aside in `multi_word_strings` rather than added to the automaton.
+
+    Args:
+        white_list (Iterable[str]): The whitelisted strings.
+        ignore_case (bool): Whether to match case-insensitively (by lower-casing both the strings and the text).
+    """
+
+    def __init__(self, white_list: Iterable[str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.multi_word_strings: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._is_match: List[bool] = [False]
+        for white_list_string in white_list:
+            if any(char.isspace() for char in white_list_string):
+                self.multi_word_strings.append(white_list_string)
+                continue
+            self._add(white_list_string.lower() if ignore_case else white_list_string)
+        self._build_failure_links()
+
+    def _add(self, white_list_string: str) -> None:
+        state = 0
+        for char in white_list_string:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._is_match.append(False)
+            state = next_state
+        self._is_match[state] = True
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # a state matches if any whitelist string ending at it (i.e. any of its suffixes) is whitelisted
+                self._is_match[next_state] = (
+                    self._is_match[next_state] or self._is_match[self._fail[next_state]]
+                )
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1 or self._is_match[0] or bool(self.multi_word_strings)
+
+    def search(self, text: str) -> bool:
+        """Whether any of the whitelisted strings is a substring of the given text."""
+        if self._is_match[0]:
+            # the empty string is whitelisted
+            return True
+        goto, fail, is_match = self._goto, self._fail, self._is_match
+        state = 0
+        for char in text.lower() if self.ignore_case else text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if is_match[state]:
+                return True
+        return False
+
+
+class WhiteListMatchers(NamedTuple):
+    """The compiled whitelists of a pack (or of the generic whitelist, for files outside of packs)."""
+
+    secrets: WhiteListMatcher
+    # case-sensitive, used to remove whitelisted items from the pack files
+    secrets_case_sensitive: WhiteListMatcher
+    iocs: WhiteListMatcher
+    files: Set[str]
+
+
 class SecretsValidator:
     def __init__(
         self,
@@ -124,6 +211,14 @@ class SecretsValidator:
         self.prev_ver = prev_ver
         if self.prev_ver and not self.prev_ver.startswith(DEMISTO_GIT_UPSTREAM):
             self.prev_ver = f"{DEMISTO_GIT_UPSTREAM}/" + self.prev_ver
+        # compiled whitelists by pack name (None for files outside of packs)
+        self._white_list_matchers: Dict[Optional[str], WhiteListMatchers] = {}
+
+    def __getstate__(self):
+        # the validator is pickled to the file scanning workers, which do not need the (unpicklable) git util
+        state = self.__dict__.copy()
+        state.pop("git_util", None)
+        return state
 
     def get_secrets(self, commit, is_circle):
         secret_to_location_mapping = {}
@@ -243,103 +338,170 @@ class SecretsValidator:
         secret_to_location_mapping: DefaultDict[str, defaultdict] = defaultdict(
             lambda: defaultdict(list)
         )
-        for file_path in secrets_file_paths:
-            # Get if file path in pack and pack name
-            is_pack = is_file_path_in_pack(file_path)
-            pack_name = get_pack_name(file_path)
-            # Get generic/ioc/files white list sets based on if pack or not
-            (
-                secrets_white_list,
-                ioc_white_list,
-                files_white_list,
-            ) = self.get_white_listed_items(is_pack, pack_name)
-            # Skip white listed files
-
-            if file_path in files_white_list:
-                logger.info(
-                    f"Skipping secrets detection for file: {file_path} as it is white listed"
+        if (
+            len(secrets_file_paths) < MIN_FILES_FOR_MULTIPROCESSING
+            or should_disable_multiprocessing()
+        ):
+            files_secrets = [
+                self.search_file_potential_secrets(file_path, ignore_entropy)
+                for file_path in secrets_file_paths
+            ]
+        else:
+            # compile the whitelists once, so the workers get them along with the validator
+            for file_path in secrets_file_paths:
+                self.get_white_list_matchers(
+                    is_file_path_in_pack(file_path), get_pack_name(file_path)
                 )
-                continue
-            # Init vars for current loop
-            file_name = Path(file_path).name
-            _, file_extension = os.path.splitext(file_path)
-            # get file contents
-            file_contents = self.get_file_contents(file_path, file_extension)
-            # if detected disable-secrets comments, removes the line/s
-            file_contents = self.remove_secrets_disabled_line(file_contents)
-            # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
-            if is_pack:
-                file_contents = self.remove_whitelisted_items_from_file(
-                    file_contents, secrets_white_list
+            with multiprocessing.Pool(processes=cpu_count()) as pool:
+                files_secrets = pool.starmap(
+                    self.search_file_potential_secrets,
+                    ((file_path, ignore_entropy) for file_path in secrets_file_paths),
                 )
+        for file_path, file_secrets in zip(secrets_file_paths, files_secrets):
+            for line_num, secrets in file_secrets.items():
+                secret_to_location_mapping[file_path][line_num].extend(secrets)
+
+        return secret_to_location_mapping
+
+    def search_file_potential_secrets(
+        self, file_path: str, ignore_entropy: bool = False
+    ) -> Dict[int, List[str]]:
+        """Returns potential secrets(sensitive data) found in a single file
+        :param file_path: path of the file to search
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
 
-            yml_file_contents = self.get_related_yml_contents(file_path)
-            # Add all context output paths keywords to whitelist temporary
-            if file_extension == YML_FILE_EXTENSION or yml_file_contents:
-                temp_white_list = self.create_temp_white_list(
+        :return: dictionary(line number: (list)secrets) of the secrets found in the file
+        """
+        file_secrets: DefaultDict[int, List[str]] = defaultdict(list)
+        # Get if file path in pack and pack name
+        is_pack = is_file_path_in_pack(file_path)
+        pack_name = get_pack_name(file_path)
+        # Get the compiled generic/ioc/files white lists based on if pack or not
+        white_list_matchers = self.get_white_list_matchers(is_pack, pack_name)
+        # Skip white listed files
+        if file_path in white_list_matchers.files:
+            logger.info(
+                f"Skipping secrets detection for file: {file_path} as it is white listed"
+            )
+            return file_secrets
+        # Init vars for current loop
+        file_name = Path(file_path).name
+        _, file_extension = os.path.splitext(file_path)
+        # get file contents
+        file_contents = self.get_file_contents(file_path, file_extension)
+        # if detected disable-secrets comments, removes the line/s
+        file_contents = self.remove_secrets_disabled_line(file_contents)
+        # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
+        if is_pack:
+            file_contents = self.remove_whitelisted_items_from_file(
+                file_contents, white_list_matchers.secrets_case_sensitive
+            )
+
+        yml_file_contents = self.get_related_yml_contents(file_path)
+        # Add all context output paths keywords to whitelist temporary
+        temp_white_list = WhiteListMatcher(())
+        if file_extension == YML_FILE_EXTENSION or yml_file_contents:
+            temp_white_list = WhiteListMatcher(
+                self.create_temp_white_list(
                     yml_file_contents if yml_file_contents else file_contents
                 )
-                secrets_white_list = secrets_white_list.union(temp_white_list)
-            # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
-            for line_num, line in enumerate(file_contents.split("\n")):
-                # REGEX scanning for IOCs and false positive groups
-                regex_secrets, false_positives = self.regex_for_secrets(line)
-                for regex_secret in regex_secrets:
-                    if not any(
-                        ioc.lower() in regex_secret.lower() for ioc in ioc_white_list
-                    ):
-                        secret_to_location_mapping[file_path][line_num + 1].append(
-                            regex_secret
+            )
+        false_positives_white_list: Set[str] = set()
+        # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
+        for line_num, line in enumerate(file_contents.split("\n")):
+            # REGEX scanning for IOCs and false positive groups
+            regex_secrets, false_positives = self.regex_for_secrets(line)
+            for regex_secret in regex_secrets:
+                if not white_list_matchers.iocs.search(regex_secret):
+                    file_secrets[line_num + 1].append(regex_secret)
+            # added false positives into white list array before testing the strings in line
+            false_positives_white_list.update(
+                false_positive.lower() for false_positive in false_positives
+            )
+
+            if not ignore_entropy:
+                # due to nature of eml files, skip string by string secret detection - only regex
+                if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or any(
+                    demisto_type in file_name
+                    for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS
+                ):
+                    continue
+                line = self.remove_false_positives(line)
+                # calculate entropy for each string in the file
+                for string_ in line.split():
+                    # compare the lower case of the string against both generic whitelist & temp white list
+                    if not (
+                        white_list_matchers.secrets.search(string_)
+                        or temp_white_list.search(string_)
+                        or any(
+                            false_positive in string_.lower()
+                            for false_positive in false_positives_white_list
                         )
-                # added false positives into white list array before testing the strings in line
+                    ):
+                        entropy = self.calculate_shannon_entropy(string_)
+                        if entropy >= ENTROPY_THRESHOLD:
+                            file_secrets[line_num + 1].append(string_)
 
-                secrets_white_list = secrets_white_list.union(false_positives)
+        return file_secrets
 
-                if not ignore_entropy:
-                    # due to nature of eml files, skip string by string secret detection - only regex
-                    if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or any(
-                        demisto_type in file_name
-                        for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS
-                    ):
-                        continue
-                    line = self.remove_false_positives(line)
-                    # calculate entropy for each string in the file
-                    for string_ in line.split():
-                        # compare the lower case of the string against both generic whitelist & temp white list
-                        if not any(
-                            white_list_string.lower() in string_.lower()
-                            for white_list_string in secrets_white_list
-                        ):
-                            entropy = self.calculate_shannon_entropy(string_)
-                            if entropy >= ENTROPY_THRESHOLD:
-                                secret_to_location_mapping[file_path][
-                                    line_num + 1
-                                ].append(string_)
+    def get_white_list_matchers(
+        self, is_pack: bool, pack_name: Optional[str]
+    ) -> WhiteListMatchers:
+        """Returns the compiled whitelists of the given pack, compiling them on first use.
 
-        return secret_to_location_mapping
+        :param is_pack: Whether the whitelists are of a file in a pack
+        :param pack_name: The name of the pack
+        :return: WhiteListMatchers: the compiled secrets/ioc whitelists and the whitelisted files
+        """
+        key = pack_name if is_pack else None
+        if key not in self._white_list_matchers:
+            secrets_white_list, ioc_white_list, files_white_list = (
+                self.get_white_listed_items(is_pack, pack_name)
+            )
+            self._white_list_matchers[key] = WhiteListMatchers(
+                secrets=WhiteListMatcher(secrets_white_list),
+                secrets_case_sensitive=WhiteListMatcher(
+                    secrets_white_list, ignore_case=False
+                ),
+                iocs=WhiteListMatcher(ioc_white_list),
+                files=files_white_list,
+            )
+        return self._white_list_matchers[key]
 
     @staticmethod
     def remove_whitelisted_items_from_file(
-        file_content: str, secrets_white_list: set
+        file_content: str, secrets_white_list: Union[set, WhiteListMatcher]
     ) -> str:
         """Removes whitelisted items from file content
 
         Arguments:
             file_content (str): The content of the file to remove the whitelisted item from
-            secrets_white_list (set): List of whitelist items to remove from the file content.
+            secrets_white_list (set | WhiteListMatcher): The whitelist items to remove from the file content,
+                or a case-sensitive matcher compiled from them.
+
+        Items containing whitespaces span several strings, so each of them is still removed with its own regex,
+        after the strings containing the single word items were removed. Such an item is therefore not removed
+        where one of its strings contains a single word item (previously, this depended on the order of the set).
 
         Returns:
             str: The file content with the whitelisted items removed.
         """
-        for item in secrets_white_list:
-            try:
-                file_content = re.sub(
-                    WHILEIST_REGEX.format(re.escape(item)), "", file_content
-                )
-            except re.error as err:
-                error_string = f"Could not use secrets with item: {item}"
-                logger.info(f"<red>{error_string}</red>")
-                raise re.error(error_string, str(err))
+        if not isinstance(secrets_white_list, WhiteListMatcher):
+            secrets_white_list = WhiteListMatcher(secrets_white_list, ignore_case=False)
+        if not secrets_white_list:
+            return file_content
+        # a whitelisted item removes every (whitespace separated) string containing it
+        file_content = re.sub(
+            r"\S+",
+            lambda match: ""
+            if secrets_white_list.search(match.group())  # type: ignore[union-attr]
+            else match.group(),
+            file_content,
+        )
+        for item in secrets_white_list.multi_word_strings:
+            file_content = re.sub(
+                WHILEIST_REGEX.format(re.escape(item)), "", file_content
+            )
         return file_content
 
     @staticmethod
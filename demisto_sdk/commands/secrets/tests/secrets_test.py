@@ -2,9 +2,12 @@ import os
 import shutil
 from pathlib import Path
 
+import pytest
+
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
-from demisto_sdk.commands.secrets.secrets import SecretsValidator
+from demisto_sdk.commands.secrets import secrets
+from demisto_sdk.commands.secrets.secrets import SecretsValidator, WhiteListMatcher
 
 
 def create_whitelist_secrets_file(
@@ -437,3 +440,104 @@ my_email = "fooo@someorg.com"
         )
         result = self.validator.find_secrets()
         assert result
+
+    @pytest.mark.parametrize(
+        "white_list, ignore_case, text, expected",
+        [
+            ({"demisto", "paloalto"}, True, "https://www.PaloAltoNetworks.com", True),
+            ({"demisto", "paloalto"}, False, "https://www.PaloAltoNetworks.com", False),
+            ({"abcd", "bc"}, True, "xbcx", True),
+            ({"abcd", "bcx"}, True, "abcx", True),
+            ({"demisto"}, True, "cortex", False),
+            ({""}, True, "anything", True),
+            (set(), True, "anything", False),
+        ],
+    )
+    def test_white_list_matcher(self, white_list, ignore_case, text, expected):
+        """
+        Given:
+            - A whitelist.
+        When:
+            - Searching a string using a matcher compiled from the whitelist.
+        Then:
+            - Ensure the string is matched iff one of the whitelisted items is a substring of it.
+        """
+        matcher = WhiteListMatcher(white_list, ignore_case=ignore_case)
+        assert matcher.search(text) is expected
+
+    def test_remove_white_list_multi_word_item(self):
+        """
+        Given:
+            - A whitelist with a single word item and an item containing a whitespace.
+        When:
+            - Removing the whitelisted items from a file content.
+        Then:
+            - Ensure the strings containing the items are removed, and the rest of the content is kept.
+        """
+        file_content = "key = abcdefg and some secret words here"
+        file_content = self.validator.remove_whitelisted_items_from_file(
+            file_content, {"cde", "secret words"}
+        )
+        assert file_content == "key =  and some  here"
+
+    def test_remove_white_list_multi_word_item_after_single_word_items(self):
+        """
+        Given:
+            - A whitelist with an item containing a whitespace, whose first string contains a single word item.
+        When:
+            - Removing the whitelisted items from a file content.
+        Then:
+            - Ensure the single word items are removed first, so the rest of the multi word item is kept.
+        """
+        file_content = self.validator.remove_whitelisted_items_from_file(
+            "key = abcdefg secret here", {"cde", "abcdefg secret"}
+        )
+        assert file_content == "key =  secret here"
+
+    def test_white_list_matchers_are_cached_per_pack(self, mocker):
+        """
+        Given:
+            - A secrets validator.
+        When:
+            - Getting the compiled whitelists of the same pack twice.
+        Then:
+            - Ensure the whitelists are read and compiled only once.
+        """
+        validator = SecretsValidator(white_list_path=self.TEST_WHITELIST_FILE)
+        get_white_listed_items = mocker.spy(validator, "get_white_listed_items")
+        first = validator.get_white_list_matchers(False, None)
+        second = validator.get_white_list_matchers(False, None)
+        assert first is second
+        assert get_white_listed_items.call_count == 1
+
+    def test_search_potential_secrets__multiprocessing(self, mocker):
+        """
+        Given:
+            - Files to search secrets in.
+        When:
+            - Searching the files in a pool of workers.
+        Then:
+            - Ensure the secrets found are the same as when searching the files sequentially.
+        """
+        create_empty_whitelist_secrets_file(
+            os.path.join(TestSecrets.TEMP_DIR, TestSecrets.WHITE_LIST_FILE_NAME)
+        )
+        file_paths = []
+        for i in range(3):
+            file_path = os.path.join(TestSecrets.TEMP_DIR, f"file_{i}.py")
+            with open(file_path, "w") as f:
+                f.write(f"my_email = 'fooo{i}@someorg.com'\n")
+            file_paths.append(file_path)
+        validator = SecretsValidator(
+            white_list_path=os.path.join(
+                TestSecrets.TEMP_DIR, TestSecrets.WHITE_LIST_FILE_NAME
+            ),
+        )
+        sequential = validator.search_potential_secrets(file_paths, True)
+        mocker.patch.object(secrets, "MIN_FILES_FOR_MULTIPROCESSING", 1)
+        mocker.patch.object(
+            secrets, "should_disable_multiprocessing", return_value=False
+        )
+        parallel = validator.search_potential_secrets(file_paths, True)
+        assert parallel == sequential
+        assert parallel[file_paths[2]] == {1: ["fooo2@someorg.com"]}
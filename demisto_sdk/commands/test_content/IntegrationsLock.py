@@ -1,7 +1,8 @@
 import datetime
 import os
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import Dict, Generator
 
 import pytz
 import requests
@@ -317,3 +318,61 @@ def lock_expired(lock_file: storage.Blob, lock_timeout: str) -> bool:
     return datetime.datetime.now(tz=pytz.utc) - lock_file.updated >= datetime.timedelta(
         seconds=int(lock_timeout)
     )
+
+
+class LocalIntegrationsLock:
+    """
+    An in-process counterpart of the integrations lock files, which locks the integrations of the tests executed
+    concurrently by the same build, with the same semantics:
+    * All the test's integrations are locked together, or none of them is
+    * Locking never waits - if one of the integrations is locked by another test, the lock attempt fails
+    * The integrations in 'parallel_integrations' are never locked
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # maps each locked integration to the playbook ID of the test that locked it
+        self.locked_integrations: Dict[str, str] = {}
+
+    def lock_integrations(self, test_playbook) -> bool:
+        """
+        Locks all the test's integrations
+        Args:
+            test_playbook (TestPlaybook): The test playbook instance we want to test under the lock's context
+
+        Returns:
+            True if all the test's integrations were successfully locked, else False
+        """
+        integrations = [
+            integration.name for integration in test_playbook.integrations_to_lock
+        ]
+        with self._lock:
+            if locked := [
+                integration
+                for integration in integrations
+                if integration in self.locked_integrations
+            ]:
+                test_playbook.build_context.logging_module.debug(
+                    f"Could not lock integrations {locked}, they are locked by tests "
+                    f"{[self.locked_integrations[integration] for integration in locked]}"
+                )
+                return False
+            for integration in integrations:
+                self.locked_integrations[integration] = (
+                    test_playbook.configuration.playbook_id
+                )
+        return True
+
+    def unlock_integrations(self, test_playbook) -> None:
+        """
+        Unlocks all the integrations locked by the test
+        Args:
+            test_playbook (TestPlaybook): The test playbook instance we want to test under the lock's context
+        """
+        with self._lock:
+            for integration in test_playbook.integrations_to_lock:
+                if (
+                    self.locked_integrations.get(integration.name)
+                    == test_playbook.configuration.playbook_id
+                ):
+                    del self.locked_integrations[integration.name]
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
 from pprint import pformat
-from queue import Empty, Queue
+from queue import Queue
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import demisto_client
@@ -49,6 +49,12 @@ from demisto_sdk.commands.test_content.mock_server import (
 from demisto_sdk.commands.test_content.ParallelLoggingManager import (
     ParallelLoggingManager,
 )
+from demisto_sdk.commands.test_content.TestDurationsStore import (
+    TEST_DURATIONS_FILE_NAME,
+    TestDurationsStore,
+    balance_tests,
+)
+from demisto_sdk.commands.test_content.TestsScheduler import TestsScheduler
 from demisto_sdk.commands.test_content.tools import (
     get_ui_url,
     is_redhat_instance,
@@ -313,6 +319,10 @@ class TestPlaybook:
         self.build_context.tests_data_keeper.test_results_xml_file.add_testsuite(
             self.test_suite
         )
+        if not any(isinstance(result, Skipped) for result in results):
+            self.build_context.tests_data_keeper.add_playbook_duration(
+                self.configuration.playbook_id, duration
+            )
 
     def __str__(self):
         return f'"{self.configuration.playbook_id}"'
@@ -793,6 +803,7 @@ class BuildContext:
         )
         self.cloud_servers_path = kwargs.get("cloud_servers_path")
         self.use_retries_mechanism = kwargs.get("use_retries", False)
+        self.max_parallel_tests = kwargs.get("max_parallel_tests", 1)
         self.conf, self.secret_conf = self._load_conf_files(
             kwargs["conf"], kwargs["secret"]
         )
@@ -809,11 +820,18 @@ class BuildContext:
 
         # --------------------------- Testing preparation -------------------------------
 
+        self.test_durations = TestDurationsStore(
+            Path(
+                kwargs.get("test_durations_path")
+                or Path(kwargs["artifacts_path"]) / TEST_DURATIONS_FILE_NAME
+            )
+        )
         self.tests_data_keeper = TestResults(
             self.conf.unmockable_integrations,
             kwargs["artifacts_path"],
             kwargs.get("service_account"),
             kwargs.get("artifacts_bucket"),
+            test_durations=self.test_durations,
         )
         self.conf_unmockable_tests = self._get_unmockable_tests_from_conf()
         self.machine_assignment_json = get_json_file(kwargs["machine_assignment"])
@@ -846,11 +864,43 @@ class BuildContext:
                     self,
                     server_private_ip=server_ip,
                     use_retries_mechanism=self.use_retries_mechanism,
+                    assigned_tests=assigned_tests,
+                )
+                for server_ip, assigned_tests in zip(
+                    self.instances_ips, self._balance_on_prem_tests()
                 )
-                for server_ip in self.instances_ips
             ]
         )
 
+    def _balance_on_prem_tests(self) -> List[Optional[List[str]]]:
+        """
+        Splits the tests assigned to the xsoar machine between the on-prem servers, by their expected durations.
+        Returns:
+            The tests to run on each of the servers, None to run all the tests assigned to the xsoar machine.
+        """
+        tests = (
+            self.machine_assignment_json.get("xsoar-machine", {})
+            .get("tests", {})
+            .get(TEST_PLAYBOOKS, [])
+        )
+        if len(self.instances_ips) < 2 or not tests:
+            return [None] * len(self.instances_ips)
+
+        tests_timeouts = {test.playbook_id: test.timeout for test in self.conf.tests}
+        servers_tests = balance_tests(
+            tests,
+            len(self.instances_ips),
+            lambda playbook_id: self.test_durations.get(
+                playbook_id,
+                default=tests_timeouts.get(playbook_id, self.conf.default_timeout),
+            ),
+        )
+        for server_ip, server_tests in zip(self.instances_ips, servers_tests):
+            self.logging_module.debug(
+                f"Tests assigned to server {server_ip}:\n{pformat(server_tests)}"
+            )
+        return servers_tests  # type: ignore[return-value]
+
     def _get_instances_ips(self) -> List[str]:
         """
         Parses the env_results.json and extracts the instance ip from each server configured in it.
@@ -998,7 +1048,6 @@ class ServerContext:
         self.client: Optional[DefaultApi] = None
         self.is_instance_using_docker = not is_redhat_instance(self.server_ip)
         self.executed_tests: Set[str] = set()
-        self.executed_in_current_round: Set[str] = set()
         self.prev_system_conf: dict = {}
 
         # --------------------------- Testing preparation -------------------------------
@@ -1019,7 +1068,8 @@ class ServerContext:
 
     def _execute_tests(self, queue: Queue):
         """
-        Iterates the tests queue and executes them as long as there are tests to execute.
+        Iterates the tests queue and executes them as long as there are tests to execute, up to
+        'max_parallel_tests' of them concurrently.
         Before the tests execution starts we will reset the containers to make sure the proxy configuration is correct
         - We need it before the mockable tests because the server starts the python2 default container when it starts,
             and it has no proxy configurations.
@@ -1029,20 +1079,74 @@ class ServerContext:
             queue: The queue to fetch tests to execute from
         """
         self.reset_containers()
-        while queue.unfinished_tasks:
-            try:
-                test_playbook: TestPlaybook = queue.get(block=False)
-                self._reset_tests_round_if_necessary(test_playbook, queue)
-            except Empty:
-                continue
-            self.configure_new_client()
-            if TestContext(
-                self.build_context, test_playbook, self.client, self
-            ).execute_test(self.proxy):
-                self.executed_tests.add(test_playbook.configuration.playbook_id)
-            else:
-                queue.put(test_playbook)
-            queue.task_done()
+        TestsScheduler(
+            queue,
+            execute_test=self._execute_test,
+            max_parallel_tests=self.build_context.max_parallel_tests,
+            get_expected_duration=self._get_expected_test_duration,
+            is_exclusive=self._is_exclusive_test,
+            logging_module=self.build_context.logging_module,
+        ).run()
+
+    def _execute_test(self, test_playbook: TestPlaybook) -> bool:
+        """
+        Executes a test playbook with a client of its own, as tests may be executed concurrently
+        Args:
+            test_playbook: The test playbook to execute
+
+        Returns:
+            True if the test was executed else False
+        """
+        client = self._create_client()
+        try:
+            executed = TestContext(
+                self.build_context, test_playbook, client, self
+            ).execute_test(self.proxy)
+        finally:
+            client.api_client.pool.close()
+            client.api_client.pool.terminate()
+        if executed:
+            self.executed_tests.add(test_playbook.configuration.playbook_id)
+        return executed
+
+    def _get_expected_test_duration(self, test_playbook: TestPlaybook) -> float:
+        """
+        The expected duration of a test playbook, the tests expected to take longer are executed first.
+        Args:
+            test_playbook: The test playbook
+
+        Returns:
+            The expected duration of the test in seconds, its timeout if the test has never run
+        """
+        return self.build_context.test_durations.get(
+            test_playbook.configuration.playbook_id,
+            default=test_playbook.configuration.timeout,
+        )
+
+    def _is_exclusive_test(self, test_playbook: TestPlaybook) -> bool:
+        """
+        Checks whether a test playbook must not be executed concurrently with other tests on the server:
+        - Mockable tests share the server's proxy, which records and plays back the mock of a single playbook at a time
+        - Tests of integrations with server keys change the server configuration and reset the containers
+        - The memory and pid thresholds of the docker images are measured while running alone on the server
+        Args:
+            test_playbook: The test playbook
+
+        Returns:
+            True if the test should be executed while no other test is running else False
+        """
+        if test_playbook.is_mockable or self.build_context.memCheck:
+            return True
+        test_integrations = {
+            integration.name for integration in test_playbook.integrations
+        }
+        return any(
+            configuration.name in test_integrations
+            and "server_keys" in configuration.params
+            for configuration in getattr(
+                self.build_context.secret_conf, "integrations", []
+            )
+        )
 
     def _execute_mockable_tests(self):
         """
@@ -1067,40 +1171,15 @@ class ServerContext:
     def _execute_failed_tests(self):
         self._execute_tests(self.test_retries_queue)
 
-    def _reset_tests_round_if_necessary(
-        self, test_playbook: TestPlaybook, queue_: Queue
-    ):
-        """
-        Checks if the string representation of the current test configuration is already in
-        the executed_in_current_round set.
-        If it is- it means we have already executed this test, and we have reached a round and there are tests that
-        were not able to be locked by this execution.
-        In that case we want to start a new round monitoring by emptying the 'executed_in_current_round' set and sleep
-        in order to let the tests be unlocked
-        Since this operation can be performed by multiple threads - this operation is protected by the queue's lock
-        Args:
-            test_playbook: Test playbook to check if has been executed in the current round
-            queue_: The queue from which the current tests are executed
-        """
-        queue_.mutex.acquire()
-        if str(test_playbook.configuration) in self.executed_in_current_round:
-            self.build_context.logging_module.info(
-                "all tests in the queue were executed, sleeping for 30 seconds to let locked tests get unlocked."
-            )
-            self.executed_in_current_round = {str(test_playbook.configuration)}
-            queue_.mutex.release()
-            time.sleep(30)
-            return
-        else:
-            self.executed_in_current_round.add(str(test_playbook.configuration))
-        queue_.mutex.release()
-
     def configure_new_client(self):
         if self.client:
             self.client.api_client.pool.close()
             self.client.api_client.pool.terminate()
             del self.client
-        self.client = demisto_client.configure(
+        self.client = self._create_client()
+
+    def _create_client(self) -> DefaultApi:
+        return demisto_client.configure(
             base_url=self.server_url,
             api_key=self.api_key,
             auth_id=self.auth_id,
@@ -1417,6 +1496,7 @@ class OnPremServerContext(ServerContext):
         build_context: BuildContext,
         server_private_ip: str,
         use_retries_mechanism: bool = True,
+        assigned_tests: Optional[List[str]] = None,
     ):
         super().__init__(build_context, server_private_ip, use_retries_mechanism)
         self.machine = self.server_ip
@@ -1435,6 +1515,8 @@ class OnPremServerContext(ServerContext):
             .get("tests", {})
             .get(TEST_PLAYBOOKS, [])
         )
+        # The part of the filtered tests balanced to this server, None when it runs all of them.
+        self.assigned_tests = assigned_tests
         (
             self.mockable_tests_to_run,
             self.unmockable_tests_to_run,
@@ -1470,6 +1552,20 @@ class OnPremServerContext(ServerContext):
 
         return self.get_all_installed_integrations_configurations(self.server_url)
 
+    def _generate_tests_queue(self, tests_to_run: List[TestConfiguration]) -> Queue:
+        """
+        Generates a queue containing test playbooks to run, without the tests assigned to the other servers
+        Args:
+            tests_to_run: A list containing playbook names
+        """
+        if self.assigned_tests is not None:
+            # The tests assigned to a sibling server are neither run nor reported as skipped by this server.
+            siblings_tests = set(self.filtered_tests) - set(self.assigned_tests)
+            tests_to_run = [
+                test for test in tests_to_run if test.playbook_id not in siblings_tests
+            ]
+        return super()._generate_tests_queue(tests_to_run)
+
     def _get_tests_to_run(self) -> Tuple[Queue, Queue]:
         """
         Gets tests to run in the current build and updates the unmockable tests ids set
@@ -1510,7 +1606,7 @@ class OnPremServerContext(ServerContext):
                 real_time=True,
             )
             self.build_context.logging_module.info(
-                f"Running the following tests: {self.filtered_tests}",
+                f"Running the following tests: {self.filtered_tests if self.assigned_tests is None else self.assigned_tests}",
                 real_time=True,
             )
             self._execute_mockable_tests()
@@ -1613,6 +1709,7 @@ class TestResults:
         artifacts_path: str,
         service_account: str = None,
         artifacts_bucket: str = None,
+        test_durations: Optional[TestDurationsStore] = None,
     ):
         self.succeeded_playbooks: List[str] = []
         self.failed_playbooks: Set[str] = set()
@@ -1627,6 +1724,7 @@ class TestResults:
         self.artifacts_path = Path(artifacts_path)
         self.service_account = service_account
         self.artifacts_bucket = artifacts_bucket
+        self.test_durations = test_durations
 
     def add_proxy_related_test_data(self, proxy):
         # Using multiple appends and not extend since append is guaranteed to be thread safe
@@ -1635,6 +1733,10 @@ class TestResults:
         for playbook_id in proxy.empty_files:
             self.empty_files.append(playbook_id)
 
+    def add_playbook_duration(self, playbook_id: str, duration: float):
+        if self.test_durations:
+            self.test_durations.add_duration(playbook_id, duration)
+
     def write_artifacts_file(self, file_name: str, content: Iterable[str]):
         with open(self.artifacts_path / file_name, "w") as file:
             file.write("\n".join(content))
@@ -1652,6 +1754,8 @@ class TestResults:
         self.test_results_xml_file.write(
             (self.artifacts_path / "test_playbooks_report.xml").as_posix(), pretty=True
         )
+        if self.test_durations:
+            self.test_durations.save()
 
     def print_test_summary(
         self,
@@ -0,0 +1,92 @@
+import heapq
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.tools import write_dict
+
+TEST_DURATIONS_FILE_NAME = "test_playbooks_durations.json"
+# the weight of the latest duration of a test in its expected duration
+LATEST_DURATION_WEIGHT = 0.5
+
+
+class TestDurationsStore:
+    def __init__(self, path: Path):
+        """
+        Keeps the durations of the test playbooks across builds, to estimate how long each test is expected to take.
+        The expected duration of a test is an exponential moving average of its durations in the previous builds.
+        Args:
+            path: The path of the JSON file the durations are kept in
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self.durations: Dict[str, float] = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            self.durations = {}
+        # the total duration of each test in the current build
+        self.build_durations: Dict[str, float] = {}
+
+    def get(self, playbook_id: str, default: float) -> float:
+        """
+        Args:
+            playbook_id: The ID of the test playbook
+            default: The duration to return for tests which have never run
+
+        Returns:
+            The expected duration of the test in seconds
+        """
+        return self.durations.get(playbook_id, default)
+
+    def add_duration(self, playbook_id: str, duration: float):
+        """
+        Adds the duration of a test execution in the current build. The durations of all the executions of a test
+        (e.g. retries and mock playbacks) are summed, as all of them keep the server busy.
+        Args:
+            playbook_id: The ID of the test playbook
+            duration: The duration of the execution in seconds
+        """
+        with self._lock:
+            self.build_durations[playbook_id] = (
+                self.build_durations.get(playbook_id, 0) + duration
+            )
+
+    def save(self):
+        """
+        Updates the expected durations with the durations of the current build, and writes them.
+        """
+        for playbook_id, duration in self.build_durations.items():
+            previous_duration = self.durations.get(playbook_id, duration)
+            self.durations[playbook_id] = round(
+                LATEST_DURATION_WEIGHT * duration
+                + (1 - LATEST_DURATION_WEIGHT) * previous_duration,
+                2,
+            )
+        self.build_durations = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_dict(self.path, self.durations, indent=4, sort_keys=True)
+
+
+def balance_tests(
+    tests: Iterable[str], number_of_servers: int, get_duration: Callable[[str], float]
+) -> List[List[str]]:
+    """
+    Splits tests between servers so that all the servers finish as close as possible to each other, by assigning
+    the longest tests first, each to the server with the least total duration (longest processing time first).
+    Args:
+        tests: The IDs of the test playbooks to split
+        number_of_servers: The number of servers to split the tests between
+        get_duration: Returns the expected duration of a test
+
+    Returns:
+        The tests assigned to each of the servers
+    """
+    servers_tests: List[List[str]] = [[] for _ in range(number_of_servers)]
+    # (total duration, server index) of every server
+    servers_load = [(0.0, index) for index in range(number_of_servers)]
+    for test in sorted(tests, key=get_duration, reverse=True):
+        load, index = heapq.heappop(servers_load)
+        servers_tests[index].append(test)
+        heapq.heappush(servers_load, (load + get_duration(test), index))
+    return servers_tests
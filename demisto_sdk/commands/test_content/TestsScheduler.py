@@ -0,0 +1,145 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
+from typing import TYPE_CHECKING, Callable, List, Set
+
+from demisto_sdk.commands.test_content.IntegrationsLock import LocalIntegrationsLock
+
+if TYPE_CHECKING:
+    from demisto_sdk.commands.test_content.TestContentClasses import TestPlaybook
+
+ROUND_SLEEP_SECONDS = 30
+
+
+class TestsScheduler:
+    def __init__(
+        self,
+        queue: Queue,
+        execute_test: Callable[["TestPlaybook"], bool],
+        max_parallel_tests: int,
+        get_expected_duration: Callable[["TestPlaybook"], float],
+        is_exclusive: Callable[["TestPlaybook"], bool],
+        logging_module,
+        round_sleep: float = ROUND_SLEEP_SECONDS,
+    ):
+        """
+        Executes the test playbooks of a queue on a single server, running up to 'max_parallel_tests' of them
+        concurrently.
+        - A test is started only when none of its integrations are locked by another running test on the server.
+        - Exclusive tests (e.g. tests which change the server configuration) run while no other test is running.
+        - The tests with the longest expected duration are started first, to shorten the total execution time.
+        - Tests which were not executed (e.g. their integrations were locked by another build) are retried after all
+            the other tests were tried, waiting 'round_sleep' seconds between such rounds to let them get unlocked.
+        Args:
+            queue: The queue to fetch tests to execute from, tests put into it during the execution are executed too
+            execute_test: Executes a test, returns whether the test was executed
+            max_parallel_tests: The maximal number of tests to execute concurrently
+            get_expected_duration: Returns the expected duration of a test
+            is_exclusive: Returns whether a test must not run concurrently with other tests
+            logging_module (ParallelLoggingManager): The logging module to use
+            round_sleep: How long to wait for the tests which were not executed to get unlocked
+        """
+        self.queue = queue
+        self.execute_test = execute_test
+        self.max_parallel_tests = max(max_parallel_tests, 1)
+        self.get_expected_duration = get_expected_duration
+        self.is_exclusive = is_exclusive
+        self.logging_module = logging_module
+        self.round_sleep = round_sleep
+        self.integrations_lock = LocalIntegrationsLock()
+
+        self._condition = threading.Condition()
+        self._pending: List["TestPlaybook"] = []
+        # the tests which were not executed in the current round
+        self._deferred: Set[str] = set()
+        self._round_start = 0.0
+        self._errors: List[Exception] = []
+        self._running = 0
+        self._running_exclusive = False
+
+    def run(self):
+        """
+        Executes the tests until the queue is empty and no test is running.
+        """
+        with ThreadPoolExecutor(
+            self.max_parallel_tests,
+            thread_name_prefix=f"{threading.current_thread().name}-test",
+        ) as executor:
+            with self._condition:
+                while not self._errors:
+                    self._fetch_queued_tests()
+                    if not self._pending and not self._running:
+                        return
+                    if test_playbook := self._admit_next_test():
+                        executor.submit(self._execute, test_playbook)
+                        continue
+                    if not self._deferred:
+                        self._condition.wait()
+                        continue
+                    if (
+                        round_time_left := self._round_start
+                        + self.round_sleep
+                        - time.monotonic()
+                    ) > 0:
+                        self._condition.wait(round_time_left)
+                        continue
+                    self.logging_module.info(
+                        "all tests in the queue were executed, waited "
+                        f"{self.round_sleep} seconds to let locked tests get unlocked."
+                    )
+                    self._deferred.clear()
+        raise self._errors[0]
+
+    def _fetch_queued_tests(self):
+        fetched = False
+        while True:
+            try:
+                self._pending.append(self.queue.get(block=False))
+                fetched = True
+            except Empty:
+                break
+        if fetched:
+            # longest processing time first
+            self._pending.sort(key=self.get_expected_duration, reverse=True)
+
+    def _admit_next_test(self):
+        """
+        Returns the next test to execute and locks its integrations, or None if no test can be started at the moment.
+        """
+        if self._running_exclusive or self._running >= self.max_parallel_tests:
+            return None
+        for test_playbook in self._pending:
+            if str(test_playbook.configuration) in self._deferred:
+                continue
+            if self.is_exclusive(test_playbook):
+                if self._running:
+                    # wait for the running tests, without letting other tests start meanwhile
+                    return None
+                self._running_exclusive = True
+            elif not self.integrations_lock.lock_integrations(test_playbook):
+                continue
+            self._pending.remove(test_playbook)
+            self._running += 1
+            return test_playbook
+        return None
+
+    def _execute(self, test_playbook: "TestPlaybook"):
+        executed = False
+        try:
+            executed = self.execute_test(test_playbook)
+        except Exception as error:
+            self._errors.append(error)
+            executed = True
+        finally:
+            self.integrations_lock.unlock_integrations(test_playbook)
+            with self._condition:
+                self._running -= 1
+                self._running_exclusive = False
+                if not executed:
+                    if not self._deferred:
+                        self._round_start = time.monotonic()
+                    self._deferred.add(str(test_playbook.configuration))
+                    self.queue.put(test_playbook)
+                self.queue.task_done()
+                self._condition.notify()
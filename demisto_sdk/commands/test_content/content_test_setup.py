@@ -63,6 +63,18 @@ def test_content(
     use_retries: bool = typer.Option(
         False, "-u", "--use-retries", help="Should use retries mechanism or not"
     ),
+    max_parallel_tests: int = typer.Option(
+        1,
+        "--max-parallel-tests",
+        help="The maximal number of test playbooks to run concurrently on each server. "
+        "Tests sharing integrations are never run concurrently.",
+    ),
+    test_durations_path: str = typer.Option(
+        None,
+        "--test-durations-path",
+        help="Path to the JSON file keeping the durations of the test playbooks in previous builds, "
+        "used to balance the tests between the servers. Defaults to a file in the artifacts path.",
+    ),
     server_type: str = typer.Option(
         "XSOAR",
         "--server-type",
@@ -128,6 +140,8 @@ def test_content(
         "mem_check": mem_check,
         "server_version": server_version,
         "use_retries": use_retries,
+        "max_parallel_tests": max_parallel_tests,
+        "test_durations_path": test_durations_path,
         "server_type": server_type,
         "product_type": product_type,
         "cloud_machine_ids": cloud_machine_ids,
@@ -1,10 +1,11 @@
 import logging  # noqa: TID251 # specific case, passed as argument to 3rd party
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from threading import Thread
 from time import sleep
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
 import dateparser
@@ -21,6 +22,7 @@ from tenacity import (
     Retrying,
     before_sleep_log,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     stop_after_attempt,
     wait_fixed,
 )
@@ -65,6 +67,7 @@ from demisto_sdk.commands.test_content.xsiam_tools.test_data import (
     Validations,
 )
 from demisto_sdk.commands.test_content.xsiam_tools.xsiam_client import (
+    XqlQueryFailedError,
     XsiamApiClient,
     XsiamApiClientConfig,
 )
@@ -74,6 +77,10 @@ from demisto_sdk.utils.utils import get_containing_pack
 CI_PIPELINE_ID = os.environ.get("CI_PIPELINE_ID")
 XSIAM_CLIENT_SLEEP_INTERVAL = 60
 XSIAM_CLIENT_RETRY_ATTEMPTS = 5
+# the maximal number of concurrent requests to the tenant when pushing test data and running XQL queries
+XSIAM_CLIENT_MAX_WORKERS = 10
+XQL_QUERY_POLLING_INTERVAL = 5
+XQL_QUERY_TIMEOUT = 300
 
 app = typer.Typer()
 
@@ -225,7 +232,9 @@ def create_retrying_caller(retry_attempts: int, sleep_interval: int) -> Retrying
     retry_params: Dict[str, Any] = {
         "reraise": True,
         "before_sleep": before_sleep_log(logging.getLogger(), logging.DEBUG),
-        "retry": retry_if_exception_type(requests.exceptions.RequestException),
+        # a failed XQL query keeps its status, so polling it again is pointless
+        "retry": retry_if_exception_type(requests.exceptions.RequestException)
+        & retry_if_not_exception_type(XqlQueryFailedError),
         "stop": stop_after_attempt(retry_attempts),
         "wait": wait_fixed(sleep_interval),
     }
@@ -240,11 +249,84 @@ def xsiam_execute_query(xsiam_client: XsiamApiClient, query: str) -> List[dict]:
     return xsiam_client.get_xql_query_result(execution_id)
 
 
+def xsiam_execute_queries(
+    xsiam_client: XsiamApiClient,
+    retrying_caller: Retrying,
+    queries: Dict[str, str],
+    max_workers: int = XSIAM_CLIENT_MAX_WORKERS,
+    polling_interval: float = XQL_QUERY_POLLING_INTERVAL,
+    timeout: float = XQL_QUERY_TIMEOUT,
+) -> Dict[str, Union[Iterable[dict], requests.exceptions.RequestException]]:
+    """Execute several XQL queries concurrently and return their results.
+    All the queries are started first, and then the execution IDs of all the running queries are polled together
+    in rounds, instead of waiting for the results of each query before starting the next one.
+
+    Args:
+        xsiam_client (XsiamApiClient): Xsiam API client.
+        retrying_caller (tenacity.Retrying): The retrying caller object.
+        queries (Dict[str, str]): Mapping of keys to the XQL queries to execute.
+        max_workers (int): The maximal number of concurrent requests to the tenant.
+        polling_interval (float): The number of seconds to wait between polling rounds.
+        timeout (float): The number of seconds to wait for the results of the queries.
+
+    Returns:
+        Dict[str, Union[Iterable[dict], RequestException]]: Mapping of the keys to the results of their queries,
+            or to the error which occurred while executing them. The results are fetched as they are iterated.
+    """
+    results: Dict[str, Union[Iterable[dict], requests.exceptions.RequestException]] = {}
+    with ThreadPoolExecutor(max_workers) as executor:
+        start_futures = {
+            key: executor.submit(retrying_caller, xsiam_client.start_xql_query, query)
+            for key, query in queries.items()
+        }
+        execution_ids = {}
+        for key, start_future in start_futures.items():
+            try:
+                execution_ids[key] = start_future.result()
+            except requests.exceptions.RequestException as e:
+                results[key] = e
+
+        deadline = get_utc_now().timestamp() + timeout
+        while execution_ids:
+            poll_futures = {
+                key: executor.submit(
+                    retrying_caller,
+                    xsiam_client.iter_xql_query_result,
+                    execution_id,
+                    pending_flag=True,
+                )
+                for key, execution_id in execution_ids.items()
+            }
+            for key, poll_future in poll_futures.items():
+                try:
+                    query_results = poll_future.result()
+                except requests.exceptions.RequestException as e:
+                    results[key] = e
+                else:
+                    if query_results is None:
+                        # the query is still running
+                        continue
+                    results[key] = query_results
+                execution_ids.pop(key)
+
+            if execution_ids and get_utc_now().timestamp() >= deadline:
+                for key, execution_id in execution_ids.items():
+                    results[key] = requests.exceptions.Timeout(
+                        f"XQL query {execution_id} did not finish after {timeout} seconds"
+                    )
+                break
+            if execution_ids:
+                sleep(polling_interval)
+    return results
+
+
 def xsiam_push_to_dataset(
     xsiam_client: XsiamApiClient, events_test_data: List[dict], rule: SingleModelingRule
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """Push the test data to the XSIAM dataset.
-    Wrapper for XsiamApiClient.push_to_dataset() with retry logic.
+    Wrapper for XsiamApiClient.push_to_dataset(), which retries each of the pushed chunks on its own.
+    The push as a whole is not retried, since it would push the chunks which already succeeded again.
+    Returns the responses of the pushed chunks of the test data.
     """
     return xsiam_client.push_to_dataset(events_test_data, rule.vendor, rule.product)
 
@@ -259,22 +341,49 @@ def xsiam_get_installed_packs(xsiam_client: XsiamApiClient) -> List[Dict[str, An
 def verify_results(
     modeling_rule: ModelingRule,
     tested_dataset: str,
-    results: List[dict],
+    results: Iterable[dict],
     test_data: TestData,
 ) -> List[TestCase]:
     """Verify that the results of the XQL query match the expected values.
+    The results are verified one by one as they are iterated, so they are not all held in memory.
 
     Args:
         modeling_rule: The modeling rule object parsed from the modeling rule file.
         tested_dataset (str): The dataset to verify result for.
-        results (List[dict]): The results of the XQL query.
+        results (Iterable[dict]): The results of the XQL query.
         test_data (init_test_data.TestData): The data parsed from the test data file.
 
     Returns:
         list[TestCase]: List of test cases for the results of the XQL query.
     """
+    rule_relevant_data = [
+        data for data in test_data.data if data.dataset == tested_dataset
+    ]
+    test_cases = []
+    results_count = 0
+    results = iter(results)
+    for results_count, result in enumerate(results, start=1):
+        if results_count > len(rule_relevant_data):
+            # there are more results than expected, no need to verify the rest of them
+            results_count += sum(1 for _ in results)
+            break
+        td_event_id = result.pop(f"{tested_dataset}.test_data_event_id")
+        msg = (
+            f"Modeling rule - {get_relative_path_to_content(modeling_rule.path)} {results_count}/{len(rule_relevant_data)}"
+            f" test_data_event_id:{td_event_id}"
+        )
+        logger.info("{}", f"<cyan>{msg}</cyan>")  # noqa: PLE1205
+        result_test_case = TestCase(
+            msg,
+            classname=f"test_data_event_id:{td_event_id}",
+        )
+        verify_results_against_test_data(
+            result_test_case, result, test_data, td_event_id
+        )
 
-    if not results:
+        test_cases.append(result_test_case)
+
+    if not results_count:
         logger.error(
             f"<red>{SYNTAX_ERROR_IN_MODELING_RULE}</red>",
         )
@@ -286,12 +395,9 @@ def verify_results(
         test_case.system_err = SYNTAX_ERROR_IN_MODELING_RULE
         return [test_case]
 
-    rule_relevant_data = [
-        data for data in test_data.data if data.dataset == tested_dataset
-    ]
-    if len(results) != len(rule_relevant_data):
+    if results_count != len(rule_relevant_data):
         err = (
-            f"Expected {len(test_data.data)} results, got {len(results)}. Verify that the event"
+            f"Expected {len(test_data.data)} results, got {results_count}. Verify that the event"
             " data used in your test data file meets the criteria of the modeling rule, e.g. the filter"
             " condition."
         )
@@ -305,24 +411,6 @@ def verify_results(
         )
         return [test_case]
 
-    test_cases = []
-    for i, result in enumerate(results, start=1):
-        td_event_id = result.pop(f"{tested_dataset}.test_data_event_id")
-        msg = (
-            f"Modeling rule - {get_relative_path_to_content(modeling_rule.path)} {i}/{len(results)}"
-            f" test_data_event_id:{td_event_id}"
-        )
-        logger.info("{}", f"<cyan>{msg}</cyan>")  # noqa: PLE1205
-        result_test_case = TestCase(
-            msg,
-            classname=f"test_data_event_id:{td_event_id}",
-        )
-        verify_results_against_test_data(
-            result_test_case, result, test_data, td_event_id
-        )
-
-        test_cases.append(result_test_case)
-
     return test_cases
 
 
@@ -457,15 +545,14 @@ def validate_expected_values(
     modeling_rule: ModelingRule,
     test_data: TestData,
 ) -> List[TestCase]:
-    """Validate the expected_values in the given test data file."""
+    """Validate the expected_values in the given test data file.
+    The queries of all the rules are executed concurrently, and their results are verified once they arrive.
+    """
     validate_expected_values_test_cases = []
-    for rule in modeling_rule.rules:
-        validate_expected_values_test_case = TestCase(
-            f"Validate expected_values {modeling_rule.path} dataset:{rule.dataset} "
-            f"vendor:{rule.vendor} product:{rule.product}",
-            classname="Validate expected values query",
-        )
-        query = generate_xql_query(
+    start_time = get_utc_now()
+    queries = {}
+    for index, rule in enumerate(modeling_rule.rules):
+        queries[str(index)] = query = generate_xql_query(
             rule,
             [
                 str(d.test_data_event_id)
@@ -473,11 +560,27 @@ def validate_expected_values(
                 if d.dataset == rule.dataset
             ],
         )
-        query_info = f"Query for dataset {rule.dataset}:\n{query}"
-        logger.debug("{}", query_info)  # noqa: PLE1205
-        validate_expected_values_test_case_system_out = [query_info]
+        logger.debug("{}", f"Query for dataset {rule.dataset}:\n{query}")  # noqa: PLE1205
+    queries_results = xsiam_execute_queries(xsiam_client, retrying_caller, queries)
+    queries_duration = duration_since_start_time(start_time)
+
+    for index, rule in enumerate(modeling_rule.rules):
+        validate_expected_values_test_case = TestCase(
+            f"Validate expected_values {modeling_rule.path} dataset:{rule.dataset} "
+            f"vendor:{rule.vendor} product:{rule.product}",
+            classname="Validate expected values query",
+        )
+        validate_expected_values_test_case_system_out = [
+            f"Query for dataset {rule.dataset}:\n{queries[str(index)]}"
+        ]
+        results = queries_results[str(index)]
         try:
-            results = retrying_caller(xsiam_execute_query, xsiam_client, query)
+            if isinstance(results, requests.exceptions.RequestException):
+                raise results
+            # the results may be fetched while they are verified
+            verify_results_test_cases = verify_results(
+                modeling_rule, rule.dataset, results, test_data
+            )
         except requests.exceptions.RequestException:
             logger.error(
                 f"<red>{XQL_QUERY_ERROR_EXPLANATION}</red>",
@@ -487,13 +590,12 @@ def validate_expected_values(
                 Error("Failed to execute XQL query")
             ]
         else:
-            verify_results_test_cases = verify_results(
-                modeling_rule, rule.dataset, results, test_data
-            )
             validate_expected_values_test_cases.extend(verify_results_test_cases)
         validate_expected_values_test_case.system_out = "\n".join(
             validate_expected_values_test_case_system_out
         )
+        # the queries are executed together, so each of them takes the time of all of them
+        validate_expected_values_test_case.time = queries_duration
         validate_expected_values_test_cases.append(validate_expected_values_test_case)
 
     return validate_expected_values_test_cases
@@ -687,14 +789,12 @@ def check_dataset_exists(
 
 def push_test_data_to_tenant(
     xsiam_client: XsiamApiClient,
-    retrying_caller: Retrying,
     mr: ModelingRule,
     test_data: TestData,
 ) -> TestCase:
     """Push the test data to the tenant.
 
     Args:
-        retrying_caller (tenacity.Retrying): The retrying caller object.
         xsiam_client (XsiamApiClient): Xsiam API client.
         mr (ModelingRule): Modeling rule object parsed from the modeling rule file.
         test_data (init_test_data.TestData): Test data object parsed from the test data file.
@@ -707,7 +807,8 @@ def push_test_data_to_tenant(
     )
     push_test_data_test_case_start_time = get_utc_now()
     system_errors = []
-    for rule in mr.rules:
+
+    def push_rule_test_data(rule: SingleModelingRule):
         events_test_data = [
             {
                 **event_log.event_data,
@@ -718,8 +819,16 @@ def push_test_data_to_tenant(
             and event_log.dataset == rule.dataset
         ]
         logger.info(f"<cyan>Pushing test data for {rule.dataset} to tenant...</cyan>")
+        return xsiam_push_to_dataset(xsiam_client, events_test_data, rule)
+
+    # the test data of all the datasets is pushed concurrently
+    with ThreadPoolExecutor(XSIAM_CLIENT_MAX_WORKERS) as executor:
+        push_futures = [
+            (rule, executor.submit(push_rule_test_data, rule)) for rule in mr.rules
+        ]
+    for rule, push_future in push_futures:
         try:
-            retrying_caller(xsiam_push_to_dataset, xsiam_client, events_test_data, rule)
+            push_future.result()
         except requests.exceptions.RequestException:
             system_err = (
                 f"Failed pushing test data to tenant for dataset {rule.dataset}"
@@ -923,14 +1032,17 @@ def delete_existing_dataset_flow(
 
 
 def verify_data_sets_exists(xsiam_client, retrying_caller, test_data):
-    datasets_test_case_ls = []
-    for dataset in test_data.data:
-        dataset_name = dataset.dataset
-        dataset_test_case = check_dataset_exists(
-            xsiam_client, retrying_caller, dataset_name
+    # the datasets are checked concurrently, so they all wait for the installation of the datasets together
+    datasets = list(dict.fromkeys(event_log.dataset for event_log in test_data.data))
+    with ThreadPoolExecutor(XSIAM_CLIENT_MAX_WORKERS) as executor:
+        return list(
+            executor.map(
+                lambda dataset_name: check_dataset_exists(
+                    xsiam_client, retrying_caller, dataset_name
+                ),
+                datasets,
+            )
         )
-        datasets_test_case_ls.append(dataset_test_case)
-    return datasets_test_case_ls
 
 
 def validate_modeling_rule(
@@ -1139,15 +1251,23 @@ def validate_modeling_rule(
                         modeling_rule_test_suite,
                         executed_command,
                     )
+                stage_start_time = get_utc_now()
                 push_test_data_test_case = push_test_data_to_tenant(
-                    xsiam_client, retrying_caller, modeling_rule, test_data
+                    xsiam_client, modeling_rule, test_data
+                )
+                add_stage_duration_property(
+                    modeling_rule_test_suite, "push_test_data", stage_start_time
                 )
                 modeling_rule_test_suite.add_testcase(push_test_data_test_case)
                 if not push_test_data_test_case.is_passed:
                     return False, modeling_rule_test_suite
+                stage_start_time = get_utc_now()
                 datasets_test_case = verify_data_sets_exists(
                     xsiam_client, retrying_caller, test_data
                 )
+                add_stage_duration_property(
+                    modeling_rule_test_suite, "verify_datasets_exist", stage_start_time
+                )
                 modeling_rule_test_suite.add_testcases(datasets_test_case)
             else:
                 logger.info(
@@ -1156,9 +1276,13 @@ def validate_modeling_rule(
             logger.info(
                 "<cyan>Validating expected_values...</cyan>",
             )
+            stage_start_time = get_utc_now()
             validate_expected_values_test_cases = validate_expected_values(
                 xsiam_client, retrying_caller, modeling_rule, test_data
             )
+            add_stage_duration_property(
+                modeling_rule_test_suite, "validate_expected_values", stage_start_time
+            )
             modeling_rule_test_suite.add_testcases(validate_expected_values_test_cases)
             if (
                 not modeling_rule_test_suite.errors
@@ -1336,6 +1460,21 @@ def handle_missing_event_data_in_modeling_rule(
     return False, modeling_rule_test_suite
 
 
+def add_stage_duration_property(
+    test_suite: TestSuite, stage: str, stage_start_time: datetime
+):
+    """Add the duration of a stage of the modeling rule test as a property of its test suite.
+
+    Args:
+        test_suite (TestSuite): The test suite of the modeling rule.
+        stage (str): The name of the stage.
+        stage_start_time (datetime): The start time of the stage.
+    """
+    duration = duration_since_start_time(stage_start_time)
+    logger.debug(f"Stage {stage} finished after {duration:.2f} seconds")
+    test_suite.add_property(f"{stage}_duration", f"{duration:.2f}")
+
+
 def log_error_to_test_case(
     err: str, schema_test_case: TestCase, modeling_rule_test_suite: TestSuite
 ) -> Tuple[bool, TestSuite]:
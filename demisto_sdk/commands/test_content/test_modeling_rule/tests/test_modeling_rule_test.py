@@ -130,6 +130,57 @@ class TestVerifyResults:
             test_suite.errors + test_suite.failures != 0
         ), "Test modeling rule should fail"
 
+    def test_verify_results_streamed_results_count_mismatch(self):
+        """
+        Given:
+            - Streamed query results with more events than in the test data.
+
+        When:
+            - Verifying the results.
+
+        Then:
+            - Verify the results are consumed until they end, and a single failure for the count mismatch is returned.
+        """
+        from demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule import (
+            verify_results,
+        )
+        from demisto_sdk.commands.test_content.xsiam_tools.test_data import (
+            EventLog,
+            TestData,
+        )
+
+        tested_dataset = "vendor_product_raw"
+        consumed_results = []
+
+        def query_results():
+            for i in range(3):
+                consumed_results.append(i)
+                yield {
+                    "vendor_product_raw.test_data_event_id": str(DEFAULT_TEST_EVENT_ID),
+                    "xdm.field1": "value1",
+                }
+
+        test_data = TestData(
+            data=[
+                EventLog(
+                    test_data_event_id=DEFAULT_TEST_EVENT_ID,
+                    vendor="vendor",
+                    product="product",
+                    dataset=tested_dataset,
+                    event_data={},
+                    expected_values={"xdm.field1": "value1"},
+                )
+            ]
+        )
+
+        test_cases = verify_results(
+            ModelingRuleMock(), tested_dataset, query_results(), test_data
+        )
+
+        assert consumed_results == [0, 1, 2]
+        assert len(test_cases) == 1
+        assert "Expected 1 results, got 3" in test_cases[0].result[0].message
+
 
 @pytest.mark.parametrize(
     "epoc_time, with_ms, human_readable_time",
@@ -466,3 +517,73 @@ class TestValidateSchemaAlignedWithTestData:
         )
         assert success is False
         assert "The testdata contains events with the same event_key" in caplog.text
+
+
+def test_xsiam_execute_queries(mocker):
+    """
+    Given:
+        - XQL queries, one finishes on the first polling round, one on the second, one fails to start,
+          one fails while running, and one never finishes.
+
+    When:
+        - The xsiam_execute_queries function is running.
+
+    Then:
+        - Verify all the queries are started before their results are polled.
+        - Verify the execution IDs of the running queries are polled together in rounds, until they finish.
+        - Verify the errors of the queries which failed or did not finish in time are returned.
+    """
+    import requests
+    from tenacity import Retrying, stop_after_attempt
+
+    from demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule import (
+        xsiam_execute_queries,
+    )
+    from demisto_sdk.commands.test_content.xsiam_tools.xsiam_client import (
+        XqlQueryFailedError,
+    )
+
+    mocker.patch(
+        "demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule.sleep"
+    )
+    requests_sent = []
+    polls = {"fast": 0, "slow": 0, "stuck": 0, "canceled": 0}
+
+    def start_xql_query(query):
+        requests_sent.append(("start", query))
+        if query == "failing":
+            raise requests.exceptions.HTTPError("failed to start")
+        return query
+
+    def iter_xql_query_result(execution_id, pending_flag=False):
+        assert pending_flag
+        requests_sent.append(("poll", execution_id))
+        polls[execution_id] += 1
+        if execution_id == "fast" or (execution_id == "slow" and polls["slow"] == 2):
+            return iter([{"execution_id": execution_id}])
+        if execution_id == "canceled":
+            raise XqlQueryFailedError("finished with status CANCELED")
+        return None
+
+    xsiam_client = mocker.MagicMock(
+        start_xql_query=start_xql_query, iter_xql_query_result=iter_xql_query_result
+    )
+    results = xsiam_execute_queries(
+        xsiam_client,
+        Retrying(stop=stop_after_attempt(1), reraise=True),
+        {"1": "fast", "2": "slow", "3": "failing", "4": "stuck", "5": "canceled"},
+        max_workers=2,
+        timeout=0.5,
+    )
+
+    assert list(results["1"]) == [{"execution_id": "fast"}]
+    assert list(results["2"]) == [{"execution_id": "slow"}]
+    assert isinstance(results["3"], requests.exceptions.HTTPError)
+    assert isinstance(results["4"], requests.exceptions.Timeout)
+    assert isinstance(results["5"], XqlQueryFailedError)
+    assert {request for request, _ in requests_sent[:5]} == {"start"}
+    assert {request for request, _ in requests_sent[5:]} == {"poll"}
+    assert polls["canceled"] == 1
+    assert polls["fast"] == 1
+    assert polls["slow"] == 2
+    assert polls["stuck"] >= 2
@@ -0,0 +1,31 @@
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.test_content.TestDurationsStore import TestDurationsStore
+
+
+def test_test_durations_store(tmp_path):
+    """
+    Given:
+        - The durations of tests in a previous build
+        - Executions of a test which ran before, and of a test which has never run
+
+    When:
+        - Saving the durations of the current build, and loading them again
+
+    Then:
+        - Ensure the durations of all the executions of a test are summed
+        - Ensure the expected duration of a test which ran before is averaged with its previous duration
+        - Ensure the expected duration of a new test is its duration
+        - Ensure the default duration is returned for tests which have never run
+    """
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({"old_test": 100}))
+    store = TestDurationsStore(path)
+    store.add_duration("old_test", 150)
+    store.add_duration("old_test", 50)
+    store.add_duration("new_test", 30)
+    store.save()
+
+    store = TestDurationsStore(path)
+    assert store.get("old_test", default=0) == 150
+    assert store.get("new_test", default=0) == 30
+    assert store.get("unknown_test", default=10) == 10
@@ -0,0 +1,91 @@
+import threading
+import time
+from queue import Queue
+from types import SimpleNamespace
+
+from demisto_sdk.commands.test_content.TestsScheduler import TestsScheduler
+
+
+def generate_test_playbook(mocker, playbook_id: str, integrations: list, timeout: int):
+    return SimpleNamespace(
+        configuration=SimpleNamespace(playbook_id=playbook_id, timeout=timeout),
+        integrations_to_lock=[
+            SimpleNamespace(name=integration) for integration in integrations
+        ],
+        build_context=SimpleNamespace(logging_module=mocker.MagicMock()),
+    )
+
+
+def test_tests_scheduler(mocker):
+    """
+    Given:
+        - Test playbooks, two of them use the same integration, and one is exclusive
+        - A test which can not be executed on its first attempt
+
+    When:
+        - Running the tests with at most 3 concurrent tests
+
+    Then:
+        - Ensure all the tests are executed, and the test which was not executed is retried
+        - Ensure tests are executed concurrently, but never more than 3 at a time
+        - Ensure the tests sharing an integration and the exclusive test never run with conflicting tests
+        - Ensure the tests expected to take the longest are started first
+    """
+    test_playbooks = [
+        generate_test_playbook(mocker, "short", ["integration_a"], timeout=10),
+        generate_test_playbook(mocker, "long", ["integration_a"], timeout=100),
+        generate_test_playbook(mocker, "medium", ["integration_b"], timeout=50),
+        generate_test_playbook(mocker, "no_integrations", [], timeout=20),
+        generate_test_playbook(mocker, "other", ["integration_c"], timeout=30),
+        generate_test_playbook(mocker, "exclusive", [], timeout=40),
+        generate_test_playbook(mocker, "locked", ["integration_d"], timeout=60),
+    ]
+    queue: Queue = Queue()
+    for test_playbook in test_playbooks:
+        queue.put(test_playbook)
+
+    lock = threading.Lock()
+    running = set()
+    started = []
+    concurrent_tests = []
+    attempts = {"locked": 0}
+
+    def execute_test(test_playbook) -> bool:
+        playbook_id = test_playbook.configuration.playbook_id
+        with lock:
+            if playbook_id == "locked" and not attempts["locked"]:
+                attempts["locked"] += 1
+                return False
+            started.append(playbook_id)
+            running.add(playbook_id)
+            concurrent_tests.append(set(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(playbook_id)
+        return True
+
+    TestsScheduler(
+        queue,
+        execute_test=execute_test,
+        max_parallel_tests=3,
+        get_expected_duration=lambda test_playbook: test_playbook.configuration.timeout,
+        is_exclusive=lambda test_playbook: (
+            test_playbook.configuration.playbook_id == "exclusive"
+        ),
+        logging_module=mocker.MagicMock(),
+        round_sleep=0.1,
+    ).run()
+
+    assert sorted(started) == sorted(
+        test_playbook.configuration.playbook_id for test_playbook in test_playbooks
+    )
+    assert attempts["locked"] == 1
+    assert queue.empty()
+    assert not queue.unfinished_tasks
+
+    assert max(len(tests) for tests in concurrent_tests) == 3
+    for tests in concurrent_tests:
+        assert not {"short", "long"}.issubset(tests)
+        assert "exclusive" not in tests or tests == {"exclusive"}
+
+    assert started[:2] == ["long", "medium"]
@@ -7,6 +7,9 @@ from demisto_sdk.commands.test_content.ParallelLoggingManager import (
     ParallelLoggingManager,
 )
 from demisto_sdk.commands.test_content.TestContentClasses import BuildContext
+from demisto_sdk.commands.test_content.TestDurationsStore import (
+    TEST_DURATIONS_FILE_NAME,
+)
 from demisto_sdk.commands.test_content.tests.DemistoClientMock import DemistoClientMock
 
 
@@ -714,3 +717,59 @@ def test_get_instances_ips(mocker, tmp_path):
     )
     build_context = get_mocked_build_context(mocker, tmp_path)
     assert build_context.instances_ips == ["1.1.1.1"]
+
+
+def test_tests_are_balanced_between_on_prem_servers(mocker, tmp_path):
+    """
+    Given:
+        - A build context with two on-prem servers
+        - The durations of the tests in previous builds, and a test which has never run
+
+    When:
+        - Initializing the BuildContext instance
+
+    Then:
+        - Ensure every test is assigned to a single server
+        - Ensure the tests are split by their expected durations, using the timeout of the test which has never run
+        - Ensure the tests assigned to the other server are not reported as skipped
+    """
+    durations = {"long_test": 300, "medium_test": 200, "short_test": 100}
+    (tmp_path / TEST_DURATIONS_FILE_NAME).write_text(json.dumps(durations))
+    tests = [
+        generate_test_configuration(playbook_id="long_test"),
+        generate_test_configuration(playbook_id="medium_test"),
+        generate_test_configuration(playbook_id="short_test"),
+        generate_test_configuration(playbook_id="new_test", timeout=250),
+    ]
+    mocker.patch(
+        "demisto_sdk.commands.test_content.TestContentClasses.is_redhat_instance",
+        return_value=False,
+    )
+    build_context = get_mocked_build_context(
+        mocker,
+        tmp_path,
+        content_conf_json=generate_content_conf_json(tests=tests),
+        env_results_content=generate_env_results_content(number_of_instances=2),
+        machine_assignment_content={
+            "xsoar-machine": {
+                "packs_to_install": ["TEST"],
+                "tests": {TEST_PLAYBOOKS: [*durations, "new_test"]},
+            }
+        },
+    )
+    assert [server.assigned_tests for server in build_context.servers] == [
+        ["long_test", "short_test"],
+        ["new_test", "medium_test"],
+    ]
+    assert all(
+        server.filtered_tests == [*durations, "new_test"]
+        for server in build_context.servers
+    )
+    assert [
+        sorted(
+            test.configuration.playbook_id
+            for test in server.unmockable_tests_to_run.queue
+        )
+        for server in build_context.servers
+    ] == [["long_test", "short_test"], ["medium_test", "new_test"]]
+    assert not build_context.tests_data_keeper.skipped_tests
@@ -275,6 +275,75 @@ class TestTimeStampReplacer:
             elif key == "dict1":
                 assert time_stamp_replacer.constant in val["list"]
 
+    def test_cleaning_nested_problematic_keys_from_json_keys(self, mocker, flow):
+        """
+        Given:
+            - A timestamp replacer instance with json keys which are prefixes of each other and list indices
+        When:
+            - digesting requests in clean mode
+        Then:
+            - Ensure the values of all the existing key paths are replaced with constant value
+            - Ensure key paths which do not exist in the body are ignored
+            - Ensure the key paths are compiled again when the json keys change
+        """
+        mocker.patch("builtins.open", mock_open())
+        mitmproxy.ctx.options.script_mode = "clean"
+        flow.request.method = "POST"
+        flow.request.set_content(
+            json.dumps(
+                {
+                    "query": {"time": "now", "filter": {"from": "yesterday"}},
+                    "list": ["test", "2021-01-11T13:18:12+00:00"],
+                    "key1": "value1",
+                }
+            ).encode()
+        )
+        time_stamp_replacer = TimestampReplacer()
+        time_stamp_replacer.json_keys = {
+            "query.time",
+            "query.filter",
+            "query.filter.from",
+            "list.1",
+            "list.5",
+            "missing.key",
+        }
+        time_stamp_replacer.request(flow)
+        constant = time_stamp_replacer.constant
+        assert json.loads(flow.request.get_content()) == {
+            "query": {"time": constant, "filter": constant},
+            "list": ["test", constant],
+            "key1": "value1",
+        }
+
+        time_stamp_replacer.json_keys.add("key1")
+        time_stamp_replacer.request(flow)
+        assert json.loads(flow.request.get_content())["key1"] == constant
+
+    def test_problematic_keys_file_is_updated_only_for_new_keys(self, mocker, flow):
+        """
+        Given:
+            - A timestamp replacer instance
+        When:
+            - recording requests, where only the first one has new problematic keys
+        Then:
+            - Ensure the problematic keys file is written only when new keys are detected
+        """
+        mocker.patch("builtins.open", mock_open())
+        mitmproxy.ctx.options.detect_timestamps = True
+        mitmproxy.ctx.options.script_mode = "record"
+        flow.request.method = "POST"
+        flow.request.set_content(
+            json.dumps({"timestamp_key": TIMESTAMP_FORMATS[0]}).encode()
+        )
+        time_stamp_replacer = TimestampReplacer()
+        update_problem_keys_file = mocker.patch.object(
+            time_stamp_replacer, "update_problem_keys_file"
+        )
+        time_stamp_replacer.request(flow)
+        time_stamp_replacer.request(flow)
+        assert time_stamp_replacer.json_keys == {"timestamp_key"}
+        assert update_problem_keys_file.call_count == 1
+
     def test_url_query_is_sorted(self, mocker, flow):
         """
         Given:
@@ -0,0 +1,220 @@
+import gzip
+import time
+from concurrent.futures import wait
+
+import pytest
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.test_content.xsiam_tools.xsiam_client import (
+    XqlQueryFailedError,
+    XsiamApiClient,
+    XsiamApiClientConfig,
+    iter_gzip_chunks,
+)
+
+BASE_URL = "https://api-fake.xdr.us.paloaltonetworks.com"
+
+
+def test_iter_gzip_chunks():
+    """
+    Given:
+        - Events, one of them bigger than the chunk size
+
+    When:
+        - Compressing the events into chunks
+
+    Then:
+        - Ensure every chunk is a gzip of newline-delimited events, not bigger than the chunk size
+        - Ensure the big event is put in a chunk of its own, and no event is lost
+    """
+    events = [{"id": i, "value": "a" * 20} for i in range(10)]
+    events.insert(5, {"id": "big", "value": "b" * 200})
+
+    chunks = [
+        gzip.decompress(chunk).decode() for chunk in iter_gzip_chunks(events, 100)
+    ]
+
+    assert [
+        json.loads(line) for chunk in chunks for line in chunk.split("\n")
+    ] == events
+    assert json.dumps(events[5]) in chunks
+    assert all(len(chunk) <= 100 for chunk in chunks if "big" not in chunk)
+    assert len(chunks) > 2
+    assert list(iter_gzip_chunks([], 100)) == []
+
+
+def test_push_to_dataset_in_chunks(mocker, requests_mock):
+    """
+    Given:
+        - Events which are split into several chunks
+        - The first request of one of the chunks fails
+
+    When:
+        - Pushing the events to a dataset
+
+    Then:
+        - Ensure all the events are pushed, and only the failed chunk is pushed again
+    """
+    mocker.patch("demisto_sdk.commands.common.tools.time.sleep")
+    client = XsiamApiClient(
+        XsiamApiClientConfig(
+            base_url=BASE_URL,
+            api_key="api_key",
+            auth_id="1",
+            token="token",
+        )
+    )
+    pushed_events = []
+    failed_chunks = []
+
+    def push_callback(request, context):
+        events = gzip.decompress(request.body).decode().split("\n")
+        if not failed_chunks:
+            failed_chunks.append(events)
+            context.status_code = 500
+            return {"error": "failed"}
+        pushed_events.extend(json.loads(event) for event in events)
+        context.status_code = 200
+        return {}
+
+    requests_mock.post(f"{BASE_URL}/logs/v1/xsiam", json=push_callback)
+    events = [{"id": i, "value": "a" * 20} for i in range(50)]
+
+    responses = client.push_to_dataset(
+        events, "vendor", "product", chunk_size=200, max_workers=3
+    )
+
+    assert sorted(pushed_events, key=lambda event: event["id"]) == events
+    assert len(responses) == len(requests_mock.request_history) - 1
+    assert requests_mock.last_request.headers["vendor"] == "vendor"
+    assert requests_mock.last_request.headers["content-encoding"] == "gzip"
+
+
+def test_push_to_dataset_waits_for_pending_chunks(mocker, requests_mock):
+    """
+    Given:
+        - Events which are split into more chunks than the number of workers
+        - Slow push requests
+
+    When:
+        - Pushing the events to a dataset
+
+    Then:
+        - Ensure only the chunks which are still being pushed are waited for
+        - Ensure there is no more than a single wait for every pushed chunk
+    """
+    client = XsiamApiClient(
+        XsiamApiClientConfig(
+            base_url=BASE_URL,
+            api_key="api_key",
+            auth_id="1",
+            token="token",
+        )
+    )
+    waited_futures_done = []
+
+    def wait_spy(futures, *args, **kwargs):
+        waited_futures_done.extend(future.done() for future in futures)
+        return wait(futures, *args, **kwargs)
+
+    wait_mock = mocker.patch(
+        "demisto_sdk.commands.test_content.xsiam_tools.xsiam_client.wait",
+        side_effect=wait_spy,
+    )
+
+    def push_callback(request, context):
+        time.sleep(0.01)
+        context.status_code = 200
+        return {}
+
+    requests_mock.post(f"{BASE_URL}/logs/v1/xsiam", json=push_callback)
+    events = [{"id": i, "value": "a" * 20} for i in range(50)]
+
+    responses = client.push_to_dataset(
+        events, "vendor", "product", chunk_size=200, max_workers=2
+    )
+
+    assert len(responses) == requests_mock.call_count > 2
+    assert 0 < wait_mock.call_count <= len(responses)
+    assert not any(waited_futures_done)
+
+
+def test_iter_xql_query_result_from_stream(requests_mock):
+    """
+    Given:
+        - An XQL query with results which do not fit in a single response, which are returned in a compressed stream
+
+    When:
+        - Iterating over the results of the query
+
+    Then:
+        - Ensure all the rows are read from the stream of the query
+        - Ensure the results are returned inline when they fit in the response, and None is returned for pending queries
+    """
+    client = XsiamApiClient(
+        XsiamApiClientConfig(
+            base_url=BASE_URL,
+            api_key="api_key",
+            auth_id="1",
+            token="token",
+        )
+    )
+    rows = [{"id": i} for i in range(2000)]
+    requests_mock.post(
+        f"{BASE_URL}/public_api/v1/xql/get_query_results/",
+        [
+            {"json": {"reply": {"status": "PENDING"}}},
+            {
+                "json": {
+                    "reply": {
+                        "status": "SUCCESS",
+                        "number_of_results": len(rows),
+                        "results": {"stream_id": "stream-id"},
+                    }
+                }
+            },
+            {"json": {"reply": {"status": "SUCCESS", "results": {"data": rows[:2]}}}},
+        ],
+    )
+    stream_mock = requests_mock.post(
+        f"{BASE_URL}/public_api/v1/xql/get_query_results_stream/",
+        content=gzip.compress("\n".join(json.dumps(row) for row in rows).encode()),
+    )
+
+    assert client.iter_xql_query_result("execution-id", pending_flag=True) is None
+    results = client.iter_xql_query_result("execution-id", pending_flag=True)
+    assert not stream_mock.called
+    assert list(results) == rows
+    assert stream_mock.last_request.json() == {
+        "request_data": {"stream_id": "stream-id", "is_gzip_compressed": True}
+    }
+    assert client.get_xql_query_result("execution-id") == rows[:2]
+
+
+@pytest.mark.parametrize("status", ["FAIL", "CANCELED"])
+def test_iter_xql_query_result_not_successful(requests_mock, status):
+    """
+    Given:
+        - An XQL query which finished without results
+
+    When:
+        - Polling the results of the query
+
+    Then:
+        - Ensure an error is raised instead of treating the query as still running
+    """
+    client = XsiamApiClient(
+        XsiamApiClientConfig(
+            base_url=BASE_URL,
+            api_key="api_key",
+            auth_id="1",
+            token="token",
+        )
+    )
+    requests_mock.post(
+        f"{BASE_URL}/public_api/v1/xql/get_query_results/",
+        json={"reply": {"status": status}},
+    )
+
+    with pytest.raises(XqlQueryFailedError, match=status):
+        client.iter_xql_query_result("execution-id", pending_flag=True)
@@ -10,10 +10,9 @@ import logging
 import urllib.parse
 from ast import literal_eval
 from collections import OrderedDict
-from copy import deepcopy
 from pathlib import Path
 from time import ctime
-from typing import List, Union
+from typing import Any, Iterable, List, Tuple, Union
 
 from dateparser import parse
 from mitmproxy import ctx
@@ -26,6 +25,29 @@ logging.basicConfig(
     level=logging.DEBUG, format="[%(asctime)s] - [%(funcName)s] - %(message)s"
 )
 
+# marks the end of a key path in a compiled key paths tree, never a key of a json body
+KEY_PATH_END = None
+
+
+def compile_key_paths(key_paths: Iterable[str]) -> dict:
+    """
+    Compiles key paths (in dot notation) into a tree of their parts, so that a json body is walked once for all of
+    them, instead of splitting and walking every key path for every request.
+
+    Arguments:
+        key_paths (Iterable[str]): The key paths to compile, e.g. 'query.filter.time'
+
+    Returns:
+        (dict): The tree of the key paths, the nodes where a key path ends contain the KEY_PATH_END key
+    """
+    tree: dict = {}
+    for key_path in key_paths:
+        node = tree
+        for key in key_path.split("."):
+            node = node.setdefault(key, {})
+        node[KEY_PATH_END] = {}
+    return tree
+
 
 def record_concurrently(replaying: bool = False):
     """
@@ -66,6 +88,8 @@ class TimestampReplacer:
         self.query_keys = set()
         self.bad_keys_filepath = ""
         self.detect_timestamps = False
+        self._compiled_json_keys: frozenset = frozenset()
+        self._json_keys_tree: dict = {}
 
     def load(self, loader: Loader):
         loader.add_option(
@@ -141,11 +165,14 @@ class TimestampReplacer:
             self.replace_boundary(req)
         if ctx.options.script_mode == "record":
             if ctx.options.detect_timestamps:
+                problematic_keys_count = self.problematic_keys_count()
                 self.run_all_key_detections(req)
-                logging.info(
-                    f'updating problem_keys file at "{self.bad_keys_filepath}"'
-                )
-                self.update_problem_keys_file()
+                # the problem keys file is rewritten only when new problematic keys are detected
+                if self.problematic_keys_count() != problematic_keys_count:
+                    logging.info(
+                        f'updating problem_keys file at "{self.bad_keys_filepath}"'
+                    )
+                    self.update_problem_keys_file()
         elif ctx.options.script_mode in {"clean", "playback"}:
             logging.info(f"flow.live is: {flow.live}")
             flow.live = False
@@ -269,48 +296,62 @@ class TimestampReplacer:
             req (Request): The request whose json body will be modified.
             json_body (dict): The request body to modify.
         """
-        original_content = deepcopy(json_body)
-        modified = False
-        keys_to_replace = self.json_keys
-        logging.info(f"{keys_to_replace}")
-        for key_path in keys_to_replace:
-            body = json_body
-            keys = key_path.split(".")
-            logging.info(f"keypath parts: {keys}")
-            lastkey = keys[-1]
-            logging.info(f"lastkey: {lastkey}")
-            skip_key = False
-            for k in keys[:-1]:
-                if k in body:
-                    body = body[k]
-                elif isinstance(body, list) and k.isdigit():
-                    if int(k) > len(body) - 1:
-                        skip_key = True
-                        break
-                    body = body[int(k)]
-                else:
-                    skip_key = True
-                    break
-            if not skip_key:
-                if lastkey in body:
-                    logging.info(f'modifying request to "{req.pretty_url}"')
-                    body[lastkey] = self.constant
-                    modified = True
-                elif (
-                    isinstance(body, list)
-                    and lastkey.isdigit()
-                    and int(lastkey) <= len(body) - 1
-                ):
-                    logging.info(f'modifying request to "{req.pretty_url}"')
-                    body[int(lastkey)] = self.constant
-                    modified = True
-        if modified:
-            logging.info(
-                f"original request body:\n{json.dumps(original_content, indent=4)}"
-            )
-            logging.info(f"modified request body:\n{json.dumps(json_body, indent=4)}")
+        replaced_values: List[Tuple[str, Any]] = []
+        self.replace_key_paths(json_body, self.json_keys_tree(), replaced_values)
+        if replaced_values:
+            logging.info(f'modifying request to "{req.pretty_url}"')
+            for key_path, original_value in replaced_values:
+                logging.info(
+                    f'replaced the value "{original_value}" of key "{key_path}" with "{self.constant}"'
+                )
             req.set_content(json.dumps(json_body).encode())
 
+    def json_keys_tree(self) -> dict:
+        """Returns the compiled tree of the json keys to replace, compiling it again only if the keys changed"""
+        json_keys = frozenset(self.json_keys)
+        if json_keys != self._compiled_json_keys:
+            logging.info(f"compiling the json keys to replace: {json_keys}")
+            self._json_keys_tree = compile_key_paths(json_keys)
+            self._compiled_json_keys = json_keys
+        return self._json_keys_tree
+
+    def replace_key_paths(
+        self,
+        body: Union[dict, list],
+        key_paths_tree: dict,
+        replaced_values: List[Tuple[str, Any]],
+        key_path: str = "",
+    ) -> None:
+        """Replace the values of the key paths of a compiled key paths tree in a json body with constant data
+
+        Args:
+            body (Union[dict, list]): The json body (or a part of it) to modify.
+            key_paths_tree (dict): The compiled tree of the key paths to replace, relative to the body.
+            replaced_values (List[Tuple[str, Any]]): The replaced key paths and their original values are added to it.
+            key_path (str): The key path of the body in the whole json body.
+        """
+        for key, sub_tree in key_paths_tree.items():
+            if key is KEY_PATH_END:
+                continue
+            index: Union[str, int]
+            if isinstance(body, dict) and key in body:
+                index = key
+            elif isinstance(body, list) and key.isdigit() and int(key) < len(body):
+                index = int(key)
+            else:
+                continue
+            sub_key_path = f"{key_path}.{key}" if key_path else key
+            if isinstance(body[index], (dict, list)):  # type: ignore[index]
+                self.replace_key_paths(
+                    body[index],  # type: ignore[index]
+                    sub_tree,
+                    replaced_values,
+                    sub_key_path,
+                )
+            if KEY_PATH_END in sub_tree:
+                replaced_values.append((sub_key_path, body[index]))  # type: ignore[index]
+                body[index] = self.constant  # type: ignore[index]
+
     def run_all_key_detections(self, req: Request) -> None:
         """Used to detect problematic keys in
         1. request query parameters
@@ -407,64 +448,46 @@ class TimestampReplacer:
                 problematic key) whose values are potentially timestamp data.
         """
 
-        def travel_dict(obj: Union[dict, list], key_path="") -> List[str]:
-            bad_key_paths = []
-            if isinstance(obj, dict):
-                for key, val in obj.items():
-                    sub_key_path = f"{key_path}.{key}" if key_path else key
-                    if isinstance(val, (list, dict)):
-                        bad_key_paths.extend(travel_dict(val, sub_key_path))
-                    else:
-                        is_string = isinstance(val, str) and len(val) > 4
-                        possible_timestamp = (
-                            isinstance(val, (int, float)) and len(str(val)) >= 8
-                        )
-                        if is_string or possible_timestamp:
-                            for_eval = val
-                            if possible_timestamp:
-                                if isinstance(for_eval, float):
-                                    digits = str(val).split(".")
-                                    for_eval = digits[0]
-                                if len(str(for_eval)) < 13:
-                                    parsed_date = self.safely_parse(ctime(val))
-                                else:
-                                    parsed_date = self.safely_parse(ctime(val / 1000.0))
-                            else:
-                                parsed_date = self.safely_parse(val)
-                            # if parsed_date is not None then successfully interpreted value as some sort of
-                            # time related thingieding
-                            if parsed_date:
-                                bad_key_paths.append(sub_key_path)
-            elif isinstance(obj, list):
-                for i, val in enumerate(obj):
-                    sub_key_path = f"{key_path}.{i}" if key_path else i
-                    if isinstance(val, (list, dict)):
-                        bad_key_paths.extend(travel_dict(val, sub_key_path))
-                    else:
-                        is_string = isinstance(val, str) and len(val) > 4
-                        possible_timestamp = (
-                            isinstance(val, (int, float)) and len(str(val)) >= 8
-                        )
-                        if is_string or possible_timestamp:
-                            for_eval = val
-                            if possible_timestamp:
-                                if isinstance(for_eval, float):
-                                    digits = str(val).split(".")
-                                    for_eval = digits[0]
-                                if len(str(for_eval)) < 13:
-                                    parsed_date = self.safely_parse(ctime(val))
-                                else:
-                                    parsed_date = self.safely_parse(ctime(val / 1000.0))
-                            else:
-                                parsed_date = self.safely_parse(val)
-                            # if parsed_date is not None then successfully interpreted value as some sort of
-                            # time related thingieding
-                            if parsed_date:
-                                bad_key_paths.append(sub_key_path)
-            return bad_key_paths
-
-        bad_keys = travel_dict(content)
-        return bad_keys
+        bad_key_paths = []
+        # the key paths which are already known to be problematic don't need to be parsed again
+        known_key_paths = set(self.json_keys)
+        # the dicts and lists to travel through, with their key paths
+        objects_to_travel: List[Tuple[Union[dict, list], str]] = [(content, "")]
+        while objects_to_travel:
+            obj, key_path = objects_to_travel.pop()
+            items: Iterable[Tuple[Any, Any]] = (
+                obj.items() if isinstance(obj, dict) else enumerate(obj)
+            )
+            for key, val in items:
+                sub_key_path = f"{key_path}.{key}" if key_path else str(key)
+                if isinstance(val, (list, dict)):
+                    objects_to_travel.append((val, sub_key_path))
+                elif sub_key_path in known_key_paths or self.is_possible_timestamp(val):
+                    bad_key_paths.append(sub_key_path)
+        return bad_key_paths
+
+    def is_possible_timestamp(self, val: Any) -> bool:
+        """Whether a value of a json body is potentially timestamp data
+
+        Args:
+            val (Any): The value to inspect
+
+        Returns:
+            bool: True if the value could be interpreted as some sort of time related data
+        """
+        is_string = isinstance(val, str) and len(val) > 4
+        possible_timestamp = isinstance(val, (int, float)) and len(str(val)) >= 8
+        if possible_timestamp:
+            for_eval = str(val).split(".")[0] if isinstance(val, float) else val
+            if len(str(for_eval)) < 13:
+                return self.safely_parse(ctime(val))
+            return self.safely_parse(ctime(val / 1000.0))
+        if is_string:
+            return self.safely_parse(val)
+        return False
+
+    def problematic_keys_count(self) -> int:
+        return len(self.json_keys) + len(self.form_keys) + len(self.query_keys)
 
     def update_problem_keys_file(self):
         """Update the problem keys dictionary at the keys_filepath with new problematic keys"""
@@ -557,6 +580,7 @@ class TimestampReplacer:
             logging.info("not setting bad keys from file")
 
     @staticmethod
+    @functools.lru_cache(maxsize=10000)
     def safely_parse(val):
         """
         Safely tries to parse a value as a datetime object.
@@ -1,10 +1,11 @@
-import gzip
 import os
+import zlib
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from functools import lru_cache
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 from urllib.parse import urljoin
 
 import requests
@@ -19,6 +20,55 @@ from demisto_sdk.commands.common.tools import retry
 
 json = JSON_Handler()
 
+# the maximal size of the (uncompressed) events of a single push request, in bytes
+PUSH_CHUNK_SIZE = 10 * 1024 * 1024
+PUSH_MAX_WORKERS = 4
+PUSH_CHUNK_RETRIES = 3
+# the maximal number of results returned in the response of an XQL query, bigger results are read from a stream
+XQL_QUERY_RESULTS_LIMIT = 1000
+XQL_RESULTS_STREAM_CHUNK_SIZE = 64 * 1024
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
+
+class XqlQueryFailedError(requests.exceptions.RequestException):
+    """Raised when an XQL query finished without results, e.g. when it failed or was canceled."""
+
+
+def iter_gzip_chunks(
+    data: Iterable[Dict[str, Any]], chunk_size: int
+) -> Iterator[bytes]:
+    """
+    Serializes and compresses events incrementally, so only a single compressed chunk is held in memory at a time.
+
+    Args:
+        data: The events to compress
+        chunk_size: The maximal size of the newline-delimited JSON events of a chunk, in bytes.
+            An event bigger than the chunk size is put in a chunk of its own.
+
+    Returns:
+        The gzip-compressed chunks of the events
+    """
+    compressor = None
+    compressed_parts: List[bytes] = []
+    current_chunk_size = 0
+    for event in data:
+        line = json.dumps(event).encode("utf-8")
+        if compressor and current_chunk_size + len(line) + 1 > chunk_size:
+            compressed_parts.append(compressor.flush())
+            yield b"".join(compressed_parts)
+            compressor = None
+        if compressor:
+            line = b"\n" + line
+        else:
+            compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+            compressed_parts = []
+            current_chunk_size = 0
+        compressed_parts.append(compressor.compress(line))
+        current_chunk_size += len(line)
+    if compressor:
+        compressed_parts.append(compressor.flush())
+        yield b"".join(compressed_parts)
+
 
 class XsiamApiClientConfig(BaseModel):
     base_url: HttpUrl = Field(
@@ -76,11 +126,11 @@ class XsiamApiInterface(ABC):
     @abstractmethod
     def push_to_dataset(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         vendor: str,
         product: str,
         data_format: str = "json",
-    ):
+    ) -> List[Dict[str, Any]]:
         pass
 
     @abstractmethod
@@ -91,6 +141,10 @@ class XsiamApiInterface(ABC):
     def get_xql_query_result(self, execution_id: str):
         pass
 
+    @abstractmethod
+    def iter_xql_query_result(self, execution_id: str):
+        pass
+
 
 class XsiamApiClient(XsiamApiInterface):
     def __init__(self, config: XsiamApiClientConfig):
@@ -219,11 +273,28 @@ class XsiamApiClient(XsiamApiInterface):
 
     def push_to_dataset(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         vendor: str,
         product: str,
         data_format: str = "json",
-    ):
+        chunk_size: int = PUSH_CHUNK_SIZE,
+        max_workers: int = PUSH_MAX_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Pushes events to a dataset. The events are serialized and compressed incrementally into chunks, which are
+        uploaded concurrently, each of them retried on its own if it fails.
+
+        Args:
+            data: The events to push
+            vendor: The vendor of the dataset
+            product: The product of the dataset
+            data_format: The format of the events
+            chunk_size: The maximal size of the (uncompressed) events of a single request, in bytes
+            max_workers: The maximal number of chunks to upload concurrently
+
+        Returns:
+            The responses of the requests of the chunks
+        """
         if self.token:
             endpoint = urljoin(self.base_url, "logs/v1/xsiam")
             additional_headers = {
@@ -246,12 +317,38 @@ class XsiamApiClient(XsiamApiInterface):
                 "content-encoding": "gzip",
             }
             token_type = "collector_token"
+        else:
+            raise ValueError(
+                "XSIAM_TOKEN or XSIAM_COLLECTOR_TOKEN is missing for pushing logs"
+            )
 
-        formatted_data = "\n".join([json.dumps(d) for d in data])
-        compressed_data = gzip.compress(formatted_data.encode("utf-8"))
-        response = self._session.post(
-            endpoint, data=compressed_data, headers=additional_headers
-        )
+        futures: List[Future] = []
+        pending: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers) as executor:
+            for chunk in iter_gzip_chunks(data, chunk_size):
+                # don't compress chunks faster than they are uploaded, to keep the memory usage bounded
+                while len(pending) >= max_workers:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                future = executor.submit(
+                    self._push_chunk,
+                    endpoint,
+                    chunk,
+                    additional_headers,
+                    token_type,
+                )
+                futures.append(future)
+                pending.add(future)
+        return [future.result() for future in futures]
+
+    @retry(times=PUSH_CHUNK_RETRIES, exceptions=requests.exceptions.RequestException)
+    def _push_chunk(
+        self,
+        endpoint: str,
+        chunk: bytes,
+        headers: Dict[str, str],
+        token_type: str,
+    ) -> Dict[str, Any]:
+        response = self._session.post(endpoint, data=chunk, headers=headers)
         try:
             data = response.json()
         except requests.exceptions.JSONDecodeError:  # type: ignore[attr-defined]
@@ -260,13 +357,13 @@ class XsiamApiClient(XsiamApiInterface):
             err_msg += f"\n{error}" if error else ""
             logger.error(err_msg)
             response.raise_for_status()
-        if response.status_code in range(200, 300):
-            return data
-        else:
+            return {}
+        if response.status_code not in range(200, 300):
             logger.error(
                 f"Failed to push using {token_type} - with status code {response.status_code}\n{pformat(data)}"
             )
             response.raise_for_status()
+        return data
 
     def start_xql_query(self, query: str):
         body = {"request_data": {"query": query}}
@@ -281,13 +378,46 @@ class XsiamApiClient(XsiamApiInterface):
             return execution_id
         response.raise_for_status()
 
-    def get_xql_query_result(self, execution_id: str, timeout: int = 300):
+    def get_xql_query_result(
+        self, execution_id: str, timeout: int = 300, pending_flag: bool = False
+    ):
+        """
+        Args:
+            execution_id: The execution ID of the XQL query
+            timeout: The timeout of the request in seconds
+            pending_flag: Whether to return immediately if the query is still running, instead of waiting for it
+
+        Returns:
+            The results of the query, or None if the query is still running
+        """
+        results = self.iter_xql_query_result(execution_id, timeout, pending_flag)
+        return None if results is None else list(results)
+
+    def iter_xql_query_result(
+        self, execution_id: str, timeout: int = 300, pending_flag: bool = False
+    ) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        Gets the results of an XQL query without holding all of them in memory.
+        The status of the query is requested right away, while the rows are fetched as they are iterated -
+        queries with more results than fit in a single response are read from the results stream of the query.
+
+        Args:
+            execution_id: The execution ID of the XQL query
+            timeout: The timeout of the requests in seconds
+            pending_flag: Whether to return immediately if the query is still running, instead of waiting for it
+
+        Returns:
+            An iterator over the results of the query, or None if the query is still running
+
+        Raises:
+            XqlQueryFailedError: If the query finished with any other status, e.g. FAIL or CANCELED
+        """
         payload = json.dumps(
             {
                 "request_data": {
                     "query_id": execution_id,
-                    "pending_flag": False,
-                    "limit": 1000,
+                    "pending_flag": pending_flag,
+                    "limit": XQL_QUERY_RESULTS_LIMIT,
                     "format": "json",
                 }
             }
@@ -299,12 +429,64 @@ class XsiamApiClient(XsiamApiInterface):
         data = response.json()
         logger.debug("{}", pformat(data))  # noqa: PLE1205
 
-        if (
-            response.status_code in range(200, 300)
-            and data.get("reply", {}).get("status", "") == "SUCCESS"
-        ):
-            return data.get("reply", {}).get("results", {}).get("data", [])
-        response.raise_for_status()
+        if response.status_code not in range(200, 300):
+            response.raise_for_status()
+            return None
+        status = data.get("reply", {}).get("status", "")
+        if status == "SUCCESS":
+            results = data.get("reply", {}).get("results", {})
+            if stream_id := results.get("stream_id"):
+                logger.debug(
+                    f"The results of xql query {execution_id} are read from stream {stream_id}"
+                )
+                return self.iter_xql_query_results_stream(stream_id, timeout)
+            return iter(results.get("data", []))
+        if status == "PENDING":
+            return None
+        raise XqlQueryFailedError(
+            f"XQL query {execution_id} finished with status {status or 'unknown'}",
+            response=response,
+        )
+
+    def iter_xql_query_results_stream(
+        self, stream_id: str, timeout: int = 300
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Reads the results of an XQL query from its results stream, yielding the rows as they arrive.
+
+        Args:
+            stream_id: The ID of the results stream of the XQL query
+            timeout: The timeout of the request in seconds
+
+        Returns:
+            The rows of the results of the query
+        """
+        endpoint = urljoin(self.base_url, "public_api/v1/xql/get_query_results_stream/")
+        body = {"request_data": {"stream_id": stream_id, "is_gzip_compressed": True}}
+        with self._session.post(
+            endpoint, json=body, stream=True, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            is_compressed: Optional[bool] = None
+            pending_data = b""
+            for content in response.iter_content(XQL_RESULTS_STREAM_CHUNK_SIZE):
+                if not content:
+                    continue
+                if is_compressed is None:
+                    # the stream may have already been decompressed according to its content-encoding
+                    is_compressed = content.startswith(GZIP_MAGIC_NUMBER)
+                pending_data += (
+                    decompressor.decompress(content) if is_compressed else content
+                )
+                *lines, pending_data = pending_data.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line.decode("utf-8"))
+            if is_compressed:
+                pending_data += decompressor.flush()
+            if pending_data.strip():
+                yield json.loads(pending_data.decode("utf-8"))
 
     def delete_dataset(self, dataset_id: str):
         endpoint = urljoin(self.base_url, "public_api/v1/xql/delete_dataset")
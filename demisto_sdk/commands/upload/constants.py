@@ -2,6 +2,10 @@ from demisto_sdk.commands.content_graph.common import ContentType
 
 MULTIPLE_ZIPPED_PACKS_FILE_STEM = "uploadable_packs"
 MULTIPLE_ZIPPED_PACKS_FILE_NAME = f"{MULTIPLE_ZIPPED_PACKS_FILE_STEM}.zip"
+# uploads failing with one of these statuses (or on a connection error) are retried, with an exponential backoff
+TRANSIENT_UPLOAD_ERROR_STATUSES = {429, 502, 503, 504}
+UPLOAD_RETRIES = 3
+UPLOAD_RETRY_BACKOFF_SECONDS = 2
 
 CONTENT_TYPES_EXCLUDED_FROM_UPLOAD = {
     ContentType.TEST_PLAYBOOK,
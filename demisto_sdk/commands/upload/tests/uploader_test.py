@@ -1193,3 +1193,184 @@ def test_zip_multiple_packs(tmp_path: Path, integration, mocker, monkeypatch):
         "Pack1.zip",
         "zipped.zip",
     }
+
+
+def test_zip_and_upload(tmp_path: Path, integration, mocker, monkeypatch):
+    """
+    Given:
+        - A pack.
+    When:
+        - Zipping and uploading the pack.
+    Then:
+        - Make sure the uploaded pack zip contains the dumped pack,
+          and uploadable_packs.zip contains the uploaded pack zip.
+    """
+    from demisto_sdk.commands.content_graph.objects import pack as pack_module
+
+    pack = mock_pack(name="Pack0", path=tmp_path / "Packs" / "Pack0")
+    pack.path.mkdir(parents=True)
+    pack.content_items.integration.append(mock_integration(path=integration.yml.path))
+    (pack.path / "README.md").touch()
+    (pack.path / "pack_metadata.json").touch()
+    mocker.patch.object(PackMetadata, "_get_tags_from_landing_page", retrun_value={})
+    uploaded_files = {}
+
+    def _upload_zip(path: Path, **kwargs):
+        with zipfile.ZipFile(path) as zip_file:
+            uploaded_files[path.name] = set(zip_file.namelist())
+        return True
+
+    mocker.patch.object(pack_module, "upload_zip", side_effect=_upload_zip)
+    destination_dir = tmp_path / "output"
+    destination_dir.mkdir()
+
+    with TemporaryDirectory() as dir:
+        monkeypatch.setenv("DEMISTO_SDK_CONTENT_PATH", dir)
+        assert pack._zip_and_upload(
+            client=MagicMock(),
+            target_demisto_version=Version("8.0.0"),
+            skip_validations=False,
+            marketplace=MarketplaceVersions.XSOAR,
+            destination_dir=destination_dir,
+        )
+
+    assert uploaded_files == {
+        "Pack0.zip": {
+            "Integrations/",
+            "Integrations/integration-integration_0.yml",
+            "README.md",
+            "metadata.json",
+            "pack_metadata.json",
+        }
+    }
+    with zipfile.ZipFile(destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_NAME) as zip_file:
+        assert zip_file.namelist() == ["Pack0.zip"]
+        with zipfile.ZipFile(BytesIO(zip_file.read("Pack0.zip"))) as pack_zip:
+            assert set(pack_zip.namelist()) == uploaded_files["Pack0.zip"]
+
+
+def test_upload_multiple_packs_in_parallel(mocker, tmp_path: Path, caplog):
+    """
+    Given:
+        - Two packs to upload, and 2 parallel uploads.
+    When:
+        - Uploading the packs.
+    Then:
+        - Make sure both packs are uploaded, each with its own zip destination directory.
+        - Make sure the client is configured with a connection for each parallel upload.
+        - Make sure the summary includes the upload duration of each pack.
+    """
+    from demisto_sdk.commands.content_graph.objects.pack import Pack
+
+    mock_api_client(mocker)
+    destination_zip_dirs = []
+
+    def _upload(self, destination_zip_dir: Path, **kwargs):
+        destination_zip_dirs.append(destination_zip_dir)
+
+    mocker.patch.object(Pack, "upload", autospec=True, side_effect=_upload)
+    packs = [mock_pack(name=name, path=tmp_path / name) for name in ("Pack0", "Pack1")]
+    for pack in packs:
+        pack.path.mkdir()
+    mocker.patch.object(
+        BaseContent,
+        "from_path",
+        side_effect=lambda path: first_true(packs, pred=lambda p: p.path == path),
+    )
+
+    uploader = Uploader(None, destination_zip_dir=tmp_path, parallel_uploads=2)
+    with pytest.raises(typer.Exit) as e:
+        uploader.upload_multiple([pack.path for pack in packs])
+
+    assert e.value.exit_code == SUCCESS_RETURN_CODE
+    assert demisto_client.configure.call_args.kwargs["connection_pool_maxsize"] == 2
+    assert sorted(destination_zip_dirs) == [tmp_path / "Pack0", tmp_path / "Pack1"]
+    assert set(uploader._upload_durations) == {"Pack0", "Pack1"}
+    assert "UPLOAD DURATIONS:" in caplog.text
+
+
+def test_upload_multiple_zips_in_parallel_prompts_one_at_a_time(mocker, tmp_path: Path):
+    """
+    Given:
+        - Two zipped packs which are already installed, and 2 parallel uploads.
+    When:
+        - Uploading the zips without overriding the existing packs.
+    Then:
+        - Make sure the user is asked about overriding each of the packs, one question at a time.
+    """
+    import threading
+
+    mock_api_client(mocker)
+    mocker.patch.object(
+        API_CLIENT,
+        "generic_request",
+        return_value=[[{"name": "Pack0"}, {"name": "Pack1"}]],
+    )
+    mocker.patch.object(uploader, "upload_zip", return_value=True)
+    prompts_started = threading.Barrier(2, timeout=0.5)
+    concurrent_prompts = []
+
+    def _input():
+        # wait for a concurrent question, which is not expected to be asked
+        try:
+            prompts_started.wait()
+            concurrent_prompts.append(True)
+        except threading.BrokenBarrierError:
+            pass
+        return "y"
+
+    mock_input = mocker.patch("builtins.input", side_effect=_input)
+    paths = []
+    for name in ("Pack0", "Pack1"):
+        shutil.copy(TEST_PACK_ZIP, tmp_path / f"{name}.zip")
+        paths.append(tmp_path / f"{name}.zip")
+
+    zips_uploader = Uploader(None, parallel_uploads=2)
+    with pytest.raises(typer.Exit) as e:
+        zips_uploader.upload_multiple(paths)
+
+    assert e.value.exit_code == SUCCESS_RETURN_CODE
+    assert mock_input.call_count == 2
+    assert not concurrent_prompts
+
+
+@pytest.mark.parametrize(
+    "status, expected_calls, should_raise",
+    [(503, 2, False), (400, 1, True)],
+)
+def test_upload_zip_retries_transient_errors(
+    mocker, status: int, expected_calls: int, should_raise: bool
+):
+    """
+    Given:
+        - A server failing the first upload with a transient / non-transient error.
+    When:
+        - Uploading a zip.
+    Then:
+        - Make sure the upload is retried only on a transient error.
+    """
+    from demisto_sdk.commands.content_graph.objects import pack as pack_module
+
+    sleep_mock = mocker.patch.object(pack_module.time, "sleep")
+    client = MagicMock()
+    client.upload_content_packs.side_effect = [ApiException(status=status), None]
+
+    if should_raise:
+        with pytest.raises(ApiException):
+            pack_module.upload_zip(
+                path=TEST_PACK_ZIP,
+                client=client,
+                skip_validations=False,
+                target_demisto_version=Version("8.0.0"),
+                marketplace=MarketplaceVersions.XSOAR,
+            )
+    else:
+        assert pack_module.upload_zip(
+            path=TEST_PACK_ZIP,
+            client=client,
+            skip_validations=False,
+            target_demisto_version=Version("8.0.0"),
+            marketplace=MarketplaceVersions.XSOAR,
+        )
+    assert client.upload_content_packs.call_count == expected_calls
+    assert sleep_mock.call_count == expected_calls - 1
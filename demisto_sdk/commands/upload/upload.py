@@ -15,6 +15,7 @@ from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     parse_marketplace_kwargs,
     parse_multiple_path_inputs,
+    write_dir_to_zip,
 )
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.content_graph.objects.pack import Pack
@@ -38,6 +39,7 @@ def upload_content_entity(**kwargs):
     keep_zip = kwargs.pop("keep_zip", None)
     destination_zip_path = Path(keep_zip or tempfile.mkdtemp())
     marketplace = parse_marketplace_kwargs(kwargs)
+    parallel_uploads = kwargs.get("parallel_uploads") or 1
 
     if config_file_path := kwargs.pop("input_config_file", None):
         logger.info("Uploading files from config file")
@@ -48,7 +50,10 @@ def upload_content_entity(**kwargs):
 
         paths = ConfigFileParser(Path(config_file_path)).custom_packs_paths
 
-        if not kwargs.get("zip") and are_all_packs_unzipped(paths=paths):
+        if (
+            not kwargs.get("zip") and are_all_packs_unzipped(paths=paths)
+        ) or parallel_uploads > 1:
+            # when uploading in parallel, every pack is zipped and uploaded on its own
             inputs = paths
         else:
             pack_names = zip_multiple_packs(
@@ -71,13 +76,27 @@ def upload_content_entity(**kwargs):
     kwargs.pop("input")
     # Here the magic happens
     upload_result = SUCCESS_RETURN_CODE
-    for input in inputs:
-        result = Uploader(
-            input=input,
-            marketplace=marketplace,
-            destination_zip_dir=destination_zip_path,
-            **kwargs,
-        ).upload()
+    results: Iterable[int]
+    if parallel_uploads > 1 and len(inputs) > 1:
+        results = (
+            Uploader(
+                input=None,
+                marketplace=marketplace,
+                destination_zip_dir=destination_zip_path,
+                **kwargs,
+            ).upload_multiple(inputs),
+        )
+    else:
+        results = (
+            Uploader(
+                input=input,
+                marketplace=marketplace,
+                destination_zip_dir=destination_zip_path,
+                **kwargs,
+            ).upload()
+            for input in inputs
+        )
+    for result in results:
         if result == ABORTED_RETURN_CODE:
             return result
         elif result == ERROR_RETURN_CODE:
@@ -123,9 +142,15 @@ def zip_multiple_packs(
             # copy files that were already zipped into the result
             for was_zipped in were_zipped:
                 zip_file.write(was_zipped, was_zipped.name)
-            for pack_path in tmp_dir_path.iterdir():
-                shutil.make_archive(str(pack_path), "zip", pack_path)
-                zip_file.write(pack_path.with_suffix(".zip"), f"{pack_path.name}.zip")
+            for pack_path in sorted(tmp_dir_path.iterdir()):
+                # stream each pack zip straight into the result, without writing it to the disk first
+                with (
+                    zip_file.open(
+                        f"{pack_path.name}.zip", "w", force_zip64=True
+                    ) as pack_zip_entry,
+                    ZipFile(pack_zip_entry, "w") as pack_zip_file,
+                ):
+                    write_dir_to_zip(pack_zip_file, pack_path)
 
     return [pack.name for pack in packs] + [path.name for path in were_zipped]
 
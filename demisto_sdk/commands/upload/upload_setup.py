@@ -81,6 +81,13 @@ def upload(
         help="If True, this determines whether a confirmation prompt should be skipped "
         "when attempting to upload a content pack that is already installed.",
     ),
+    parallel_uploads: int = typer.Option(
+        1,
+        "--parallel-uploads",
+        min=1,
+        help="The number of packs to upload at the same time, when uploading multiple packs "
+        "(e.g. using --input-config-file). The next packs are prepared while the previous ones are uploaded.",
+    ),
     console_log_threshold: str = typer.Option(
         None,
         "--console-log-threshold",
@@ -134,4 +141,5 @@ def upload(
         skip_validation=skip_validation,
         reattach=reattach,
         override_existing=override_existing,
+        parallel_uploads=parallel_uploads,
     )
@@ -2,9 +2,12 @@ import ast
 import glob
 import itertools
 import os
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import demisto_client
 import typer
@@ -42,6 +45,9 @@ from demisto_sdk.commands.content_graph.objects.exceptions import (
     FailedUploadMultipleException,
 )
 from demisto_sdk.commands.content_graph.objects.pack import Pack, upload_zip
+from demisto_sdk.commands.prepare_content.markdown_images_handler import (
+    merge_markdown_images_shards,
+)
 from demisto_sdk.commands.upload.constants import CONTENT_TYPES_EXCLUDED_FROM_UPLOAD
 from demisto_sdk.commands.upload.exceptions import (
     IncompatibleUploadVersionException,
@@ -74,13 +80,21 @@ class Uploader:
         zip: bool = False,
         tpb: bool = False,
         destination_zip_dir: Optional[Path] = None,
+        parallel_uploads: int = 1,
         **kwargs,
     ):
         self.path = None if input is None else Path(input)
         verify = (
             (not insecure) if insecure else None
         )  # set to None so demisto_client will use env var DEMISTO_VERIFY_SSL
-        self.client = demisto_client.configure(verify_ssl=verify)
+        self.parallel_uploads = max(parallel_uploads, 1)
+        self.client = demisto_client.configure(
+            verify_ssl=verify,
+            # the concurrent uploads share the client, so its pool should keep a connection for each of them
+            connection_pool_maxsize=(
+                self.parallel_uploads if self.parallel_uploads > 1 else None
+            ),
+        )
 
         self._successfully_uploaded_content_items: List[Union[ContentItem, Pack]] = []
         self._successfully_uploaded_zipped_packs: List[str] = []
@@ -92,6 +106,9 @@ class Uploader:
         self._skipped_upload_marketplace_mismatch: List[ContentItem] = []
         self._failed_upload_zips: List[str] = []
         self.failed_parsing: List[Tuple[Path, str]] = []
+        self._upload_durations: Dict[str, float] = {}
+        # parallel uploads may ask the user about overriding packs concurrently, the questions are asked one by one
+        self._override_prompt_lock = threading.Lock()
 
         self.demisto_version = get_demisto_version(self.client)
         self.pack_names: List[str] = pack_names or []
@@ -130,20 +147,23 @@ class Uploader:
                         .replace(MarketplaceVersions.MarketplaceV2, "XSIAM")
                         .upper()
                     )
-                    logger.info(
-                        "\n".join(
-                            (
-                                "<red>This command will overwrite the following packs:",
-                                pack_names,
-                                f"All changes made in these content items on {product} will be lost.</red>",
-                            )
-                        )
-                    )
-                    if not self.override_existing:
+                    with self._override_prompt_lock:
                         logger.info(
-                            "<red>Are you sure you want to continue? y/[N]</red>"
+                            "\n".join(
+                                (
+                                    "<red>This command will overwrite the following packs:",
+                                    pack_names,
+                                    f"All changes made in these content items on {product} will be lost.</red>",
+                                )
+                            )
                         )
-                        return string_to_bool(str(input()), default_when_empty=False)
+                        if not self.override_existing:
+                            logger.info(
+                                "<red>Are you sure you want to continue? y/[N]</red>"
+                            )
+                            return string_to_bool(
+                                str(input()), default_when_empty=False
+                            )
             return True
 
         def _parse_internal_pack_names(zip_path: Path) -> Optional[Tuple[str, ...]]:
@@ -176,6 +196,7 @@ class Uploader:
         if not notify_user_should_override_packs():
             return False
 
+        start_time = time.time()
         try:
             if upload_zip(
                 path=path,
@@ -191,16 +212,29 @@ class Uploader:
             logger.exception(f"Failed uploading {pack_names}")
             self._failed_upload_zips.extend(pack_names)
 
+        finally:
+            self._upload_durations[path.name] = time.time() - start_time
+
         return False
 
-    def upload(self):
-        """Upload the pack / directory / file to the remote Cortex XSOAR instance."""
+    def _verify_connection(self):
         if self.demisto_version.base_version == "0":
             logger.info(
                 "<red>Could not connect to the server. Try checking your connection configurations.</red>"
             )
             raise typer.Exit(ERROR_RETURN_CODE)
 
+    def _upload_path(self, path: Path) -> bool:
+        if path.suffix == ".zip":
+            return self._upload_zipped(path)
+        if path.is_dir() and is_uploadable_dir(path):
+            return self._upload_entity_dir(path)
+        return self._upload_single(path)
+
+    def upload(self):
+        """Upload the pack / directory / file to the remote Cortex XSOAR instance."""
+        self._verify_connection()
+
         if not self.path or not self.path.exists():
             logger.error(f"<red>input path: {self.path} does not exist</red>")
             raise typer.Exit(ERROR_RETURN_CODE)
@@ -221,15 +255,43 @@ class Uploader:
         )
 
         try:
-            if self.path.suffix == ".zip":
-                success = self._upload_zipped(self.path)
-            elif self.path.is_dir() and is_uploadable_dir(self.path):
-                success = self._upload_entity_dir(self.path)
-            else:
-                success = self._upload_single(self.path)
+            success = self._upload_path(self.path)
+        except KeyboardInterrupt:
+            raise typer.Exit(ABORTED_RETURN_CODE)
+
+        self._summarize(success)
+
+    def upload_multiple(self, paths: Sequence[Path]):
+        """
+        Upload several packs / directories / files to the remote Cortex XSOAR instance, in a pipeline:
+        up to `parallel_uploads` paths are handled at once, so the next packs are dumped and zipped while the
+        previous ones are uploaded.
+        """
+        self._verify_connection()
+
+        if missing_paths := [path for path in paths if not path.exists()]:
+            logger.error(
+                f"<red>input paths: {', '.join(map(str, missing_paths))} do not exist</red>"
+            )
+            raise typer.Exit(ERROR_RETURN_CODE)
+
+        logger.info(
+            f"Uploading {len(paths)} inputs to {self.client.api_client.configuration.host}, "
+            f"{self.parallel_uploads} at a time..."
+        )
+
+        executor = ThreadPoolExecutor(max_workers=self.parallel_uploads)
+        try:
+            success = all(tuple(executor.map(self._upload_path, paths)))
         except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
             raise typer.Exit(ABORTED_RETURN_CODE)
+        executor.shutdown()
 
+        self._summarize(success)
+
+    def _summarize(self, success: bool):
+        merge_markdown_images_shards()
         if self.failed_parsing and not any(
             (
                 self._successfully_uploaded_content_items,
@@ -287,6 +349,17 @@ class Uploader:
         ):
             self._skipped_upload_marketplace_mismatch.append(content_item)
             return True
+        destination_zip_dir = self.destination_zip_dir
+        if (
+            self.parallel_uploads > 1
+            and destination_zip_dir
+            and isinstance(content_item, Pack)
+        ):
+            # packs uploaded at the same time must not overwrite each other's zip
+            destination_zip_dir = Path(destination_zip_dir, content_item.name)
+            destination_zip_dir.mkdir(parents=True, exist_ok=True)
+
+        start_time = time.time()
         try:
             content_item.upload(
                 client=self.client,
@@ -294,7 +367,7 @@ class Uploader:
                 target_demisto_version=Version(str(self.demisto_version)),
                 zip=self.zip,  # only used for Packs
                 tpb=self.tpb,  # only used for Packs
-                destination_zip_dir=self.destination_zip_dir,  # only used for Packs
+                destination_zip_dir=destination_zip_dir,  # only used for Packs
             )
 
             # upon reaching this line, the upload is surely successful
@@ -348,6 +421,10 @@ class Uploader:
             self._failed_upload_content_items.append((content_item, str(e)))
             return False
 
+        finally:
+            if isinstance(content_item, Pack):
+                self._upload_durations[content_item.name] = time.time() - start_time
+
     def _upload_entity_dir(self, path: Path) -> bool:
         """
         Uploads an entity path directory
@@ -520,6 +597,17 @@ class Uploader:
             )
             logger.info(f"<red>FAILED UPLOADS:\n{failed_upload_str}\n</red>")
 
+        if self._upload_durations:
+            durations_str = tabulate(
+                (
+                    (name, f"{duration:.2f}")
+                    for name, duration in sorted(self._upload_durations.items())
+                ),
+                headers=["PACK NAME", "DURATION (SECONDS)"],
+                tablefmt="fancy_grid",
+            )
+            logger.info(f"UPLOAD DURATIONS:\n{durations_str}\n")
+
 
 class ConfigFileParser:
     def __init__(self, path: Path):
@@ -29,6 +29,7 @@ class PacksZipper:
         zip_all: bool,
         marketplace: MarketplaceVersions = MarketplaceVersions.XSOAR,
         quiet_mode: bool = False,
+        incremental: bool = False,
         **kwargs,
     ):
         self.artifacts_manager = PacksManager(
@@ -38,6 +39,7 @@ class PacksZipper:
             all_in_one_zip=zip_all,
             quiet_mode=quiet_mode,
             marketplace=marketplace.value,
+            incremental=incremental,
         )
 
     def zip_packs(self):
@@ -142,11 +144,17 @@ class PacksManager(ArtifactsManager):
 
         """
         reports = []
+        if self.manifest:
+            self.manifest.stash_previous_artifacts()
         # we quiet the outputs and in case we want the output - a summery will be printed
         with QuietModeController(), PacksDirsHandler(self):
             for pack_name in self.pack_names:
-                if pack_name not in IGNORED_PACKS:
+                if pack_name not in IGNORED_PACKS and not self.restore_unchanged_pack(
+                    self.packs[pack_name]
+                ):
                     reports.append(dump_pack(self, self.packs[pack_name]))
+            if self.manifest:
+                self.manifest.save()
 
         if not self.quiet_mode:
             for report in reports:
@@ -30,6 +30,12 @@ def zip_packs(
         False, "-u", "--upload", help="Upload the unified packs to the marketplace."
     ),
     zip_all: bool = typer.Option(False, help="Zip all the packs in one zip file."),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Zip only the packs that changed since the previous run into the same output directory, "
+        "and copy the rest of the packs from the previous run.",
+    ),
     console_log_threshold: str = typer.Option(
         None,
         "--console-log-threshold",
@@ -64,6 +70,7 @@ def zip_packs(
         output=output,
         quiet_mode=zip_all,
         content_version=content_version,
+        incremental=incremental,
     )
     zip_path, unified_pack_names = packs_zipper.zip_packs()
 
@@ -6,7 +6,10 @@ import pytest
 from typer.testing import CliRunner
 
 from demisto_sdk.__main__ import app
-from demisto_sdk.commands.common.constants import SUPPORT_LEVEL_HEADER
+from demisto_sdk.commands.common.constants import (
+    SUPPORT_LEVEL_HEADER,
+    MarketplaceVersions,
+)
 from demisto_sdk.commands.common.tools import get_file
 from TestSuite.pack import Pack
 from TestSuite.test_tools import ChangeCWD
@@ -75,6 +78,68 @@ class TestPrepareContent:
                 "and not a file."
             )
 
+            # Verify that passing several marketplaces without -a raises an exception
+            result = runner.invoke(
+                app,
+                [
+                    PREPARE_CONTENT_CMD,
+                    "-i",
+                    f"{integration.path}",
+                    "-mp",
+                    "xsoar",
+                    "-mp",
+                    "marketplacev2",
+                ],
+                catch_exceptions=True,
+            )
+            assert (
+                result.exception.args[0]
+                == "Several marketplaces can be provided only together with '-a'."
+            )
+
+    def test_prepare_content_all_for_several_marketplaces(self, mocker, tmp_path):
+        """
+        Given
+        - The prepare-content command
+
+        When
+        - Passing the -a parameter and several marketplaces.
+
+        Then
+        - Ensure the content is dumped for all the marketplaces at once, each of them to a directory of its own.
+        """
+        content_dto = mocker.MagicMock()
+        mocker.patch(
+            "demisto_sdk.commands.prepare_content.prepare_content_setup.ContentDTO.from_path",
+            return_value=content_dto,
+        )
+
+        result = CliRunner(mix_stderr=False).invoke(
+            app,
+            [
+                PREPARE_CONTENT_CMD,
+                "-a",
+                "-o",
+                str(tmp_path),
+                "-mp",
+                "xsoar",
+                "-mp",
+                "marketplacev2",
+            ],
+        )
+
+        assert result.exit_code == 0
+        content_dto.dump.assert_not_called()
+        content_dto.dump_marketplaces.assert_called_once_with(
+            {
+                MarketplaceVersions.XSOAR: tmp_path / "xsoar" / "prepare-content-tmp",
+                MarketplaceVersions.MarketplaceV2: tmp_path
+                / "marketplacev2"
+                / "prepare-content-tmp",
+            },
+            use_multiprocessing=True,
+        )
+
 
 class TestPrepareContentIntegration:
     @pytest.mark.parametrize(